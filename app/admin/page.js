@@ -1,6 +1,6 @@
 'use client'
 
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { useRouter } from 'next/navigation'
 import { Button } from '@/components/ui/button'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
@@ -35,6 +35,10 @@ export default function AdminPanel() {
   // Contact states
   const [siteContent, setSiteContent] = useState(null)
   const [contactMessages, setContactMessages] = useState([])
+  // Latest list, read by live feed handlers between renders
+  const messagesRef = useRef([])
+  const contentRef = useRef(null)
+  const [messageStats, setMessageStats] = useState(null)
   const [publications, setPublications] = useState([])
   const [editingSection, setEditingSection] = useState(null)
   const [tempContent, setTempContent] = useState({})
@@ -60,6 +64,48 @@ export default function AdminPanel() {
     }
   }, [])
 
+  useEffect(() => {
+    contentRef.current = siteContent
+  }, [siteContent])
+
+  // Live feed: new messages, read states and publication changes arrive as deltas
+  useEffect(() => {
+    const token = localStorage.getItem('admin_token')
+    if (!isAuthenticated || !token || token.startsWith('client_auth_')) return
+
+    // The feed authenticates with a cookie set by the ticket request, never with
+    // the token in the URL
+    let source = null
+    let cancelled = false
+    fetch('/api/admin/events/ticket', { method: 'POST', headers: { Authorization: `Bearer ${token}` } })
+      .then((response) => {
+        if (response.ok && !cancelled) source = openLiveFeed()
+      })
+      .catch((error) => console.error('Live feed unavailable:', error))
+
+    return () => {
+      cancelled = true
+      source?.close()
+    }
+  }, [isAuthenticated])
+
+  const openLiveFeed = () => {
+    const source = new EventSource('/api/admin/events')
+    const handle = (type) => (event) => applyLiveEvent(type, JSON.parse(event.data))
+    for (const type of ['message.created', 'message.updated', 'message.deleted',
+      'publication.created', 'publication.updated', 'publication.deleted']) {
+      source.addEventListener(type, handle(type))
+    }
+    // Another admin saved the content: reload it unless we already have that version
+    source.addEventListener('content.updated', (event) => {
+      const { version } = JSON.parse(event.data)
+      if (version > (contentRef.current?.version || 0)) loadSiteContent()
+    })
+    // The server lost track of what we missed: reload everything once
+    source.addEventListener('resync', () => loadDashboard())
+    return source
+  }
+
   const verifyToken = async (token) => {
     try {
       // Check if it's a client-side auth token
@@ -74,16 +120,14 @@ export default function AdminPanel() {
         }
       }
       
-      // Try API verification
-      const response = await fetch('/api/admin/verify', {
+      // Verify the token and load the whole dashboard in one round trip
+      const response = await fetch('/api/admin/bootstrap', {
         headers: { Authorization: `Bearer ${token}` }
       })
       
       if (response.ok) {
+        applyBootstrap(await response.json())
         setIsAuthenticated(true)
-        loadSiteContent()
-        loadContactMessages()
-        loadPublications()
       } else {
         localStorage.removeItem('admin_token')
         localStorage.removeItem('admin_user')
@@ -136,9 +180,7 @@ export default function AdminPanel() {
       if (response.ok) {
         localStorage.setItem('admin_token', data.token)
         setIsAuthenticated(true)
-        loadSiteContent()
-        loadContactMessages()
-        loadPublications()
+        loadDashboard()
       } else {
         setLoginError('Identifiants incorrects')
       }
@@ -159,12 +201,82 @@ export default function AdminPanel() {
   }
 
   const handleLogout = () => {
+    const token = localStorage.getItem('admin_token')
+    if (token && !token.startsWith('client_auth_')) {
+      fetch('/api/admin/events/ticket', { method: 'DELETE', headers: { Authorization: `Bearer ${token}` } })
+        .catch(() => {})
+    }
     localStorage.removeItem('admin_token')
     localStorage.removeItem('admin_user')
     setIsAuthenticated(false)
     router.push('/admin')
   }
 
+  const setMessages = (messages) => {
+    messagesRef.current = messages
+    setContactMessages(messages)
+  }
+
+  // Applies a message or publication delta; safe to receive twice (local update, then live feed)
+  const applyLiveEvent = (type, data) => {
+    if (type.startsWith('publication.')) {
+      setPublications(list => {
+        const others = list.filter(p => p._id !== data._id)
+        if (type === 'publication.deleted') return others
+        // A changed body is dropped here and refetched by withContent when needed
+        const { ts, contentChanged, ...publication } = data
+        const existing = list.find(p => p._id === data._id)
+        return existing
+          ? list.map(p => (p._id === data._id ? { ...p, ...publication, ...(contentChanged && { content: undefined }) } : p))
+          : [publication, ...others]
+      })
+      return
+    }
+
+    const current = messagesRef.current
+    const existing = current.find(m => m._id === data._id)
+    const { ts, ...fields } = data
+
+    if (type === 'message.created' && !existing) {
+      setMessages([fields, ...current].slice(0, 100))
+      setMessageStats(stats => stats && { total: stats.total + 1, unread: stats.unread + 1 })
+    } else if (type === 'message.updated' && existing) {
+      setMessages(current.map(m => (m._id === data._id ? { ...m, ...fields } : m)))
+      if (!existing.read && fields.read) {
+        setMessageStats(stats => stats && { ...stats, unread: Math.max(0, stats.unread - 1) })
+      }
+    } else if (type === 'message.deleted' && existing) {
+      setMessages(current.filter(m => m._id !== data._id))
+      setMessageStats(stats => stats && {
+        total: Math.max(0, stats.total - 1),
+        unread: Math.max(0, stats.unread - (existing.read ? 0 : 1))
+      })
+    }
+  }
+
+  const applyBootstrap = (data) => {
+    setSiteContent(data.content)
+    setMessages(data.messages.items)
+    setMessageStats({ total: data.messages.total, unread: data.messages.unread })
+    setPublications(data.publications.items || [])
+  }
+
+  const loadDashboard = async () => {
+    try {
+      const token = localStorage.getItem('admin_token')
+      const response = await fetch('/api/admin/bootstrap', {
+        headers: { Authorization: `Bearer ${token}` }
+      })
+      if (!response.ok) throw new Error(`Bootstrap failed: ${response.status}`)
+      applyBootstrap(await response.json())
+    } catch (error) {
+      console.error('Failed to load dashboard:', error)
+      loadSiteContent()
+      loadContactMessages()
+      loadPublications()
+    }
+  }
+
   const loadSiteContent = async () => {
     try {
       const response = await fetch('/api/content')
@@ -172,11 +284,6 @@ export default function AdminPanel() {
       setSiteContent(data)
     } catch (error) {
       console.error('Failed to load content:', error)
-      // Load from localStorage if API fails
-      const savedContent = localStorage.getItem('site_content')
-      if (savedContent) {
-        setSiteContent(JSON.parse(savedContent))
-      }
     }
   }
 
@@ -187,15 +294,15 @@ export default function AdminPanel() {
         headers: { Authorization: `Bearer ${token}` }
       })
       const data = await response.json()
-      setContactMessages(data)
+      setMessages(data)
     } catch (error) {
       console.error('Failed to load messages:', error)
       // Load from localStorage if API fails
       const savedMessages = localStorage.getItem('contact_messages')
       if (savedMessages) {
-        setContactMessages(JSON.parse(savedMessages))
+        setMessages(JSON.parse(savedMessages))
       } else {
-        setContactMessages([])
+        setMessages([])
       }
     }
   }
@@ -214,38 +321,78 @@ export default function AdminPanel() {
     }
   }
 
+  // JSON-patch operations turning `before` into `after` (arrays compared index by index)
+  const diffContent = (before, after, path) => {
+    if (JSON.stringify(before) === JSON.stringify(after)) return []
+    const sameShape = before && after && typeof before === 'object' && typeof after === 'object' &&
+      Array.isArray(before) === Array.isArray(after)
+    if (!sameShape) return [{ op: 'replace', path, value: after }]
+
+    const ops = []
+    if (Array.isArray(after)) {
+      const common = Math.min(before.length, after.length)
+      for (let i = 0; i < common; i++) ops.push(...diffContent(before[i], after[i], `${path}/${i}`))
+      for (let i = common; i < after.length; i++) ops.push({ op: 'add', path: `${path}/-`, value: after[i] })
+      for (let i = before.length - 1; i >= common; i--) ops.push({ op: 'remove', path: `${path}/${i}` })
+      return ops
+    }
+
+    const pointer = (key) => `${path}/${key.replace(/~/g, '~0').replace(/\//g, '~1')}`
+    for (const key of Object.keys(after)) {
+      if (!(key in before)) ops.push({ op: 'add', path: pointer(key), value: after[key] })
+      else ops.push(...diffContent(before[key], after[key], pointer(key)))
+    }
+    for (const key of Object.keys(before)) {
+      if (!(key in after)) ops.push({ op: 'remove', path: pointer(key) })
+    }
+    return ops
+  }
+
   const updateContent = async (type, data) => {
+    const showStatus = (status, delay = 2000) => {
+      setSaveStatus(status)
+      setTimeout(() => setSaveStatus(''), delay)
+    }
+
     try {
-      // Save to localStorage immediately
-      const updatedContent = { ...siteContent, [type]: data }
-      setSiteContent(updatedContent)
-      localStorage.setItem('site_content', JSON.stringify(updatedContent))
+      const token = localStorage.getItem('admin_token')
+      const previous = siteContent
+      const ops = previous[type] === undefined
+        ? [{ op: 'add', path: `/${type}`, value: data }]
+        : diffContent(previous[type], data, `/${type}`)
+      setSiteContent({ ...previous, [type]: data })
+      setEditingSection(null)
 
-      setSaveStatus('Sauvegardé!')
-      setTimeout(() => setSaveStatus(''), 2000)
+      if (ops.length === 0 || token.startsWith('client_auth_')) {
+        showStatus('Sauvegardé!')
+        return
+      }
 
-      // Try to save to API if available
-      const token = localStorage.getItem('admin_token')
-      if (!token.startsWith('client_auth_')) {
-        const response = await fetch('/api/admin/content', {
-          method: 'PUT',
-          headers: {
-            'Content-Type': 'application/json',
-            Authorization: `Bearer ${token}`
-          },
-          body: JSON.stringify({ type, data })
-        })
-        
-        if (response.ok) {
-          loadSiteContent()
-        }
+      // Only the changed fields are sent, against the version this page was loaded with
+      const response = await fetch('/api/admin/content', {
+        method: 'PATCH',
+        headers: {
+          'Content-Type': 'application/json',
+          Authorization: `Bearer ${token}`
+        },
+        body: JSON.stringify({ version: previous.version || 0, ops })
+      })
+      const result = await response.json()
+
+      if (response.ok) {
+        setSiteContent(content => ({ ...content, version: result.version }))
+        showStatus('Sauvegardé!')
+      } else if (response.status === 409) {
+        // Someone else saved first: show their version instead of overwriting it
+        loadSiteContent()
+        showStatus('Contenu modifié par un autre administrateur, rechargé. Refaites votre modification.', 4000)
+      } else {
+        setSiteContent(previous)
+        showStatus(`Erreur: ${result.error || 'Sauvegarde échouée'}`, 3000)
       }
-      
-      setEditingSection(null)
     } catch (error) {
       console.error('Failed to update content:', error)
-      setSaveStatus('Erreur de sauvegarde')
-      setTimeout(() => setSaveStatus(''), 2000)
+      showStatus('Erreur de sauvegarde')
     }
   }
 
@@ -313,7 +460,7 @@ export default function AdminPanel() {
   const markAsRead = async (messageId) => {
     try {
       const token = localStorage.getItem('admin_token')
-      await fetch('/api/admin/messages/read', {
+      const response = await fetch('/api/admin/messages/read', {
         method: 'PUT',
         headers: {
           'Content-Type': 'application/json',
@@ -322,7 +469,7 @@ export default function AdminPanel() {
         body: JSON.stringify({ messageId })
       })
       
-      loadContactMessages()
+      if (response.ok) applyLiveEvent('message.updated', { _id: messageId, read: true })
     } catch (error) {
       console.error('Failed to mark as read:', error)
     }
@@ -333,12 +480,12 @@ export default function AdminPanel() {
     
     try {
       const token = localStorage.getItem('admin_token')
-      await fetch(`/api/admin/messages/${messageId}`, {
+      const response = await fetch(`/api/admin/messages/${messageId}`, {
         method: 'DELETE',
         headers: { Authorization: `Bearer ${token}` }
       })
       
-      loadContactMessages()
+      if (response.ok) applyLiveEvent('message.deleted', { _id: messageId })
     } catch (error) {
       console.error('Failed to delete message:', error)
     }
@@ -388,7 +535,20 @@ export default function AdminPanel() {
     }
   }
 
-  const handleEditPublication = (publication) => {
+  // Live feed deltas carry no body: fetch it before editing or re-saving
+  const withContent = async (publication) => {
+    if (publication.content !== undefined) return publication
+    const token = localStorage.getItem('admin_token')
+    const response = await fetch(`/api/admin/publications/${publication.id}`, {
+      headers: { 'Authorization': `Bearer ${token}` }
+    })
+    return response.ok ? response.json() : null
+  }
+
+  const handleEditPublication = async (summary) => {
+    const publication = await withContent(summary)
+    if (!publication) return
+
     setEditingPublication(publication)
     setPublicationForm({
       title: publication.title,
@@ -421,10 +581,12 @@ export default function AdminPanel() {
     }
   }
 
-  const togglePublicationStatus = async (publication) => {
-    const newStatus = publication.status === 'published' ? 'draft' : 'published'
+  const togglePublicationStatus = async (summary) => {
+    const newStatus = summary.status === 'published' ? 'draft' : 'published'
     
     try {
+      const publication = await withContent(summary)
+      if (!publication) return
       const token = localStorage.getItem('admin_token')
       const response = await fetch(`/api/admin/publications/${publication.id}`, {
         method: 'PUT',
@@ -555,7 +717,7 @@ export default function AdminPanel() {
             </TabsTrigger>
             <TabsTrigger value="messages" className="flex items-center gap-2">
               <MessageSquare className="w-4 h-4" />
-              Messages ({contactMessages && Array.isArray(contactMessages) ? contactMessages.filter(m => !m.read).length : 0})
+              Messages ({messageStats ? messageStats.unread : contactMessages && Array.isArray(contactMessages) ? contactMessages.filter(m => !m.read).length : 0})
             </TabsTrigger>
           </TabsList>
 
@@ -1127,7 +1289,7 @@ export default function AdminPanel() {
                                   <> • Publié le {new Date(publication.publishedAt).toLocaleDateString('fr-FR')}</>
                                 )}
                               </p>
-                              <p className="text-slate-700 line-clamp-3">{publication.content}</p>
+                              <p className="text-slate-700 line-clamp-3">{publication.content ?? publication.excerpt}</p>
                             </div>
                           </div>
                           
@@ -1261,7 +1423,7 @@ export default function AdminPanel() {
               <CardHeader>
                 <CardTitle>Messages de Contact</CardTitle>
                 <CardDescription>
-                  {contactMessages && Array.isArray(contactMessages) ? contactMessages.length : 0} message(s) reçu(s) - {contactMessages && Array.isArray(contactMessages) ? contactMessages.filter(m => !m.read).length : 0} non lu(s)
+                  {messageStats ? messageStats.total : contactMessages && Array.isArray(contactMessages) ? contactMessages.length : 0} message(s) reçu(s) - {messageStats ? messageStats.unread : contactMessages && Array.isArray(contactMessages) ? contactMessages.filter(m => !m.read).length : 0} non lu(s)
                 </CardDescription>
               </CardHeader>
               <CardContent>
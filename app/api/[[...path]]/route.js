@@ -1,26 +1,39 @@
 import { NextResponse } from 'next/server';
-import nodemailer from 'nodemailer';
-import { MongoClient, ObjectId } from 'mongodb';
-import jwt from 'jsonwebtoken';
-import bcrypt from 'bcryptjs';
+import { createHash, randomBytes } from 'crypto';
+import { createReadStream, createWriteStream } from 'fs';
+import { mkdir, readdir, rename, stat, unlink } from 'fs/promises';
+import path from 'path';
+import readline from 'readline';
+import { Readable } from 'stream';
+import { pipeline } from 'stream/promises';
+import { createGunzip, createGzip } from 'zlib';
+import { LruCache } from '@/lib/cache';
+import { connectToDatabase, toObjectId } from '@/lib/db';
+import { closeAllStreams, eventStats, openEventStream, openStreamCount, publishEvent } from '@/lib/events';
+import { watchCollections } from '@/lib/invalidation';
+import { onShutdown } from '@/lib/shutdown';
 
-// MongoDB connection
-let client = null;
-let db = null;
+// Heavy dependencies are loaded on first use to keep worker cold starts short:
+// jsonwebtoken only for admin routes, nodemailer only when Gmail is configured.
+async function loadJwt() {
+  return (await import('jsonwebtoken')).default;
+}
 
-async function connectToDatabase() {
-  if (db) return db;
-  
-  try {
-    client = new MongoClient(process.env.MONGO_URL);
-    await client.connect();
-    db = client.db(process.env.DB_NAME);
-    console.log('Connected to MongoDB');
-    return db;
-  } catch (error) {
-    console.error('MongoDB connection error:', error);
-    throw error;
-  }
+async function loadNodemailer() {
+  return (await import('nodemailer')).default;
+}
+
+// Per-process setup shared by concurrent requests: the first call starts it,
+// the others await the same promise; a failure lets the next call retry
+function once(task) {
+  let promise = null;
+  return (...args) => {
+    promise ??= task(...args).catch(error => {
+      promise = null;
+      throw error;
+    });
+    return promise;
+  };
 }
 
 // Security utilities
@@ -47,9 +60,159 @@ function validateInput(str, maxLength = 500) {
   return cleaned.length > 0;
 }
 
+// Shared schema validation (field -> maxLength or allowed values)
+const PUBLICATION_SCHEMA = {
+  title: { maxLength: 200, error: 'Le titre est requis et doit contenir moins de 200 caractères' },
+  content: { maxLength: 5000, error: 'Le contenu est requis et doit contenir moins de 5000 caractères' },
+  author: { maxLength: 100, error: 'L\'auteur est requis et doit contenir moins de 100 caractères' },
+  status: { oneOf: ['draft', 'published'], optional: true, error: 'Le statut doit être "draft" ou "published"' }
+};
+
+const CONTACT_SCHEMA = {
+  name: { maxLength: 100, error: 'Le nom est requis et doit contenir moins de 100 caractères' },
+  email: { maxLength: 254, email: true, error: 'Une adresse email valide est requise' },
+  message: { maxLength: 2000, error: 'Le message est requis et doit contenir moins de 2000 caractères' },
+  subject: { maxLength: 200, optional: true, error: 'Le sujet doit contenir moins de 200 caractères' }
+};
+
+// Returns the error message of the first invalid field, or null
+function validateSchema(body, schema) {
+  if (!body || typeof body !== 'object' || Array.isArray(body)) {
+    return 'Corps de requête invalide';
+  }
+
+  for (const [field, rule] of Object.entries(schema)) {
+    const value = body[field];
+    if (rule.optional && !value) continue;
+
+    if (rule.oneOf ? !rule.oneOf.includes(value) : !validateInput(value, rule.maxLength)) {
+      return rule.error;
+    }
+    if (rule.email && !validateEmail(value)) {
+      return rule.error;
+    }
+  }
+
+  return null;
+}
+
+// Request body limits, checked against Content-Length and while reading the stream
+const KB = 1024;
+const BODY_LIMITS = {
+  small: 4 * KB,
+  contact: 16 * KB,
+  publication: 64 * KB,
+  content: 256 * KB
+};
+const BODY_READ_TIMEOUT = parseInt(process.env.BODY_READ_TIMEOUT_MS || '10000', 10);
+
+class RequestBodyError extends Error {
+  constructor(status, message) {
+    super(message);
+    this.status = status;
+  }
+}
+
+async function readJsonBody(request, limit) {
+  const declared = request.headers.get('content-length');
+  if (declared !== null && Number(declared) > limit) {
+    throw new RequestBodyError(413, 'Requête trop volumineuse');
+  }
+  if (!request.body) {
+    throw new RequestBodyError(400, 'Corps de requête manquant');
+  }
+
+  const reader = request.body.getReader();
+  const chunks = [];
+  let received = 0;
+  let timer;
+  const deadline = new Promise((_, reject) => {
+    timer = setTimeout(() => reject(new RequestBodyError(408, 'Délai de réception dépassé')), BODY_READ_TIMEOUT);
+  });
+
+  try {
+    while (true) {
+      const { done, value } = await Promise.race([reader.read(), deadline]);
+      if (done) break;
+
+      received += value.byteLength;
+      if (received > limit) {
+        throw new RequestBodyError(413, 'Requête trop volumineuse');
+      }
+      chunks.push(value);
+    }
+  } catch (error) {
+    reader.cancel().catch(() => {});
+    throw error;
+  } finally {
+    clearTimeout(timer);
+  }
+
+  try {
+    return JSON.parse(Buffer.concat(chunks).toString('utf8'));
+  } catch (error) {
+    throw new RequestBodyError(400, 'JSON invalide');
+  }
+}
+
+function bodyErrorResponse(error) {
+  return NextResponse.json({ error: error.message }, { status: error.status });
+}
+
+// Pagination helper: positive integer capped at maxSize, defaultSize otherwise
+function parsePageSize(value, defaultSize, maxSize = 500) {
+  const size = parseInt(value, 10);
+  if (!Number.isFinite(size) || size < 1) return defaultSize;
+  return Math.min(size, maxSize);
+}
+
+// Publication summaries, computed once at write time so listings never ship full content
+const EXCERPT_LENGTH = 200;
+const WORDS_PER_MINUTE = 200;
+
+function buildPublicationSummary(content) {
+  const text = content.replace(/\s+/g, ' ').trim();
+  let excerpt = text;
+
+  if (text.length > EXCERPT_LENGTH) {
+    const cut = text.slice(0, EXCERPT_LENGTH);
+    const lastSpace = cut.lastIndexOf(' ');
+    excerpt = `${(lastSpace > EXCERPT_LENGTH / 2 ? cut.slice(0, lastSpace) : cut).trimEnd()}…`;
+  }
+
+  const words = text ? text.split(' ').length : 0;
+
+  return {
+    excerpt: sanitizeHtml(excerpt),
+    readingTime: Math.max(1, Math.ceil(words / WORDS_PER_MINUTE))
+  };
+}
+
+const PUBLICATION_SUMMARY_PROJECTION = {
+  _id: 0,
+  id: 1,
+  title: 1,
+  excerpt: 1,
+  readingTime: 1,
+  author: 1,
+  status: 1,
+  publishedAt: 1,
+  views: 1
+};
+
+// The dashboard keys its list on _id and shows the admin dates as well
+const ADMIN_PUBLICATION_SUMMARY_PROJECTION = {
+  ...PUBLICATION_SUMMARY_PROJECTION,
+  _id: 1,
+  createdAt: 1,
+  updatedAt: 1
+};
+
 // JWT utilities
-function verifyToken(token) {
+async function verifyToken(token) {
+  if (!token) return null;
   try {
+    const jwt = await loadJwt();
     return jwt.verify(token, process.env.JWT_SECRET);
   } catch (error) {
     return null;
@@ -81,89 +244,951 @@ function isRateLimited(ip) {
   return record.count > RATE_LIMIT_MAX_REQUESTS;
 }
 
-// Initialize default content
-async function initializeDefaultContent() {
+// Test-mode rate limit isolation (only when the server runs with TEST_MODE=true)
+const TEST_MODE = process.env.TEST_MODE === 'true';
+const TEST_RUN_ID_REGEX = /^[A-Za-z0-9_-]{1,64}$/;
+
+async function getRateLimitKey(request, ip) {
+  if (!TEST_MODE) return ip;
+
+  const testRunId = request.headers.get('x-test-run-id');
+  if (!testRunId || !TEST_RUN_ID_REGEX.test(testRunId)) return ip;
+
+  const token = request.headers.get('authorization')?.replace('Bearer ', '');
+  if (!(await verifyToken(token))) return ip;
+
+  return `test:${testRunId}:${ip}`;
+}
+
+function resetRateLimits(namespace) {
+  let removed = 0;
+  const prefix = namespace ? `test:${namespace}:` : 'test:';
+
+  for (const key of rateLimitStore.keys()) {
+    if (key.startsWith(prefix)) {
+      rateLimitStore.delete(key);
+      removed++;
+    }
+  }
+
+  // Duplicate digests of a test namespace share its prefix
+  for (const key of contactDigests.keys()) {
+    if (key.startsWith(prefix)) contactDigests.delete(key);
+  }
+
+  return removed;
+}
+
+// Initialize default content (checked once per site and process)
+const defaultContentReady = new Set();
+
+async function initializeDefaultContent(siteId) {
+  if (defaultContentReady.has(siteId)) return;
+
   try {
     const database = await connectToDatabase();
-    const content = await database.collection('site_content').findOne({ type: 'main' });
-    
-    if (!content) {
-      const defaultContent = {
-        type: 'main',
-        hero: {
-          title: "Créez votre",
-          subtitle: "présence en ligne",
-          description: "Expert en conception, déploiement et refonte de sites web pour particuliers et professionnels. Transformez vos idées en réalité digitale.",
-          image: "https://images.unsplash.com/photo-1488590528505-98d2b5aba04b",
-          stats: [
-            { number: "50+", label: "Sites créés" },
-            { number: "100%", label: "Satisfaction client" },
-            { number: "24h", label: "Support" }
-          ]
+    const defaultContent = {
+      hero: {
+        title: "Créez votre",
+        subtitle: "présence en ligne",
+        description: "Expert en conception, déploiement et refonte de sites web pour particuliers et professionnels. Transformez vos idées en réalité digitale.",
+        image: "https://images.unsplash.com/photo-1488590528505-98d2b5aba04b",
+        stats: [
+          { number: "50+", label: "Sites créés" },
+          { number: "100%", label: "Satisfaction client" },
+          { number: "24h", label: "Support" }
+        ]
+      },
+      services: [
+        {
+          id: "conception",
+          icon: "Code2",
+          title: "Conception Web",
+          description: "Création sur mesure de sites web modernes et performants, adaptés à vos besoins et votre identité visuelle.",
+          features: ["Design responsive", "UX/UI optimisée", "Technologies modernes"]
         },
-        services: [
-          {
-            id: "conception",
-            icon: "Code2",
-            title: "Conception Web",
-            description: "Création sur mesure de sites web modernes et performants, adaptés à vos besoins et votre identité visuelle.",
-            features: ["Design responsive", "UX/UI optimisée", "Technologies modernes"]
-          },
-          {
-            id: "deploiement",
-            icon: "Rocket",
-            title: "Déploiement",
-            description: "Mise en ligne professionnelle avec hébergement sécurisé, nom de domaine et optimisation des performances.",
-            features: ["Hébergement sécurisé", "Configuration SSL", "Optimisation SEO"]
-          },
-          {
-            id: "refonte",
-            icon: "RefreshCw",
-            title: "Refonte",
-            description: "Modernisation de votre site existant pour améliorer les performances, le design et l'expérience utilisateur.",
-            features: ["Audit complet", "Amélioration design", "Optimisation technique"]
-          }
-        ],
-        portfolio: [
-          {
-            id: "ecommerce",
-            title: "Site E-commerce",
-            category: "Conception",
-            description: "Boutique en ligne complète avec paiement sécurisé",
-            image: "https://images.unsplash.com/photo-1591439657848-9f4b9ce436b9"
-          },
-          {
-            id: "portfolio-pro",
-            title: "Portfolio Professionnel",
-            category: "Refonte",
-            description: "Refonte complète d'un portfolio d'architecte",
-            image: "https://images.unsplash.com/photo-1544717297-fa95b6ee9643"
-          },
-          {
-            id: "app-web",
-            title: "Application Web",
-            category: "Déploiement",
-            description: "Déploiement d'une application de gestion",
-            image: "https://images.unsplash.com/photo-1613203713329-b2e39e14c266"
-          }
-        ],
-        contact: {
-          email: "contact@getyoursite.com",
-          phone: "+33 (0)1 23 45 67 89",
-          location: "France"
+        {
+          id: "deploiement",
+          icon: "Rocket",
+          title: "Déploiement",
+          description: "Mise en ligne professionnelle avec hébergement sécurisé, nom de domaine et optimisation des performances.",
+          features: ["Hébergement sécurisé", "Configuration SSL", "Optimisation SEO"]
         },
-        createdAt: new Date(),
-        updatedAt: new Date()
-      };
-      
-      await database.collection('site_content').insertOne(defaultContent);
-      console.log('Default content initialized');
-    }
+        {
+          id: "refonte",
+          icon: "RefreshCw",
+          title: "Refonte",
+          description: "Modernisation de votre site existant pour améliorer les performances, le design et l'expérience utilisateur.",
+          features: ["Audit complet", "Amélioration design", "Optimisation technique"]
+        }
+      ],
+      portfolio: [
+        {
+          id: "ecommerce",
+          title: "Site E-commerce",
+          category: "Conception",
+          description: "Boutique en ligne complète avec paiement sécurisé",
+          image: "https://images.unsplash.com/photo-1591439657848-9f4b9ce436b9"
+        },
+        {
+          id: "portfolio-pro",
+          title: "Portfolio Professionnel",
+          category: "Refonte",
+          description: "Refonte complète d'un portfolio d'architecte",
+          image: "https://images.unsplash.com/photo-1544717297-fa95b6ee9643"
+        },
+        {
+          id: "app-web",
+          title: "Application Web",
+          category: "Déploiement",
+          description: "Déploiement d'une application de gestion",
+          image: "https://images.unsplash.com/photo-1613203713329-b2e39e14c266"
+        }
+      ],
+      contact: {
+        email: "contact@getyoursite.com",
+        phone: "+33 (0)1 23 45 67 89",
+        location: "France"
+      },
+      createdAt: new Date(),
+      updatedAt: new Date()
+    };
+
+    // Upsert so concurrent first requests of a new site seed it only once
+    const { upsertedCount } = await database.collection('site_content').updateOne(
+      { siteId, type: 'main' },
+      { $setOnInsert: defaultContent },
+      { upsert: true }
+    );
+    if (upsertedCount) console.log(`Default content initialized for site ${siteId}`);
+    defaultContentReady.add(siteId);
   } catch (error) {
     console.error('Error initializing content:', error);
   }
 }
 
+// Sites: one deployment serves many client sites. The Host header selects the
+// site; hosts missing from the registry get the default site.
+const DEFAULT_SITE_ID = 'default';
+const SITE_ID_REGEX = /^[a-z0-9][a-z0-9-]{0,62}$/;
+const HOSTNAME_REGEX = /^(?=.{1,253}$)[a-z0-9]([a-z0-9-]*[a-z0-9])?(\.[a-z0-9]([a-z0-9-]*[a-z0-9])?)*$/;
+const SITE_HOST_CACHE_TTL = parseInt(process.env.SITE_HOST_CACHE_TTL_MS || '60000', 10);
+const CONTENT_CACHE_MAX_SITES = parseInt(process.env.CONTENT_CACHE_MAX_SITES || '1000', 10);
+// Until the invalidation stream is live, cached content expires after this TTL
+const CACHE_FALLBACK_TTL = parseInt(process.env.CACHE_FALLBACK_TTL_MS || '5000', 10);
+// Backstop while it is live, in case an invalidation is ever missed
+const CACHE_CONNECTED_TTL = parseInt(process.env.CACHE_CONNECTED_TTL_MS || '300000', 10);
+// Unknown hosts are cached too, so the bound also covers spoofed Host headers
+const siteHosts = new LruCache({ max: 10000, ttl: SITE_HOST_CACHE_TTL });
+const contentCache = new LruCache({ max: CONTENT_CACHE_MAX_SITES, ttl: CACHE_FALLBACK_TTL });
+// Public list of published publications, per site
+const publicationsCache = new LruCache({ max: CONTENT_CACHE_MAX_SITES, ttl: CACHE_FALLBACK_TTL });
+let stopInvalidation = null;
+
+function setInvalidationConnected(connected, error) {
+  if (connected === metrics.invalidation.connected) return;
+  metrics.invalidation.connected = connected;
+  if (!connected) {
+    metrics.invalidation.disconnects++;
+    console.warn('Cache invalidation stream down, falling back to TTL expiry:', error?.message || 'closed');
+  }
+
+  // Whatever was cached while the stream was down may have missed changes
+  contentCache.clear();
+  publicationsCache.clear();
+  siteHosts.clear();
+  contentCache.ttl = connected ? CACHE_CONNECTED_TTL : CACHE_FALLBACK_TTL;
+  publicationsCache.ttl = connected ? CACHE_CONNECTED_TTL : CACHE_FALLBACK_TTL;
+}
+
+function handleCacheChange(event) {
+  metrics.invalidation.events++;
+  if (event.wallTime) metrics.invalidation.lastLagMs = Date.now() - event.wallTime.getTime();
+  const siteId = event.fullDocument?.siteId;
+
+  switch (event.ns?.coll) {
+    case 'sites':
+      siteHosts.clear();
+      break;
+    case 'site_content':
+      if (siteId) contentCache.delete(siteId);
+      else contentCache.clear();
+      if (siteId && event.fullDocument.type === 'main') {
+        publishEvent(siteId, 'content.updated', { version: event.fullDocument.version || 0 }, event.wallTime?.getTime());
+      }
+      break;
+    case 'publications':
+      publishChange('publication', event);
+      if (siteId) publicationsCache.delete(siteId);
+      else publicationsCache.clear();
+      break;
+    case 'contact_submissions':
+      publishChange('message', event);
+      return;
+    default:
+      return;
+  }
+  metrics.invalidation.evictions++;
+}
+
+// Admin live feed (lib/events.js). The change stream is the single source, so
+// dashboards see writes from every worker; while it is down each worker
+// publishes its own writes instead.
+const SSE_MAX_CONNECTIONS = parseInt(process.env.SSE_MAX_CONNECTIONS || '2000', 10);
+// EventSource cannot send headers: the browser gets a stream-only ticket in an
+// HttpOnly cookie scoped to the feed, so the admin JWT never appears in a URL
+// (access logs, history). Signed with a derived secret, a ticket is not an
+// admin token anywhere else.
+const EVENTS_COOKIE = 'gys_events';
+const EVENTS_PATH = '/api/admin/events';
+
+function eventsSecret() {
+  return `${process.env.JWT_SECRET}:events`;
+}
+
+async function issueEventsTicket(decoded) {
+  const jwt = await loadJwt();
+  // Same lifetime as the admin session it comes from
+  return jwt.sign({ username: decoded.username, purpose: 'events', exp: decoded.exp }, eventsSecret());
+}
+
+async function verifyEventsTicket(request) {
+  const ticket = request.cookies.get(EVENTS_COOKIE)?.value;
+  if (!ticket) return null;
+  try {
+    const jwt = await loadJwt();
+    const decoded = jwt.verify(ticket, eventsSecret());
+    return decoded.purpose === 'events' ? decoded : null;
+  } catch (error) {
+    return null;
+  }
+}
+
+function feedDocument({ ip, ...doc }) {
+  return { ...doc, _id: String(doc._id) };
+}
+
+// Publications travel as deltas: identity, status and the changed summary
+// fields, never the body; `contentChanged` tells the dashboard to refetch it
+const PUBLICATION_FEED_FIELDS = ['title', 'excerpt', 'readingTime', 'author', 'status', 'createdAt', 'updatedAt', 'publishedAt'];
+
+function publicationDelta(doc, changedFields = null) {
+  const delta = { _id: String(doc._id), id: doc.id, title: doc.title, status: doc.status };
+  for (const field of PUBLICATION_FEED_FIELDS) {
+    if (doc[field] !== undefined && (!changedFields || changedFields.includes(field))) delta[field] = doc[field];
+  }
+  if (changedFields?.includes('content')) delta.contentChanged = true;
+  return delta;
+}
+
+// Delete events carry only the _id: the site comes from the documents this
+// worker saw created or updated, or from its own admin deletes. Unknown ids
+// (TTL expiry, archiving, documents older than the worker) are not published,
+// so a delete never reaches another site's dashboard.
+const DOCUMENT_SITES_MAX = parseInt(process.env.DOCUMENT_SITES_MAX || '10000', 10);
+const documentSites = new LruCache({ max: DOCUMENT_SITES_MAX });
+
+function publishChange(kind, event) {
+  const ts = event.wallTime?.getTime();
+  if (event.operationType === 'delete') {
+    const id = String(event.documentKey._id);
+    const siteId = documentSites.get(id);
+    if (siteId) {
+      documentSites.delete(id);
+      publishEvent(siteId, `${kind}.deleted`, { _id: id }, ts);
+    }
+    return;
+  }
+
+  const doc = event.fullDocument;
+  if (!doc) return; // deleted before the lookup, its delete event follows
+  documentSites.set(String(doc._id), doc.siteId);
+  if (kind === 'message' && event.operationType === 'update') {
+    const { read, readAt, spam } = doc;
+    publishEvent(doc.siteId, 'message.updated', { _id: String(doc._id), read, readAt, spam }, ts);
+  } else if (kind === 'publication') {
+    const changed = event.operationType === 'update'
+      ? Object.keys(event.updateDescription?.updatedFields || {}).map(field => field.split('.')[0])
+      : null;
+    publishEvent(doc.siteId, `publication.${event.operationType === 'insert' ? 'created' : 'updated'}`, publicationDelta(doc, changed), ts);
+  } else {
+    publishEvent(doc.siteId, `${kind}.${event.operationType === 'insert' ? 'created' : 'updated'}`, feedDocument(doc), ts);
+  }
+}
+
+function publishLocalEvent(siteId, type, data) {
+  if (!metrics.invalidation.connected) publishEvent(siteId, type, data);
+}
+
+onShutdown('admin-events', closeAllStreams);
+
+function startCacheInvalidation(database) {
+  if (stopInvalidation) return;
+  stopInvalidation = watchCollections(database, {
+    collections: ['sites', 'site_content', 'publications', 'contact_submissions'],
+    // View counters are flushed in bulk every few seconds; they do not invalidate
+    // the lists, and filtering them server-side also skips their document lookups
+    match: { 'updateDescription.updatedFields.views': { $exists: false } },
+    onChange: handleCacheChange,
+    onStatus: ({ connected, error }) => setInvalidationConnected(connected, error)
+  });
+}
+
+onShutdown('cache-invalidation', async () => {
+  await stopInvalidation?.();
+});
+
+// One-off data migrations, recorded in the migrations collection once done so
+// later worker boots (PM2 restarts included) skip their unindexed scans
+async function runMigrationOnce(database, name, migrate) {
+  const migrations = database.collection('migrations');
+  if (await migrations.findOne({ _id: name }, { projection: { _id: 1 } })) return;
+
+  const result = await migrate();
+  await migrations.updateOne({ _id: name }, { $setOnInsert: { doneAt: new Date(), result } }, { upsert: true });
+  console.log(`Migration ${name} done`, result);
+}
+
+const prepareSites = once(async (database) => {
+  startCacheInvalidation(database);
+  await database.collection('sites').createIndex({ hosts: 1 }, { unique: true });
+
+  // Documents from the single-site era belong to the default site
+  await runMigrationOnce(database, 'site-id-backfill', async () => {
+    const legacy = { siteId: { $exists: false } };
+    const results = await Promise.all(['site_content', 'publications', 'contact_submissions'].map(name =>
+      database.collection(name).updateMany(legacy, { $set: { siteId: DEFAULT_SITE_ID } })
+    ));
+    return { modified: results.reduce((total, result) => total + result.modifiedCount, 0) };
+  });
+  await database.collection('site_content').createIndex({ siteId: 1, type: 1 }, { unique: true });
+  // One revision per version
+  await database.collection('content_revisions').createIndex({ siteId: 1, version: -1 }, { unique: true });
+});
+
+function requestHost(request) {
+  const host = request.headers.get('x-forwarded-host') || request.headers.get('host') || '';
+  return host.split(',')[0].trim().toLowerCase().replace(/:\d+$/, '');
+}
+
+async function resolveSiteId(request) {
+  const host = requestHost(request);
+  const cached = siteHosts.get(host);
+  if (cached) return cached;
+
+  const generation = siteHosts.generation(host);
+  const database = await connectToDatabase();
+  await prepareSites(database);
+  const site = await database.collection('sites').findOne({ hosts: host }, { projection: { _id: 1 } });
+  return siteHosts.set(host, site?._id || DEFAULT_SITE_ID, generation);
+}
+
+async function getSiteContent(siteId) {
+  const cached = contentCache.get(siteId);
+  if (cached) return cached;
+
+  // Taken before the read: an invalidation landing during it voids this fill
+  const generation = contentCache.generation(siteId);
+  await initializeDefaultContent(siteId);
+  const database = await connectToDatabase();
+  const content = await database.collection('site_content').findOne({ siteId, type: 'main' });
+  return content ? contentCache.set(siteId, content, generation) : {};
+}
+
+// Returns an error message, or null when the site definition is valid
+function validateSite(body) {
+  if (!body || typeof body !== 'object' || Array.isArray(body)) return 'Corps de requête invalide';
+  if (typeof body.id !== 'string' || !SITE_ID_REGEX.test(body.id)) {
+    return "L'identifiant du site doit contenir uniquement des minuscules, chiffres et tirets (64 caractères max)";
+  }
+  if (body.name !== undefined && !validateInput(body.name, 100)) {
+    return 'Le nom doit contenir moins de 100 caractères';
+  }
+  if (!Array.isArray(body.hosts) || body.hosts.length === 0 || body.hosts.length > 20) {
+    return 'Entre 1 et 20 domaines sont requis';
+  }
+  if (!body.hosts.every(host => typeof host === 'string' && HOSTNAME_REGEX.test(host.toLowerCase()))) {
+    return 'Nom de domaine invalide';
+  }
+  return null;
+}
+
+// Content patches: JSON-patch style operations (add, replace, remove) on the
+// editable sections, applied with optimistic concurrency on a version number.
+// Each version keeps its operations and their inverse in content_revisions,
+// so any earlier version can be restored without storing full snapshots.
+const CONTENT_SECTIONS = ['hero', 'services', 'portfolio', 'contact'];
+const CONTENT_PATCH_OPS = ['add', 'replace', 'remove'];
+const CONTENT_PATCH_MAX_OPS = 200;
+const ARRAY_INDEX_REGEX = /^(0|[1-9][0-9]*)$/;
+const FORBIDDEN_KEYS = ['__proto__', 'constructor', 'prototype'];
+
+function parsePointer(path) {
+  if (typeof path !== 'string' || !path.startsWith('/')) {
+    throw new RequestBodyError(400, `Chemin invalide: ${path}`);
+  }
+  const segments = path.slice(1).split('/').map(segment => segment.replace(/~1/g, '/').replace(/~0/g, '~'));
+  if (!CONTENT_SECTIONS.includes(segments[0]) || segments.some(segment => FORBIDDEN_KEYS.includes(segment))) {
+    throw new RequestBodyError(400, `Chemin invalide: ${path}`);
+  }
+  return segments;
+}
+
+function toPointer(segments) {
+  return '/' + segments.map(segment => String(segment).replace(/~/g, '~0').replace(/\//g, '~1')).join('/');
+}
+
+function arrayIndex(array, segment, path, allowEnd) {
+  const index = ARRAY_INDEX_REGEX.test(segment) ? Number(segment) : -1;
+  if (index < 0 || index > array.length || (index === array.length && !allowEnd)) {
+    throw new RequestBodyError(400, `Index hors limites: ${path}`);
+  }
+  return index;
+}
+
+// Applies one operation to draft in place and returns the operation that undoes it
+function applyPatchOperation(draft, operation) {
+  const { op, path, value } = operation || {};
+  if (!CONTENT_PATCH_OPS.includes(op)) {
+    throw new RequestBodyError(400, `Opération non supportée: ${op}`);
+  }
+  if (op !== 'remove' && value === undefined) {
+    throw new RequestBodyError(400, `Valeur manquante: ${path}`);
+  }
+
+  const segments = parsePointer(path);
+  if (op === 'remove' && segments.length === 1) {
+    throw new RequestBodyError(400, `Une section ne peut pas être supprimée: ${path}`);
+  }
+
+  let parent = draft;
+  for (const segment of segments.slice(0, -1)) {
+    parent = Array.isArray(parent)
+      ? parent[arrayIndex(parent, segment, path, false)]
+      : (Object.hasOwn(parent, segment) ? parent[segment] : undefined);
+    if (parent === null || typeof parent !== 'object') {
+      throw new RequestBodyError(400, `Chemin introuvable: ${path}`);
+    }
+  }
+
+  const key = segments[segments.length - 1];
+  if (Array.isArray(parent)) {
+    if (op === 'add') {
+      const index = key === '-' ? parent.length : arrayIndex(parent, key, path, true);
+      parent.splice(index, 0, value);
+      return { op: 'remove', path: toPointer([...segments.slice(0, -1), index]) };
+    }
+    const index = arrayIndex(parent, key, path, false);
+    if (op === 'replace') {
+      const previous = parent[index];
+      parent[index] = value;
+      return { op: 'replace', path, value: previous };
+    }
+    const [removed] = parent.splice(index, 1);
+    return { op: 'add', path, value: removed };
+  }
+
+  const exists = Object.hasOwn(parent, key);
+  if (op !== 'add' && !exists) {
+    throw new RequestBodyError(400, `Chemin introuvable: ${path}`);
+  }
+  const previous = parent[key];
+  if (op === 'remove') {
+    delete parent[key];
+    return { op: 'add', path, value: previous };
+  }
+  parent[key] = value;
+  return exists ? { op: 'replace', path, value: previous } : { op: 'remove', path };
+}
+
+// Returns { version } on success, { conflict, version } when baseVersion is stale.
+// Without baseVersion the patch applies to whatever version is current.
+async function applyContentPatch(database, siteId, ops, { baseVersion, author, rollbackTo, maxOps = CONTENT_PATCH_MAX_OPS } = {}) {
+  if (!Array.isArray(ops) || ops.length === 0 || ops.length > maxOps) {
+    throw new RequestBodyError(400, `Entre 1 et ${maxOps} opérations sont requises`);
+  }
+
+  await initializeDefaultContent(siteId);
+  const collection = database.collection('site_content');
+  const current = await collection.findOne({ siteId, type: 'main' });
+  const version = current.version || 0;
+  if (baseVersion !== undefined && baseVersion !== version) {
+    return { conflict: true, version };
+  }
+
+  const draft = {};
+  for (const section of CONTENT_SECTIONS) {
+    if (current[section] !== undefined) draft[section] = structuredClone(current[section]);
+  }
+  const inverse = ops.map(operation => applyPatchOperation(draft, operation)).reverse();
+  const touched = [...new Set(ops.map(operation => parsePointer(operation.path)[0]))];
+  const now = new Date();
+
+  // Compare-and-set on the version: of several concurrent editors only one matches
+  const { matchedCount } = await collection.updateOne(
+    // Documents from before versioning have no version field; null matches them
+    { _id: current._id, version: current.version ?? null },
+    { $set: { ...Object.fromEntries(touched.map(section => [section, draft[section]])), version: version + 1, updatedAt: now } }
+  );
+  if (!matchedCount) {
+    const latest = await collection.findOne({ _id: current._id }, { projection: { version: 1 } });
+    return { conflict: true, version: latest?.version || 0 };
+  }
+
+  // Logged once the version is ours, so a failure here never blocks later edits;
+  // the upsert replaces whatever is left at this version by an interrupted write
+  const revision = { siteId, version: version + 1, baseVersion: version, ops, inverse, author, createdAt: now };
+  if (rollbackTo !== undefined) revision.rollbackTo = rollbackTo;
+  try {
+    await database.collection('content_revisions').replaceOne({ siteId, version: version + 1 }, revision, { upsert: true });
+  } catch (error) {
+    // The edit itself is applied; only rolling back across this version is lost
+    console.error(`Content revision ${version + 1} of ${siteId} not logged:`, error);
+  }
+
+  contentCache.delete(siteId);
+  publishLocalEvent(siteId, 'content.updated', { version: version + 1 });
+  return { version: version + 1 };
+}
+
+// Undoes every revision after targetVersion, as a new revision
+async function rollbackContent(database, siteId, targetVersion, author) {
+  await initializeDefaultContent(siteId);
+  const current = await database.collection('site_content').findOne({ siteId, type: 'main' }, { projection: { version: 1 } });
+  const version = current.version || 0;
+  if (!Number.isInteger(targetVersion) || targetVersion < 0 || targetVersion >= version) {
+    throw new RequestBodyError(400, `Version invalide: choisissez une version entre 0 et ${version - 1}`);
+  }
+
+  const revisions = await database.collection('content_revisions')
+    .find({ siteId, version: { $gt: targetVersion, $lte: version } }, { projection: { inverse: 1 } })
+    .sort({ version: -1 })
+    .toArray();
+  if (revisions.length !== version - targetVersion) {
+    throw new RequestBodyError(400, 'Historique incomplet pour cette version');
+  }
+
+  const ops = revisions.flatMap(revision => revision.inverse);
+  return applyContentPatch(database, siteId, ops, {
+    baseVersion: version,
+    author,
+    rollbackTo: targetVersion,
+    maxOps: CONTENT_PATCH_MAX_OPS * 10
+  });
+}
+
+function contentConflictResponse(result) {
+  return NextResponse.json(
+    { error: 'Le contenu a été modifié entre-temps. Rechargez-le avant de réessayer.', version: result.version },
+    { status: 409 }
+  );
+}
+
+// Publications indexes (once per process) and summary backfill (once per database)
+const PUBLICATION_BACKFILL_BATCH = 1000;
+
+const preparePublications = once(async (database) => {
+  const collection = database.collection('publications');
+  await Promise.all([
+    collection.createIndex({ siteId: 1, status: 1, publishedAt: -1 }),
+    collection.createIndex({ siteId: 1, status: 1, views: -1 }),
+    collection.createIndex({ siteId: 1, createdAt: -1 }),
+    collection.createIndex({ id: 1 })
+  ]);
+
+  // Documents written before excerpts existed get theirs computed once,
+  // streamed in batches so a large collection does not spike worker memory
+  await runMigrationOnce(database, 'publication-summary-backfill', async () => {
+    const cursor = collection
+      .find({ excerpt: { $exists: false } }, { projection: { _id: 1, content: 1 } })
+      .batchSize(PUBLICATION_BACKFILL_BATCH);
+
+    let backfilled = 0;
+    let batch = [];
+    const flush = async () => {
+      if (batch.length === 0) return;
+      await collection.bulkWrite(batch, { ordered: false });
+      backfilled += batch.length;
+      batch = [];
+    };
+
+    for await (const doc of cursor) {
+      batch.push({
+        updateOne: {
+          filter: { _id: doc._id },
+          update: { $set: buildPublicationSummary(doc.content || '') }
+        }
+      });
+      if (batch.length >= PUBLICATION_BACKFILL_BATCH) await flush();
+    }
+    await flush();
+    return { backfilled };
+  });
+});
+
+// Runtime metrics (per process, exposed on /api/admin/metrics)
+const metrics = {
+  startedAt: new Date(),
+  views: { events: 0, flushes: 0, writes: 0, failures: 0 },
+  contact: {
+    received: 0,
+    dryRuns: 0,
+    inserted: 0,
+    dropped: { honeypot: 0, duplicate: 0 },
+    smtp: { granted: 0, throttled: 0, sent: 0, failures: 0 }
+  },
+  invalidation: { connected: false, events: 0, evictions: 0, disconnects: 0, lastLagMs: null }
+};
+
+// Publication view counters: increments are aggregated in memory and
+// written behind with one bulkWrite per flush instead of one $inc per view
+const VIEW_FLUSH_INTERVAL = parseInt(process.env.VIEW_FLUSH_INTERVAL_MS || '5000', 10);
+const VIEW_FLUSH_THRESHOLD = parseInt(process.env.VIEW_FLUSH_THRESHOLD || '1000', 10);
+const pendingViews = new Map();
+let pendingViewEvents = 0;
+let viewFlushTimer = null;
+let viewFlushInProgress = null;
+
+function scheduleViewFlush() {
+  if (viewFlushTimer || viewFlushInProgress) return;
+  viewFlushTimer = setTimeout(flushViews, VIEW_FLUSH_INTERVAL);
+  viewFlushTimer.unref?.();
+}
+
+function recordView(publicationId) {
+  pendingViews.set(publicationId, (pendingViews.get(publicationId) || 0) + 1);
+  pendingViewEvents++;
+  metrics.views.events++;
+
+  if (pendingViewEvents >= VIEW_FLUSH_THRESHOLD) {
+    flushViews();
+  } else {
+    scheduleViewFlush();
+  }
+}
+
+async function flushViews() {
+  if (viewFlushTimer) {
+    clearTimeout(viewFlushTimer);
+    viewFlushTimer = null;
+  }
+  // One flush at a time; views recorded meanwhile go into the next one
+  if (viewFlushInProgress) return viewFlushInProgress;
+  if (pendingViews.size === 0) return;
+
+  const batch = [...pendingViews];
+  pendingViews.clear();
+  pendingViewEvents = 0;
+
+  viewFlushInProgress = (async () => {
+    let failed = false;
+    try {
+      const database = await connectToDatabase();
+      await database.collection('publications').bulkWrite(
+        batch.map(([id, count]) => ({
+          updateOne: { filter: { id }, update: { $inc: { views: count } } }
+        })),
+        { ordered: false }
+      );
+      metrics.views.flushes++;
+      metrics.views.writes += batch.length;
+    } catch (error) {
+      // Keep the counts for the next attempt rather than losing them
+      failed = true;
+      metrics.views.failures++;
+      for (const [id, count] of batch) {
+        pendingViews.set(id, (pendingViews.get(id) || 0) + count);
+        pendingViewEvents += count;
+      }
+      console.error('View counter flush error:', error);
+    } finally {
+      viewFlushInProgress = null;
+      if (pendingViews.size > 0) {
+        // After a failure, wait for the timer instead of retrying immediately
+        if (!failed && pendingViewEvents >= VIEW_FLUSH_THRESHOLD) flushViews();
+        else scheduleViewFlush();
+      }
+    }
+  })();
+
+  return viewFlushInProgress;
+}
+
+onShutdown('publication-views', async () => {
+  await viewFlushInProgress;
+  await flushViews();
+});
+
+// Contact load shedding: cheap in-memory filters that run before any
+// database or SMTP work, so a spam wave costs neither inserts nor emails
+const CONTACT_HONEYPOT_FIELD = 'website';
+const CONTACT_DUPLICATE_WINDOW = parseInt(process.env.CONTACT_DUPLICATE_WINDOW_MS || '600000', 10);
+const CONTACT_DUPLICATE_MAX_ENTRIES = 10000;
+// Only texts this long (normalized) count as duplicates across senders: two
+// prospects can send the same short request, a spam template is longer
+const CONTACT_CROSS_SENDER_MIN = parseInt(process.env.CONTACT_CROSS_SENDER_MIN || '400', 10);
+const SMTP_BUCKET_CAPACITY = parseInt(process.env.SMTP_BUCKET_CAPACITY || '10', 10);
+const SMTP_RATE_PER_MINUTE = parseInt(process.env.SMTP_RATE_PER_MINUTE || '20', 10);
+const contactDigests = new Map();
+const smtpBucket = { tokens: SMTP_BUCKET_CAPACITY, refilledAt: Date.now() };
+
+// Near-duplicates differ only by case, accents, punctuation or spacing; digits
+// are kept ("3 pages" and "5 pages" are different requests)
+function normalizeMessage(message) {
+  return message
+    .toLowerCase()
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .replace(/[^a-z0-9]+/g, ' ')
+    .trim();
+}
+
+function contactDigest(namespace, email, message) {
+  const normalized = normalizeMessage(message);
+  const material = normalized.length < CONTACT_CROSS_SENDER_MIN
+    ? `${email.trim().toLowerCase()}\n${normalized}`
+    : normalized;
+  return namespace + createHash('sha1').update(material).digest('base64');
+}
+
+function isDuplicateContact(digest) {
+  const now = Date.now();
+  const expiresAt = contactDigests.get(digest);
+  if (expiresAt && expiresAt > now) return true;
+
+  // Map iteration follows insertion order, so the oldest digests come first
+  contactDigests.delete(digest);
+  for (const [key, expiry] of contactDigests) {
+    if (contactDigests.size < CONTACT_DUPLICATE_MAX_ENTRIES && expiry > now) break;
+    contactDigests.delete(key);
+  }
+  contactDigests.set(digest, now + CONTACT_DUPLICATE_WINDOW);
+  return false;
+}
+
+// Global token bucket shared by every sender: bursts of SMTP_BUCKET_CAPACITY,
+// then SMTP_RATE_PER_MINUTE sends at most
+function takeSmtpToken() {
+  const now = Date.now();
+  const refill = ((now - smtpBucket.refilledAt) / 60000) * SMTP_RATE_PER_MINUTE;
+  smtpBucket.tokens = Math.min(SMTP_BUCKET_CAPACITY, smtpBucket.tokens + refill);
+  smtpBucket.refilledAt = now;
+
+  if (smtpBucket.tokens < 1) return false;
+  smtpBucket.tokens--;
+  return true;
+}
+
+function isSmtpConfigured() {
+  return Boolean(process.env.GMAIL_USER && process.env.GMAIL_APP_PASSWORD && process.env.GMAIL_USER !== 'votre-email@gmail.com');
+}
+
+// One pooled transporter per process instead of a new SMTP connection per message
+let mailTransporter = null;
+
+async function getMailTransporter() {
+  if (!mailTransporter) {
+    const nodemailer = await loadNodemailer();
+    mailTransporter = nodemailer.createTransport({
+      pool: true,
+      maxConnections: 2,
+      host: process.env.SMTP_HOST,
+      port: parseInt(process.env.SMTP_PORT),
+      secure: false,
+      auth: {
+        user: process.env.GMAIL_USER,
+        pass: process.env.GMAIL_APP_PASSWORD,
+      },
+    });
+  }
+  return mailTransporter;
+}
+
+// Contact message retention: TTL expiry for read/spam messages, archival of old ones
+const DAY_MS = 24 * 60 * 60 * 1000;
+const MESSAGE_READ_RETENTION_DAYS = parseInt(process.env.MESSAGE_READ_RETENTION_DAYS || '180', 10);
+const MESSAGE_SPAM_RETENTION_DAYS = parseInt(process.env.MESSAGE_SPAM_RETENTION_DAYS || '7', 10);
+const MESSAGE_ARCHIVE_AFTER_DAYS = parseInt(process.env.MESSAGE_ARCHIVE_AFTER_DAYS || '90', 10);
+const MESSAGE_ARCHIVE_INTERVAL_HOURS = parseInt(process.env.MESSAGE_ARCHIVE_INTERVAL_HOURS || '0', 10);
+// The standalone server chdirs into .next/standalone, which every `next build`
+// wipes: default archives to the project root so they survive rebuilds
+const STANDALONE_DIR = path.join('.next', 'standalone');
+const PROJECT_ROOT = process.cwd().endsWith(path.sep + STANDALONE_DIR)
+  ? process.cwd().slice(0, -(STANDALONE_DIR.length + 1))
+  : process.cwd();
+const MESSAGE_ARCHIVE_DIR = path.resolve(PROJECT_ROOT, process.env.MESSAGE_ARCHIVE_DIR || 'archives');
+const ARCHIVE_FILE_REGEX = /^messages-[0-9TZ-]+\.ndjson\.gz$/;
+const ARCHIVE_BATCH_SIZE = 1000;
+const ARCHIVE_LOCK_MS = 30 * 60 * 1000;
+
+const prepareMessages = once(async (database) => {
+  const collection = database.collection('contact_submissions');
+  await Promise.all([
+    collection.createIndex({ siteId: 1, createdAt: -1 }),
+    collection.createIndex({ siteId: 1, read: 1 }),
+    // Archival scans all sites by age
+    collection.createIndex({ createdAt: -1 }),
+    // Documents are removed by MongoDB once expireAt is reached
+    collection.createIndex({ expireAt: 1 }, { expireAfterSeconds: 0 })
+  ]);
+
+  // Messages read before retention existed expire relative to their creation
+  await runMigrationOnce(database, 'message-read-expiry-backfill', async () => {
+    const { modifiedCount } = await collection.updateMany(
+      { read: true, expireAt: { $exists: false } },
+      [{ $set: { expireAt: { $add: ['$createdAt', MESSAGE_READ_RETENTION_DAYS * DAY_MS] } } }]
+    );
+    return { modified: modifiedCount };
+  });
+});
+
+// Lease lock in MongoDB so only one worker archives or restores at a time
+async function acquireJobLock(database, name) {
+  const now = new Date();
+  try {
+    const lock = await database.collection('job_locks').findOneAndUpdate(
+      { _id: name, lockedUntil: { $lt: now } },
+      { $set: { lockedUntil: new Date(now.getTime() + ARCHIVE_LOCK_MS), owner: process.pid } },
+      { upsert: true, returnDocument: 'after' }
+    );
+    return Boolean(lock);
+  } catch (error) {
+    if (error.code === 11000) return false; // held by another worker
+    throw error;
+  }
+}
+
+async function releaseJobLock(database, name) {
+  await database.collection('job_locks').updateOne({ _id: name }, { $set: { lockedUntil: new Date(0) } });
+}
+
+async function archiveMessages(olderThanDays = MESSAGE_ARCHIVE_AFTER_DAYS, siteId = null) {
+  const database = await connectToDatabase();
+  if (!(await acquireJobLock(database, 'messages-archive'))) {
+    return { locked: true };
+  }
+
+  try {
+    const { BSON } = await import('mongodb');
+    const collection = database.collection('contact_submissions');
+    const cutoff = new Date(Date.now() - olderThanDays * DAY_MS);
+    const filter = siteId ? { siteId, createdAt: { $lt: cutoff } } : { createdAt: { $lt: cutoff } };
+
+    await mkdir(MESSAGE_ARCHIVE_DIR, { recursive: true });
+    const file = `messages-${new Date().toISOString().replace(/[:.]/g, '-')}.ndjson.gz`;
+    const target = path.join(MESSAGE_ARCHIVE_DIR, file);
+    const partial = `${target}.partial`;
+
+    // Stream cursor -> NDJSON -> gzip -> file without holding the documents in memory
+    // Only the _ids actually written are deleted afterwards: an old-dated message
+    // inserted behind the cursor stays in the collection for the next run
+    const archivedIds = [];
+    const cursor = collection.find(filter).sort({ createdAt: 1 }).batchSize(ARCHIVE_BATCH_SIZE);
+    const lines = Readable.from((async function* () {
+      for await (const doc of cursor) {
+        archivedIds.push(doc._id);
+        yield `${BSON.EJSON.stringify(doc, { relaxed: false })}\n`;
+      }
+    })());
+
+    try {
+      await pipeline(lines, createGzip(), createWriteStream(partial));
+    } catch (error) {
+      await unlink(partial).catch(() => {});
+      throw error;
+    }
+
+    const archived = archivedIds.length;
+    if (archived === 0) {
+      await unlink(partial);
+      return { archived: 0, file: null };
+    }
+
+    // Only delete once the archive is complete on disk
+    await rename(partial, target);
+    let deletedCount = 0;
+    for (let start = 0; start < archived; start += ARCHIVE_BATCH_SIZE) {
+      const result = await collection.deleteMany({ _id: { $in: archivedIds.slice(start, start + ARCHIVE_BATCH_SIZE) } });
+      deletedCount += result.deletedCount;
+    }
+    console.log(`Archived ${archived} contact messages to ${target} (${deletedCount} deleted)`);
+
+    return { archived, deleted: deletedCount, file };
+  } finally {
+    await releaseJobLock(database, 'messages-archive');
+  }
+}
+
+async function listMessageArchives() {
+  let files;
+  try {
+    files = await readdir(MESSAGE_ARCHIVE_DIR);
+  } catch (error) {
+    if (error.code === 'ENOENT') return [];
+    throw error;
+  }
+
+  const archives = await Promise.all(files.filter(file => ARCHIVE_FILE_REGEX.test(file)).map(async file => {
+    const info = await stat(path.join(MESSAGE_ARCHIVE_DIR, file));
+    return { file, size: info.size, createdAt: info.mtime };
+  }));
+
+  return archives.sort((a, b) => b.createdAt - a.createdAt);
+}
+
+async function restoreMessageArchive(file) {
+  const database = await connectToDatabase();
+  if (!(await acquireJobLock(database, 'messages-archive'))) {
+    return { locked: true };
+  }
+
+  try {
+    const { BSON } = await import('mongodb');
+    const collection = database.collection('contact_submissions');
+    const input = readline.createInterface({
+      input: createReadStream(path.join(MESSAGE_ARCHIVE_DIR, file)).pipe(createGunzip()),
+      crlfDelay: Infinity
+    });
+
+    let restored = 0;
+    let batch = [];
+    const flush = async () => {
+      if (batch.length === 0) return;
+      try {
+        const result = await collection.insertMany(batch, { ordered: false });
+        restored += result.insertedCount;
+      } catch (error) {
+        // Duplicate _id means the message is already present: restoring is idempotent
+        if (!error.writeErrors?.every(e => e.code === 11000)) throw error;
+        restored += error.result?.insertedCount ?? 0;
+      }
+      batch = [];
+    };
+
+    for await (const line of input) {
+      if (!line) continue;
+      const doc = BSON.EJSON.parse(line, { relaxed: false });
+      // Restored messages stay until they are archived again instead of expiring immediately
+      delete doc.expireAt;
+      doc.restoredAt = new Date();
+      batch.push(doc);
+      if (batch.length >= ARCHIVE_BATCH_SIZE) await flush();
+    }
+    await flush();
+
+    return { restored };
+  } finally {
+    await releaseJobLock(database, 'messages-archive');
+  }
+}
+
+if (MESSAGE_ARCHIVE_INTERVAL_HOURS > 0 && !globalThis.__getyoursiteArchiveTimer) {
+  globalThis.__getyoursiteArchiveTimer = setInterval(() => {
+    archiveMessages().catch(error => console.error('Scheduled archive error:', error));
+  }, MESSAGE_ARCHIVE_INTERVAL_HOURS * 60 * 60 * 1000);
+  globalThis.__getyoursiteArchiveTimer.unref?.();
+}
+
 // GET handler
 export async function GET(request) {
   const url = new URL(request.url);
@@ -178,35 +1203,181 @@ export async function GET(request) {
         return NextResponse.json({ valid: false }, { status: 401 });
       }
       
-      const decoded = verifyToken(token);
+      const decoded = await verifyToken(token);
+      if (!decoded) {
+        return NextResponse.json({ valid: false }, { status: 401 });
+      }
+      
+      return NextResponse.json({ valid: true, user: decoded });
+    }
+
+    // Admin: dashboard bootstrap (token verified once, queries run concurrently)
+    if (pathname.includes('/api/admin/bootstrap')) {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      const messagesLimit = parsePageSize(url.searchParams.get('messagesLimit'), 100);
+      const publicationsLimit = parsePageSize(url.searchParams.get('publicationsLimit'), 100);
+
+      const siteId = await resolveSiteId(request);
+      const database = await connectToDatabase();
+      await Promise.all([prepareMessages(database), preparePublications(database)]);
+      const messagesCollection = database.collection('contact_submissions');
+      const publicationsCollection = database.collection('publications');
+
+      const [content, messages, messagesTotal, messagesUnread, publications, publicationsTotal] = await Promise.all([
+        getSiteContent(siteId),
+        messagesCollection
+          .find({ siteId }, { projection: { ip: 0 } })
+          .sort({ createdAt: -1 })
+          .limit(messagesLimit)
+          .toArray(),
+        messagesCollection.countDocuments({ siteId }),
+        messagesCollection.countDocuments({ siteId, read: false }),
+        // Summaries only: the dashboard fetches a body when it opens the publication
+        publicationsCollection
+          .find({ siteId }, { projection: ADMIN_PUBLICATION_SUMMARY_PROJECTION })
+          .sort({ createdAt: -1 })
+          .limit(publicationsLimit)
+          .toArray(),
+        publicationsCollection.countDocuments({ siteId })
+      ]);
+
+      return NextResponse.json({
+        user: decoded,
+        siteId,
+        content: content || {},
+        messages: { items: messages, total: messagesTotal, unread: messagesUnread },
+        publications: { items: publications, total: publicationsTotal }
+      });
+    }
+
+    // Admin: process metrics
+    if (pathname.includes('/api/admin/metrics')) {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      return NextResponse.json({
+        pid: process.pid,
+        uptime: process.uptime(),
+        memory: process.memoryUsage(),
+        ...metrics,
+        views: { ...metrics.views, pending: pendingViewEvents, pendingPublications: pendingViews.size },
+        sites: { hosts: siteHosts.stats(), content: contentCache.stats(), publications: publicationsCache.stats() },
+        events: { ...eventStats, open: openStreamCount() }
+      });
+    }
+
+    // Admin: live feed over server-sent events, authenticated by the bearer
+    // token or by the ticket cookie from POST /api/admin/events/ticket
+    if (pathname.includes('/api/admin/events')) {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = token ? await verifyToken(token) : await verifyEventsTicket(request);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      if (openStreamCount() >= SSE_MAX_CONNECTIONS) {
+        return NextResponse.json({ error: 'Trop de connexions ouvertes' }, { status: 503 });
+      }
+
+      const siteId = await resolveSiteId(request);
+      const stream = openEventStream(siteId, {
+        lastEventId: request.headers.get('last-event-id'),
+        signal: request.signal,
+        expiresAt: decoded.exp ? decoded.exp * 1000 : 0
+      });
+
+      return new Response(stream, {
+        headers: {
+          'Content-Type': 'text/event-stream; charset=utf-8',
+          'Cache-Control': 'no-cache, no-transform',
+          // nginx would otherwise buffer the stream
+          'X-Accel-Buffering': 'no'
+        }
+      });
+    }
+
+    // Admin: content revision log (newest first, operations omitted)
+    if (pathname.includes('/api/admin/content/revisions')) {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
       if (!decoded) {
-        return NextResponse.json({ valid: false }, { status: 401 });
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
       }
-      
-      return NextResponse.json({ valid: true, user: decoded });
+
+      const siteId = await resolveSiteId(request);
+      const database = await connectToDatabase();
+      const revisions = await database.collection('content_revisions')
+        .aggregate([
+          { $match: { siteId } },
+          { $sort: { version: -1 } },
+          { $limit: parsePageSize(url.searchParams.get('limit'), 50, 200) },
+          { $project: { _id: 0, version: 1, author: 1, createdAt: 1, rollbackTo: 1, paths: '$ops.path' } }
+        ])
+        .toArray();
+
+      return NextResponse.json(revisions);
     }
 
     // Get site content
     if (pathname.includes('/api/content')) {
-      await initializeDefaultContent();
-      const database = await connectToDatabase();
-      const content = await database.collection('site_content').findOne({ type: 'main' });
+      const siteId = await resolveSiteId(request);
       
-      return NextResponse.json(content || {});
+      return NextResponse.json(await getSiteContent(siteId));
+    }
+
+    // Admin: List registered sites
+    if (pathname.includes('/api/admin/sites')) {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      const database = await connectToDatabase();
+      const sites = await database.collection('sites').find({}).sort({ _id: 1 }).toArray();
+
+      return NextResponse.json(sites.map(({ _id, ...site }) => ({ id: _id, ...site })));
+    }
+
+    // Admin: List message archives
+    if (pathname === '/api/admin/messages/archives') {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      return NextResponse.json(await listMessageArchives());
     }
 
     // Admin: Get contact messages
     if (pathname.includes('/api/admin/messages')) {
       const token = request.headers.get('authorization')?.replace('Bearer ', '');
-      const decoded = verifyToken(token);
+      const decoded = await verifyToken(token);
       
       if (!decoded) {
         return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
       }
       
+      const siteId = await resolveSiteId(request);
       const database = await connectToDatabase();
+      await prepareMessages(database);
       const messages = await database.collection('contact_submissions')
-        .find({})
+        .find({ siteId })
         .sort({ createdAt: -1 })
         .limit(100)
         .toArray();
@@ -214,30 +1385,93 @@ export async function GET(request) {
       return NextResponse.json(messages);
     }
 
-    // Public: Get published publications
+    // Public: Most viewed publications (stored totals, flushed views only)
+    if (pathname.includes('/api/publications/popular')) {
+      const limit = parsePageSize(url.searchParams.get('limit'), 5, 50);
+      const siteId = await resolveSiteId(request);
+      const database = await connectToDatabase();
+      await preparePublications(database);
+      const publications = await database.collection('publications')
+        .find({ siteId, status: 'published', views: { $gt: 0 } }, { projection: PUBLICATION_SUMMARY_PROJECTION })
+        .sort({ views: -1 })
+        .limit(limit)
+        .toArray();
+
+      return NextResponse.json(publications);
+    }
+
+    // Public: Get one published publication (full content)
+    const publicationMatch = pathname.match(/\/api\/publications\/([^/]+)$/);
+    if (publicationMatch && !pathname.includes('/api/admin/')) {
+      const siteId = await resolveSiteId(request);
+      const database = await connectToDatabase();
+      const publication = await database.collection('publications').findOne(
+        { siteId, id: decodeURIComponent(publicationMatch[1]), status: 'published' },
+        { projection: { _id: 0 } }
+      );
+
+      if (!publication) {
+        return NextResponse.json({ error: 'Publication introuvable' }, { status: 404 });
+      }
+
+      recordView(publication.id);
+      return NextResponse.json(publication);
+    }
+
+    // Public: Get published publications (summary fields only)
     if (pathname.includes('/api/publications') && !pathname.includes('/api/admin/')) {
+      const siteId = await resolveSiteId(request);
+      const cached = publicationsCache.get(siteId);
+      if (cached) {
+        return NextResponse.json(cached);
+      }
+
+      const generation = publicationsCache.generation(siteId);
       const database = await connectToDatabase();
+      await preparePublications(database);
       const publications = await database.collection('publications')
-        .find({ status: 'published' })
+        .find({ siteId, status: 'published' }, { projection: PUBLICATION_SUMMARY_PROJECTION })
         .sort({ publishedAt: -1 })
         .limit(10)
         .toArray();
       
-      return NextResponse.json(publications);
+      return NextResponse.json(publicationsCache.set(siteId, publications, generation));
+    }
+
+    // Admin: Get one publication with its body (live feed deltas omit it)
+    if (pathname.includes('/api/admin/publications/')) {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      const siteId = await resolveSiteId(request);
+      const publicationId = pathname.split('/').pop();
+      const database = await connectToDatabase();
+      const publication = await database.collection('publications').findOne({ siteId, id: publicationId });
+      if (!publication) {
+        return NextResponse.json({ error: 'Publication introuvable' }, { status: 404 });
+      }
+
+      return NextResponse.json(publication);
     }
 
     // Admin: Get all publications
     if (pathname.includes('/api/admin/publications')) {
       const token = request.headers.get('authorization')?.replace('Bearer ', '');
-      const decoded = verifyToken(token);
+      const decoded = await verifyToken(token);
       
       if (!decoded) {
         return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
       }
       
+      const siteId = await resolveSiteId(request);
       const database = await connectToDatabase();
+      await preparePublications(database);
       const publications = await database.collection('publications')
-        .find({})
+        .find({ siteId })
         .sort({ createdAt: -1 })
         .toArray();
       
@@ -264,9 +1498,29 @@ export async function POST(request) {
     const forwarded = request.headers.get('x-forwarded-for');
     const ip = forwarded ? forwarded.split(',')[0] : request.headers.get('x-real-ip') || 'unknown';
 
+    // Admin: ticket cookie for the live feed (see issueEventsTicket)
+    if (pathname.includes('/api/admin/events/ticket')) {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      const response = NextResponse.json({ success: true, expiresAt: decoded.exp ? decoded.exp * 1000 : null });
+      response.cookies.set(EVENTS_COOKIE, await issueEventsTicket(decoded), {
+        httpOnly: true,
+        sameSite: 'strict',
+        secure: (request.headers.get('x-forwarded-proto') || url.protocol.replace(':', '')) === 'https',
+        path: EVENTS_PATH,
+        ...(decoded.exp && { expires: new Date(decoded.exp * 1000) })
+      });
+      return response;
+    }
+
     // Admin login
     if (pathname.includes('/api/admin/login')) {
-      const body = await request.json();
+      const body = await readJsonBody(request, BODY_LIMITS.small);
       const { username, password } = body;
 
       // Hardcoded credentials as fallback for external URL issues
@@ -287,6 +1541,7 @@ export async function POST(request) {
         );
       }
 
+      const jwt = await loadJwt();
       const token = jwt.sign(
         { username, role: 'admin' },
         process.env.JWT_SECRET,
@@ -302,49 +1557,66 @@ export async function POST(request) {
 
     // Contact form submission
     if (pathname.includes('/api/contact')) {
-      if (isRateLimited(ip)) {
+      // Canary probes (tests/canary.py): parsing and validation only, nothing
+      // stored or sent, and no rate limit bucket consumed
+      if (request.headers.get('x-canary-dry-run') === 'true') {
+        const token = request.headers.get('authorization')?.replace('Bearer ', '');
+        if (!(await verifyToken(token))) {
+          return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+        }
+
+        const validationError = validateSchema(await readJsonBody(request, BODY_LIMITS.contact), CONTACT_SCHEMA);
+        if (validationError) {
+          return NextResponse.json({ error: validationError }, { status: 400 });
+        }
+
+        metrics.contact.dryRuns++;
+        return NextResponse.json({ success: true, dryRun: true });
+      }
+
+      const rateLimitKey = await getRateLimitKey(request, ip);
+      if (isRateLimited(rateLimitKey)) {
         return NextResponse.json(
           { error: 'Trop de requêtes. Veuillez patienter avant de réessayer.' },
           { status: 429 }
         );
       }
 
-      const body = await request.json();
+      const body = await readJsonBody(request, BODY_LIMITS.contact);
       const { name, email, message, subject = 'Nouveau message de GetYourSite' } = body;
-      
-      // Validation
-      if (!validateInput(name, 100)) {
-        return NextResponse.json(
-          { error: 'Le nom est requis et doit contenir moins de 100 caractères' },
-          { status: 400 }
-        );
-      }
+      const accepted = { 
+        success: true, 
+        message: 'Votre message a été envoyé avec succès !'
+      };
+      metrics.contact.received++;
 
-      if (!validateInput(email, 254) || !validateEmail(email)) {
-        return NextResponse.json(
-          { error: 'Une adresse email valide est requise' },
-          { status: 400 }
-        );
+      // Bots fill every field; answer as if the message went through
+      if (body?.[CONTACT_HONEYPOT_FIELD]) {
+        metrics.contact.dropped.honeypot++;
+        return NextResponse.json(accepted);
       }
-
-      if (!validateInput(message, 2000)) {
-        return NextResponse.json(
-          { error: 'Le message est requis et doit contenir moins de 2000 caractères' },
-          { status: 400 }
-        );
+      
+      // Validation
+      const validationError = validateSchema(body, CONTACT_SCHEMA);
+      if (validationError) {
+        return NextResponse.json({ error: validationError }, { status: 400 });
       }
 
-      if (subject && !validateInput(subject, 200)) {
-        return NextResponse.json(
-          { error: 'Le sujet doit contenir moins de 200 caractères' },
-          { status: 400 }
-        );
+      // Same text already accepted recently: drop it silently before any I/O
+      // (the host-to-site lookup is cached, so it rarely costs a query)
+      const siteId = await resolveSiteId(request);
+      const namespace = rateLimitKey.startsWith('test:') ? rateLimitKey.slice(0, rateLimitKey.indexOf(':', 5) + 1) : '';
+      if (isDuplicateContact(contactDigest(`${namespace}${siteId}:`, email, message))) {
+        metrics.contact.dropped.duplicate++;
+        return NextResponse.json(accepted);
       }
 
       // Store in database
       try {
         const database = await connectToDatabase();
-        await database.collection('contact_submissions').insertOne({
+        await prepareMessages(database);
+        const submission = {
+          siteId,
           name: sanitizeHtml(name),
           email: sanitizeHtml(email),
           subject: sanitizeHtml(subject),
@@ -352,23 +1624,24 @@ export async function POST(request) {
           ip,
           createdAt: new Date(),
           read: false
-        });
+        };
+        await database.collection('contact_submissions').insertOne(submission);
+        metrics.contact.inserted++;
+        publishLocalEvent(siteId, 'message.created', feedDocument(submission));
       } catch (dbError) {
         console.error('Database storage error:', dbError);
       }
 
-      // Send email if configured
-      if (process.env.GMAIL_USER && process.env.GMAIL_APP_PASSWORD && process.env.GMAIL_USER !== 'votre-email@gmail.com') {
+      // Send email if the global SMTP budget allows it and SMTP is configured;
+      // the message is stored either way and shows up in the admin inbox. The
+      // bucket decides (and is measured) even without SMTP credentials.
+      const smtpGranted = takeSmtpToken();
+      metrics.contact.smtp[smtpGranted ? 'granted' : 'throttled']++;
+      // Test suite traffic (TEST_MODE namespaces) never reaches a real mailbox
+      const testTraffic = rateLimitKey.startsWith('test:');
+      if (smtpGranted && isSmtpConfigured() && !testTraffic) {
         try {
-          const transporter = nodemailer.createTransporter({
-            host: process.env.SMTP_HOST,
-            port: parseInt(process.env.SMTP_PORT),
-            secure: false,
-            auth: {
-              user: process.env.GMAIL_USER,
-              pass: process.env.GMAIL_APP_PASSWORD,
-            },
-          });
+          const transporter = await getMailTransporter();
           
           const sanitizedName = sanitizeHtml(name);
           const sanitizedEmail = sanitizeHtml(email);
@@ -406,66 +1679,164 @@ export async function POST(request) {
           };
           
           await transporter.sendMail(mailOptions);
+          metrics.contact.smtp.sent++;
         } catch (emailError) {
+          metrics.contact.smtp.failures++;
           console.error('Email sending error:', emailError);
         }
       }
       
-      return NextResponse.json({ 
-        success: true, 
-        message: 'Votre message a été envoyé avec succès !'
-      });
+      return NextResponse.json(accepted);
     }
 
-    // Admin: Create publication
-    if (pathname.includes('/api/admin/publications')) {
+    // Admin: Restore the content as it was at an earlier version
+    if (pathname.includes('/api/admin/content/rollback')) {
       const token = request.headers.get('authorization')?.replace('Bearer ', '');
-      const decoded = verifyToken(token);
-      
+      const decoded = await verifyToken(token);
+
       if (!decoded) {
         return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
       }
 
-      const body = await request.json();
-      const { title, content, author, status = 'draft' } = body;
-      
-      // Validation
-      if (!validateInput(title, 200)) {
-        return NextResponse.json(
-          { error: 'Le titre est requis et doit contenir moins de 200 caractères' },
-          { status: 400 }
-        );
+      const { version } = await readJsonBody(request, BODY_LIMITS.small);
+      const siteId = await resolveSiteId(request);
+      const database = await connectToDatabase();
+      const result = await rollbackContent(database, siteId, version, decoded.username);
+      if (result.conflict) {
+        return contentConflictResponse(result);
       }
-      
-      if (!validateInput(content, 5000)) {
-        return NextResponse.json(
-          { error: 'Le contenu est requis et doit contenir moins de 5000 caractères' },
-          { status: 400 }
-        );
+
+      return NextResponse.json({ success: true, version: result.version, message: 'Contenu restauré' });
+    }
+
+    // Admin: Register or update a site and the hosts it answers on
+    if (pathname.includes('/api/admin/sites')) {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
       }
 
-      if (!validateInput(author, 100)) {
-        return NextResponse.json(
-          { error: 'L\'auteur est requis et doit contenir moins de 100 caractères' },
-          { status: 400 }
-        );
+      const body = await readJsonBody(request, BODY_LIMITS.small);
+      const validationError = validateSite(body);
+      if (validationError) {
+        return NextResponse.json({ error: validationError }, { status: 400 });
       }
 
-      if (status && !['draft', 'published'].includes(status)) {
-        return NextResponse.json(
-          { error: 'Le statut doit être "draft" ou "published"' },
-          { status: 400 }
+      const database = await connectToDatabase();
+      await prepareSites(database);
+      const hosts = [...new Set(body.hosts.map(host => host.toLowerCase()))];
+      const now = new Date();
+
+      try {
+        await database.collection('sites').updateOne(
+          { _id: body.id },
+          {
+            $set: { name: sanitizeHtml(body.name || body.id), hosts, updatedAt: now },
+            $setOnInsert: { createdAt: now }
+          },
+          { upsert: true }
         );
+      } catch (error) {
+        if (error.code === 11000) {
+          return NextResponse.json({ error: 'Un de ces domaines est déjà utilisé par un autre site' }, { status: 409 });
+        }
+        throw error;
+      }
+
+      // Hosts may have moved between sites; other workers hear about it on the invalidation stream
+      siteHosts.clear();
+      await initializeDefaultContent(body.id);
+
+      return NextResponse.json({ success: true, site: { id: body.id, name: body.name || body.id, hosts } });
+    }
+
+    // Admin: Restore a message archive
+    if (pathname === '/api/admin/messages/archives/restore') {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      const { file } = await readJsonBody(request, BODY_LIMITS.small);
+      if (typeof file !== 'string' || !ARCHIVE_FILE_REGEX.test(file)) {
+        return NextResponse.json({ error: 'Archive invalide' }, { status: 400 });
+      }
+
+      const archives = await listMessageArchives();
+      if (!archives.some(archive => archive.file === file)) {
+        return NextResponse.json({ error: 'Archive introuvable' }, { status: 404 });
+      }
+
+      const result = await restoreMessageArchive(file);
+      if (result.locked) {
+        return NextResponse.json({ error: 'Archivage déjà en cours' }, { status: 409 });
+      }
+
+      return NextResponse.json({ success: true, ...result });
+    }
+
+    // Admin: Archive old messages now
+    if (pathname === '/api/admin/messages/archive') {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      const body = request.headers.get('content-length') === '0' ? {} : await readJsonBody(request, BODY_LIMITS.small);
+      const olderThanDays = body.olderThanDays ?? MESSAGE_ARCHIVE_AFTER_DAYS;
+      if (!Number.isInteger(olderThanDays) || olderThanDays < 0) {
+        return NextResponse.json({ error: 'olderThanDays doit être un entier positif' }, { status: 400 });
+      }
+      // Optional: archive a single site instead of the whole collection
+      if (body.siteId !== undefined && (typeof body.siteId !== 'string' || !SITE_ID_REGEX.test(body.siteId))) {
+        return NextResponse.json({ error: 'siteId invalide' }, { status: 400 });
+      }
+
+      const result = await archiveMessages(olderThanDays, body.siteId);
+      if (result.locked) {
+        return NextResponse.json({ error: 'Archivage déjà en cours' }, { status: 409 });
+      }
+
+      return NextResponse.json({ success: true, ...result });
+    }
+
+    // Admin: Create publication
+    if (pathname.includes('/api/admin/publications')) {
+      const token = request.headers.get('authorization')?.replace('Bearer ', '');
+      const decoded = await verifyToken(token);
+      
+      if (!decoded) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+      }
+
+      const body = await readJsonBody(request, BODY_LIMITS.publication);
+      
+      // Validation
+      const validationError = validateSchema(body, PUBLICATION_SCHEMA);
+      if (validationError) {
+        return NextResponse.json({ error: validationError }, { status: 400 });
       }
 
+      const { title, content, author, status = 'draft' } = body;
+
       // Create publication
+      const siteId = await resolveSiteId(request);
       const database = await connectToDatabase();
-      const publicationId = Date.now().toString();
+      // Timestamp prefix keeps ids sortable, random suffix avoids collisions under concurrent creates
+      const publicationId = `${Date.now()}-${randomBytes(3).toString('hex')}`;
       
       const publication = {
+        siteId,
         id: publicationId,
         title: sanitizeHtml(title),
         content: sanitizeHtml(content),
+        ...buildPublicationSummary(content),
         author: sanitizeHtml(author),
         status: status,
         createdAt: new Date(),
@@ -474,6 +1845,8 @@ export async function POST(request) {
       };
 
       await database.collection('publications').insertOne(publication);
+      publicationsCache.delete(siteId);
+      publishLocalEvent(siteId, 'publication.created', publicationDelta(publication));
       
       return NextResponse.json({ 
         success: true, 
@@ -488,6 +1861,9 @@ export async function POST(request) {
     });
 
   } catch (error) {
+    if (error instanceof RequestBodyError) {
+      return bodyErrorResponse(error);
+    }
     console.error('API Error:', error);
     return NextResponse.json(
       { error: 'Erreur serveur' },
@@ -504,82 +1880,92 @@ export async function PUT(request) {
     
     // Verify admin token
     const token = request.headers.get('authorization')?.replace('Bearer ', '');
-    const decoded = verifyToken(token);
+    const decoded = await verifyToken(token);
     
     if (!decoded) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
     }
 
-    const body = await request.json();
+    const bodyLimit = pathname.includes('/api/admin/content') ? BODY_LIMITS.content
+      : pathname.includes('/api/admin/publications/') ? BODY_LIMITS.publication
+      : BODY_LIMITS.small;
+    const body = await readJsonBody(request, bodyLimit);
+    const siteId = await resolveSiteId(request);
     const database = await connectToDatabase();
 
     // Update site content
+    // Whole-section overwrite, kept for older clients: recorded as a one-operation
+    // patch on the current version (PATCH /api/admin/content sends only the changes)
     if (pathname.includes('/api/admin/content')) {
       const { type, data } = body;
+      if (!CONTENT_SECTIONS.includes(type)) {
+        return NextResponse.json({ error: 'Section inconnue' }, { status: 400 });
+      }
+
+      const result = await applyContentPatch(database, siteId, [{ op: 'add', path: `/${type}`, value: data }], {
+        author: decoded.username
+      });
+      if (result.conflict) {
+        return contentConflictResponse(result);
+      }
       
-      await database.collection('site_content').updateOne(
-        { type: 'main' },
-        { 
-          $set: { 
-            [type]: data,
-            updatedAt: new Date()
-          }
-        }
-      );
-      
-      return NextResponse.json({ success: true, message: 'Contenu mis à jour' });
+      return NextResponse.json({ success: true, version: result.version, message: 'Contenu mis à jour' });
     }
 
     // Mark message as read
     if (pathname.includes('/api/admin/messages/read')) {
       const { messageId } = body;
       
+      const readAt = new Date();
       await database.collection('contact_submissions').updateOne(
-        { _id: new ObjectId(messageId) },
-        { $set: { read: true } }
+        { _id: await toObjectId(messageId), siteId },
+        {
+          $set: {
+            read: true,
+            readAt,
+            expireAt: new Date(readAt.getTime() + MESSAGE_READ_RETENTION_DAYS * DAY_MS)
+          }
+        }
       );
+      publishLocalEvent(siteId, 'message.updated', { _id: messageId, read: true, readAt });
       
       return NextResponse.json({ success: true });
     }
 
+    // Flag message as spam (expires after the short spam retention)
+    if (pathname.includes('/api/admin/messages/spam')) {
+      const { messageId } = body;
+
+      await database.collection('contact_submissions').updateOne(
+        { _id: await toObjectId(messageId), siteId },
+        {
+          $set: {
+            spam: true,
+            expireAt: new Date(Date.now() + MESSAGE_SPAM_RETENTION_DAYS * DAY_MS)
+          }
+        }
+      );
+      publishLocalEvent(siteId, 'message.updated', { _id: messageId, spam: true });
+
+      return NextResponse.json({ success: true });
+    }
+
     // Update publication
     if (pathname.includes('/api/admin/publications/')) {
       const publicationId = pathname.split('/').pop();
-      const { title, content, author, status } = body;
-      
       // Validation
-      if (!validateInput(title, 200)) {
-        return NextResponse.json(
-          { error: 'Le titre est requis et doit contenir moins de 200 caractères' },
-          { status: 400 }
-        );
-      }
-      
-      if (!validateInput(content, 5000)) {
-        return NextResponse.json(
-          { error: 'Le contenu est requis et doit contenir moins de 5000 caractères' },
-          { status: 400 }
-        );
-      }
-
-      if (!validateInput(author, 100)) {
-        return NextResponse.json(
-          { error: 'L\'auteur est requis et doit contenir moins de 100 caractères' },
-          { status: 400 }
-        );
+      const validationError = validateSchema(body, PUBLICATION_SCHEMA);
+      if (validationError) {
+        return NextResponse.json({ error: validationError }, { status: 400 });
       }
 
-      if (status && !['draft', 'published'].includes(status)) {
-        return NextResponse.json(
-          { error: 'Le statut doit être "draft" ou "published"' },
-          { status: 400 }
-        );
-      }
+      const { title, content, author, status } = body;
 
       // Update publication
       const updateData = {
         title: sanitizeHtml(title),
         content: sanitizeHtml(content),
+        ...buildPublicationSummary(content),
         author: sanitizeHtml(author),
         status: status,
         updatedAt: new Date()
@@ -590,10 +1976,13 @@ export async function PUT(request) {
         updateData.publishedAt = new Date();
       }
 
-      await database.collection('publications').updateOne(
-        { id: publicationId },
-        { $set: updateData }
+      const updated = await database.collection('publications').findOneAndUpdate(
+        { siteId, id: publicationId },
+        { $set: updateData },
+        { returnDocument: 'after' }
       );
+      publicationsCache.delete(siteId);
+      if (updated) publishLocalEvent(siteId, 'publication.updated', publicationDelta(updated, Object.keys(updateData)));
       
       return NextResponse.json({ success: true, message: 'Publication mise à jour' });
     }
@@ -604,6 +1993,9 @@ export async function PUT(request) {
     });
 
   } catch (error) {
+    if (error instanceof RequestBodyError) {
+      return bodyErrorResponse(error);
+    }
     console.error('PUT error:', error);
     return NextResponse.json(
       { error: 'Erreur serveur' },
@@ -612,6 +2004,56 @@ export async function PUT(request) {
   }
 }
 
+// PATCH handler: partial content updates with optimistic concurrency
+export async function PATCH(request) {
+  try {
+    const url = new URL(request.url);
+    const pathname = url.pathname;
+
+    // Verify admin token
+    const token = request.headers.get('authorization')?.replace('Bearer ', '');
+    const decoded = await verifyToken(token);
+
+    if (!decoded) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+    }
+
+    if (pathname.includes('/api/admin/content')) {
+      const body = await readJsonBody(request, BODY_LIMITS.content);
+      if (!Number.isInteger(body?.version) || body.version < 0) {
+        return NextResponse.json({ error: 'La version du contenu est requise' }, { status: 400 });
+      }
+
+      const siteId = await resolveSiteId(request);
+      const database = await connectToDatabase();
+      const result = await applyContentPatch(database, siteId, body.ops, {
+        baseVersion: body.version,
+        author: decoded.username
+      });
+      if (result.conflict) {
+        return contentConflictResponse(result);
+      }
+
+      return NextResponse.json({ success: true, version: result.version });
+    }
+
+    return NextResponse.json({
+      message: 'PATCH endpoint active',
+      timestamp: new Date().toISOString()
+    });
+
+  } catch (error) {
+    if (error instanceof RequestBodyError) {
+      return bodyErrorResponse(error);
+    }
+    console.error('PATCH error:', error);
+    return NextResponse.json(
+      { error: 'Erreur serveur' },
+      { status: 500 }
+    );
+  }
+}
+
 // DELETE handler
 export async function DELETE(request) {
   try {
@@ -620,21 +2062,70 @@ export async function DELETE(request) {
     
     // Verify admin token
     const token = request.headers.get('authorization')?.replace('Bearer ', '');
-    const decoded = verifyToken(token);
+    const decoded = await verifyToken(token);
     
     if (!decoded) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
     }
 
+    // Admin: drop the live feed ticket cookie (logout)
+    if (pathname.includes('/api/admin/events/ticket')) {
+      const response = NextResponse.json({ success: true });
+      response.cookies.set(EVENTS_COOKIE, '', { httpOnly: true, sameSite: 'strict', path: EVENTS_PATH, maxAge: 0 });
+      return response;
+    }
+
+    // Test mode: reset namespaced rate limit buckets
+    if (pathname.includes('/api/admin/test/rate-limit')) {
+      if (!TEST_MODE) {
+        return NextResponse.json({ error: 'Not found' }, { status: 404 });
+      }
+
+      const namespace = url.searchParams.get('namespace');
+      if (namespace && !TEST_RUN_ID_REGEX.test(namespace)) {
+        return NextResponse.json({ error: 'Namespace invalide' }, { status: 400 });
+      }
+
+      const removed = resetRateLimits(namespace);
+      return NextResponse.json({ success: true, removed });
+    }
+
     const database = await connectToDatabase();
 
+    // Delete a site with its content, publications and messages
+    if (pathname.includes('/api/admin/sites/')) {
+      const id = decodeURIComponent(pathname.split('/').pop());
+      if (id === DEFAULT_SITE_ID || !SITE_ID_REGEX.test(id)) {
+        return NextResponse.json({ error: 'Site invalide' }, { status: 400 });
+      }
+
+      const { deletedCount } = await database.collection('sites').deleteOne({ _id: id });
+      if (!deletedCount) {
+        return NextResponse.json({ error: 'Site introuvable' }, { status: 404 });
+      }
+
+      await Promise.all(['site_content', 'content_revisions', 'publications', 'contact_submissions'].map(name =>
+        database.collection(name).deleteMany({ siteId: id })
+      ));
+      siteHosts.clear();
+      contentCache.delete(id);
+      publicationsCache.delete(id);
+      defaultContentReady.delete(id);
+
+      return NextResponse.json({ success: true, message: 'Site supprimé' });
+    }
+
+    const siteId = await resolveSiteId(request);
+
     // Delete contact message
     if (pathname.includes('/api/admin/messages/')) {
       const messageId = pathname.split('/').pop();
+      const _id = await toObjectId(messageId);
+      // Lets this worker route the change stream's delete event to the site
+      documentSites.set(messageId, siteId);
       
-      await database.collection('contact_submissions').deleteOne(
-        { _id: new ObjectId(messageId) }
-      );
+      const { deletedCount } = await database.collection('contact_submissions').deleteOne({ _id, siteId });
+      if (deletedCount) publishLocalEvent(siteId, 'message.deleted', { _id: messageId });
       
       return NextResponse.json({ success: true, message: 'Message supprimé' });
     }
@@ -642,10 +2133,16 @@ export async function DELETE(request) {
     // Delete publication
     if (pathname.includes('/api/admin/publications/')) {
       const publicationId = pathname.split('/').pop();
+      const existing = await database.collection('publications').findOne(
+        { siteId, id: publicationId }, { projection: { _id: 1 } }
+      );
+      if (existing) documentSites.set(String(existing._id), siteId);
       
-      await database.collection('publications').deleteOne(
-        { id: publicationId }
+      const deleted = await database.collection('publications').findOneAndDelete(
+        { siteId, id: publicationId }
       );
+      publicationsCache.delete(siteId);
+      if (deleted) publishLocalEvent(siteId, 'publication.deleted', { _id: String(deleted._id) });
       
       return NextResponse.json({ success: true, message: 'Publication supprimée' });
     }
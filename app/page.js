@@ -29,7 +29,8 @@ export default function HomePage() {
     name: '',
     email: '',
     subject: '',
-    message: ''
+    message: '',
+    website: '' // honeypot, hidden from humans
   })
   const [isSubmitting, setIsSubmitting] = useState(false)
   const [submitStatus, setSubmitStatus] = useState(null)
@@ -197,14 +198,15 @@ export default function HomePage() {
           name: contactForm.name.trim(),
           email: contactForm.email.trim().toLowerCase(),
           subject: contactForm.subject.trim(),
-          message: contactForm.message.trim()
+          message: contactForm.message.trim(),
+          website: contactForm.website
         })
       })
 
       const data = await response.json()
 
       if (response.ok) {
-        setContactForm({ name: '', email: '', subject: '', message: '' })
+        setContactForm({ name: '', email: '', subject: '', message: '', website: '' })
         setSubmitStatus({ type: 'success', message: 'Votre message a été envoyé avec succès!' })
       } else {
         if (response.status === 429) {
@@ -491,6 +493,20 @@ export default function HomePage() {
               </CardHeader>
               <CardContent>
                 <form onSubmit={handleContactSubmit} className="space-y-4">
+                  {/* Honeypot: invisible to visitors, filled in by bots */}
+                  <div aria-hidden="true" className="absolute -left-[9999px] w-px h-px overflow-hidden">
+                    <label>
+                      Site web
+                      <input
+                        type="text"
+                        name="website"
+                        tabIndex={-1}
+                        autoComplete="off"
+                        value={contactForm.website}
+                        onChange={handleInputChange}
+                      />
+                    </label>
+                  </div>
                   <div className="grid md:grid-cols-2 gap-4">
                     <div>
                       <label className="block text-sm font-medium mb-2 text-slate-700">
@@ -604,12 +620,21 @@ export default function HomePage() {
                   </CardHeader>
                   <CardContent>
                     <p className="text-slate-600 text-sm line-clamp-3 mb-4">
-                      {publication.content}
+                      {publication.excerpt}
                     </p>
-                    <div className="flex items-center text-xs text-slate-500">
-                      <Users className="w-3 h-3 mr-1" />
-                      {publication.author}
+                    <div className="flex items-center justify-between text-xs text-slate-500">
+                      <span className="flex items-center">
+                        <Users className="w-3 h-3 mr-1" />
+                        {publication.author}
+                      </span>
+                      <span>{publication.readingTime} min de lecture</span>
                     </div>
+                    <a
+                      href={`/publications/${publication.id}`}
+                      className="inline-block mt-4 text-sm font-medium text-blue-600 hover:text-blue-700"
+                    >
+                      Lire la suite →
+                    </a>
                   </CardContent>
                 </Card>
               ))}
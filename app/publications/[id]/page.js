@@ -0,0 +1,84 @@
+'use client'
+
+import { useState, useEffect } from 'react'
+import { Button } from '@/components/ui/button'
+import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
+import { Badge } from '@/components/ui/badge'
+import { ArrowLeft, Users } from 'lucide-react'
+
+export default function PublicationPage({ params }) {
+  const [publication, setPublication] = useState(null)
+  const [notFound, setNotFound] = useState(false)
+
+  // Load the full publication on mount (the homepage only has its excerpt)
+  useEffect(() => {
+    const loadPublication = async () => {
+      try {
+        const response = await fetch(`/api/publications/${encodeURIComponent(params.id)}`)
+        if (!response.ok) {
+          setNotFound(true)
+          return
+        }
+        setPublication(await response.json())
+      } catch (error) {
+        console.error('Failed to load publication:', error)
+        setNotFound(true)
+      }
+    }
+
+    loadPublication()
+  }, [params.id])
+
+  if (notFound) {
+    return (
+      <div className="min-h-screen flex flex-col items-center justify-center gap-4 p-4">
+        <p className="text-slate-600">Cette publication est introuvable.</p>
+        <Button variant="outline" onClick={() => { window.location.href = '/#publications' }}>
+          Retour aux publications
+        </Button>
+      </div>
+    )
+  }
+
+  if (!publication) {
+    return (
+      <div className="min-h-screen flex items-center justify-center">
+        <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-600"></div>
+      </div>
+    )
+  }
+
+  return (
+    <div className="min-h-screen bg-slate-50 py-20 px-4">
+      <div className="container mx-auto max-w-3xl">
+        <a href="/#publications" className="inline-flex items-center text-sm text-blue-600 hover:text-blue-700 mb-8">
+          <ArrowLeft className="w-4 h-4 mr-1" />
+          Retour aux publications
+        </a>
+
+        <Card>
+          <CardHeader>
+            <div className="flex justify-between items-start mb-2">
+              <Badge variant="secondary" className="text-xs">
+                {new Date(publication.publishedAt).toLocaleDateString('fr-FR')}
+              </Badge>
+              <span className="text-xs text-slate-500">{publication.readingTime} min de lecture</span>
+            </div>
+            <CardTitle className="text-2xl leading-tight">
+              {publication.title}
+            </CardTitle>
+          </CardHeader>
+          <CardContent>
+            <p className="text-slate-700 whitespace-pre-line mb-6">
+              {publication.content}
+            </p>
+            <div className="flex items-center text-sm text-slate-500">
+              <Users className="w-4 h-4 mr-1" />
+              {publication.author}
+            </div>
+          </CardContent>
+        </Card>
+      </div>
+    </div>
+  )
+}
@@ -1,8 +1,9 @@
 module.exports = {
   apps: [{
     name: 'getyoursite',
-    script: 'yarn',
-    args: 'start',
+    // Standalone build: node runs the traced server directly, no yarn/next CLI in between
+    script: '.next/standalone/server.js',
+    interpreter: 'node',
     cwd: '/app',
     instances: 1,
     autorestart: true,
@@ -11,14 +12,19 @@ module.exports = {
     env: {
       NODE_ENV: 'production',
       PORT: 3000,
-      HOSTNAME: '0.0.0.0'
+      HOSTNAME: '0.0.0.0',
+      // Let instrumentation.js handle SIGTERM so buffered view counts are flushed
+      NEXT_MANUAL_SIG_HANDLE: 'true',
+      // Outside .next/standalone so archives survive rebuilds
+      MESSAGE_ARCHIVE_DIR: '/app/archives'
     },
     error_file: '/var/log/pm2/getyoursite-error.log',
     out_file: '/var/log/pm2/getyoursite-out.log',
     log_file: '/var/log/pm2/getyoursite.log',
     time: true,
     kill_timeout: 5000,
-    wait_ready: true,
+    // server.js never calls process.send('ready'); waiting for it only stalled restarts for listen_timeout
+    wait_ready: false,
     listen_timeout: 10000
   }]
 }
\ No newline at end of file
@@ -74,10 +74,10 @@ print_success "Projet trouvé dans $PROJECT_DIR"
 
 # 3. Vérifier le build Next.js
 print_step "Vérification du build Next.js..."
-if [[ ! -d ".next" ]]; then
-    print_warning "Build Next.js manquant - reconstruction..."
+if [[ ! -f ".next/standalone/server.js" ]]; then
+    print_warning "Build Next.js standalone manquant - reconstruction..."
     yarn build
-    if [[ -d ".next" ]]; then
+    if [[ -f ".next/standalone/server.js" ]]; then
         print_success "Build Next.js terminé"
     else
         print_error "Échec du build Next.js"
@@ -93,9 +93,10 @@ else
     fi
 fi
 
-# 3.1 Vérifier que yarn start fonctionne
+# 3.1 Vérifier que le serveur standalone démarre
 print_step "Test de démarrage Next.js..."
-timeout 10s yarn start > /tmp/nextjs-test.log 2>&1 &
+node scripts/prepare-standalone.js > /dev/null 2>&1 || true
+timeout 10s node .next/standalone/server.js > /tmp/nextjs-test.log 2>&1 &
 NEXTJS_PID=$!
 sleep 5
 
@@ -117,12 +118,23 @@ sleep 2
 
 # 5. Recréer la configuration PM2
 print_step "Création de la configuration PM2..."
+# NEXT_MANUAL_SIG_HANDLE coupe la gestion SIGTERM de Next : seulement si
+# instrumentation.js (activé par instrumentationHook) installe la nôtre
+SIG_HANDLE_ENV=""
+if [[ -f "$PROJECT_DIR/instrumentation.js" ]] && grep -q "instrumentationHook: true" "$PROJECT_DIR/next.config.js" 2>/dev/null; then
+    SIG_HANDLE_ENV="
+      // Let instrumentation.js handle SIGTERM so buffered view counts are flushed
+      NEXT_MANUAL_SIG_HANDLE: 'true',"
+else
+    print_warning "instrumentation.js absent : arrêt géré par Next (compteurs de vues en mémoire non vidés)"
+fi
 cat > ecosystem.config.js << EOF
 module.exports = {
   apps: [{
     name: '${PROJECT_NAME}',
-    script: 'yarn',
-    args: 'start',
+    // Standalone build: node runs the traced server directly, no yarn/next CLI in between
+    script: '.next/standalone/server.js',
+    interpreter: 'node',
     cwd: '${PROJECT_DIR}',
     instances: 1,
     autorestart: true,
@@ -131,14 +143,17 @@ module.exports = {
     env: {
       NODE_ENV: 'production',
       PORT: 3000,
-      HOSTNAME: '0.0.0.0'
+      HOSTNAME: '0.0.0.0',${SIG_HANDLE_ENV}
+      // Outside .next/standalone so archives survive rebuilds
+      MESSAGE_ARCHIVE_DIR: '${PROJECT_DIR}/archives'
     },
     error_file: '/var/log/pm2/${PROJECT_NAME}-error.log',
     out_file: '/var/log/pm2/${PROJECT_NAME}-out.log',
     log_file: '/var/log/pm2/${PROJECT_NAME}.log',
     time: true,
     kill_timeout: 5000,
-    wait_ready: true,
+    // server.js never calls process.send('ready'); waiting for it only stalled restarts for listen_timeout
+    wait_ready: false,
     listen_timeout: 10000
   }]
 }
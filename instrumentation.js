@@ -0,0 +1,15 @@
+// Runs once per server process, before the first request is handled
+export async function register() {
+  if (process.env.NEXT_RUNTIME !== 'nodejs') return;
+
+  // Connect to MongoDB in the background so the first API request after a
+  // (PM2) restart does not pay for the driver load and the handshake
+  const { warmUpDatabase } = await import('./lib/db');
+  warmUpDatabase();
+
+  // Flush in-memory state (view counters...) on SIGTERM before exiting
+  if (process.env.NEXT_MANUAL_SIG_HANDLE === 'true') {
+    const { installShutdownHandlers } = await import('./lib/shutdown');
+    installShutdownHandlers();
+  }
+}
@@ -0,0 +1,74 @@
+// Small in-memory LRU cache. Map iteration follows insertion order, so a hit
+// re-inserts its key at the end and eviction takes the first (least recent) key.
+//
+// Read-through callers take a generation(key) before reading the source and pass
+// it to set(): if the key was deleted (or the cache cleared) in between, the
+// value read may predate the invalidation and is not cached.
+export class LruCache {
+  constructor({ max = 1000, ttl = 0 } = {}) {
+    this.max = max;
+    this.ttl = ttl;
+    this.entries = new Map();
+    this.generations = new Map();
+    this.epoch = 0;
+    this.hits = 0;
+    this.misses = 0;
+    this.evictions = 0;
+    this.stale = 0;
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry || (entry.expiresAt && entry.expiresAt <= Date.now())) {
+      if (entry) this.entries.delete(key);
+      this.misses++;
+      return undefined;
+    }
+
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.hits++;
+    return entry.value;
+  }
+
+  generation(key) {
+    return { epoch: this.epoch, count: this.generations.get(key) || 0 };
+  }
+
+  set(key, value, generation) {
+    if (generation && (generation.epoch !== this.epoch || generation.count !== (this.generations.get(key) || 0))) {
+      this.stale++;
+      return value;
+    }
+
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: this.ttl ? Date.now() + this.ttl : 0 });
+
+    while (this.entries.size > this.max) {
+      this.entries.delete(this.entries.keys().next().value);
+      this.evictions++;
+    }
+    return value;
+  }
+
+  delete(key) {
+    this.generations.set(key, (this.generations.get(key) || 0) + 1);
+    // Bounded like the entries: starting a new epoch voids every pending generation
+    if (this.generations.size > this.max) this.clear();
+    return this.entries.delete(key);
+  }
+
+  clear() {
+    this.entries.clear();
+    this.generations.clear();
+    this.epoch++;
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+
+  stats() {
+    return { size: this.entries.size, max: this.max, hits: this.hits, misses: this.misses, evictions: this.evictions, stale: this.stale };
+  }
+}
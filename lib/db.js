@@ -0,0 +1,44 @@
+// MongoDB connection shared by the instrumentation hook and the API routes.
+// They are compiled into separate bundles, so the client is cached on
+// globalThis to keep a single connection pool per process.
+const cache = globalThis.__getyoursiteMongo || (globalThis.__getyoursiteMongo = {
+  client: null,
+  db: null,
+  promise: null
+});
+
+export async function connectToDatabase() {
+  if (cache.db) return cache.db;
+
+  // Concurrent callers share the same pending connection
+  if (!cache.promise) {
+    cache.promise = (async () => {
+      const { MongoClient } = await import('mongodb');
+      const client = new MongoClient(process.env.MONGO_URL);
+      await client.connect();
+      cache.client = client;
+      cache.db = client.db(process.env.DB_NAME);
+      console.log('Connected to MongoDB');
+      return cache.db;
+    })().catch((error) => {
+      cache.promise = null;
+      console.error('MongoDB connection error:', error);
+      throw error;
+    });
+  }
+
+  return cache.promise;
+}
+
+export async function toObjectId(id) {
+  const { ObjectId } = await import('mongodb');
+  return new ObjectId(id);
+}
+
+// Start connecting without blocking the caller (used at server boot)
+export function warmUpDatabase() {
+  const start = Date.now();
+  connectToDatabase()
+    .then(() => console.log(`MongoDB warm-up done in ${Date.now() - start}ms`))
+    .catch(() => {});
+}
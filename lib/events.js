@@ -0,0 +1,123 @@
+// Live feed for the admin dashboards: one in-process fan-out per worker. Events
+// come from a single source (the change stream, or local writes while it is
+// down) and are written to every open SSE connection of the matching site, so
+// N dashboards never mean N database pollers.
+const HEARTBEAT_MS = 25000;
+const REPLAY_SIZE = 500;
+// A client that lets this much pile up unread is dropped; EventSource reconnects
+const MAX_BUFFERED_BYTES = 256 * 1024;
+
+const encoder = new TextEncoder();
+const HEARTBEAT = encoder.encode(': ping\n\n');
+// Event ids are only meaningful to the worker that issued them
+const BOOT_ID = `${process.pid.toString(36)}${Date.now().toString(36)}`;
+const subscribers = new Set();
+const recent = [];
+let sequence = 0;
+let heartbeatTimer = null;
+
+export const eventStats = { published: 0, delivered: 0, dropped: 0, opened: 0 };
+
+function send(subscriber, chunk) {
+  if (subscriber.controller.desiredSize < -MAX_BUFFERED_BYTES) {
+    eventStats.dropped++;
+    close(subscriber);
+    return false;
+  }
+  try {
+    subscriber.controller.enqueue(chunk);
+    return true;
+  } catch {
+    // The client went away before its abort signal fired
+    close(subscriber);
+    return false;
+  }
+}
+
+function close(subscriber) {
+  if (!subscribers.delete(subscriber)) return;
+  clearTimeout(subscriber.expiryTimer);
+  try {
+    subscriber.controller.close();
+  } catch {
+    // Already closed by the client
+  }
+  if (subscribers.size === 0) {
+    clearInterval(heartbeatTimer);
+    heartbeatTimer = null;
+  }
+}
+
+// Keeps proxies from timing out idle connections; one timer for all of them
+function ensureHeartbeat() {
+  if (heartbeatTimer) return;
+  heartbeatTimer = setInterval(() => {
+    for (const subscriber of subscribers) send(subscriber, HEARTBEAT);
+  }, HEARTBEAT_MS);
+  heartbeatTimer.unref?.();
+}
+
+export function publishEvent(siteId, type, data, ts = Date.now()) {
+  const id = `${BOOT_ID}-${++sequence}`;
+  const chunk = encoder.encode(`id: ${id}\nevent: ${type}\ndata: ${JSON.stringify({ ...data, ts })}\n\n`);
+  eventStats.published++;
+
+  recent.push({ sequence, siteId, chunk });
+  if (recent.length > REPLAY_SIZE) recent.shift();
+
+  for (const subscriber of subscribers) {
+    if (subscriber.siteId === siteId && send(subscriber, chunk)) {
+      eventStats.delivered++;
+    }
+  }
+}
+
+function replay(subscriber, lastEventId) {
+  const [boot, last] = lastEventId.split('-');
+  const lastSequence = parseInt(last, 10);
+  const oldest = recent[0]?.sequence ?? sequence + 1;
+
+  // Another worker, a restart or a gap larger than the buffer: the client reloads instead
+  if (boot !== BOOT_ID || !(lastSequence >= oldest - 1 && lastSequence <= sequence)) {
+    send(subscriber, encoder.encode('event: resync\ndata: {}\n\n'));
+    return;
+  }
+  for (const event of recent) {
+    if (event.sequence > lastSequence && event.siteId === subscriber.siteId) {
+      send(subscriber, event.chunk);
+    }
+  }
+}
+
+export function openEventStream(siteId, { lastEventId = null, signal = null, expiresAt = 0 } = {}) {
+  let subscriber = null;
+
+  return new ReadableStream({
+    start(controller) {
+      subscriber = { siteId, controller, expiryTimer: null };
+      subscribers.add(subscriber);
+      eventStats.opened++;
+      controller.enqueue(encoder.encode('retry: 3000\n\n'));
+      if (lastEventId) replay(subscriber, lastEventId);
+      ensureHeartbeat();
+
+      signal?.addEventListener('abort', () => close(subscriber));
+      // The connection must not outlive the token that opened it
+      if (expiresAt) {
+        subscriber.expiryTimer = setTimeout(() => close(subscriber), Math.max(0, expiresAt - Date.now()));
+        subscriber.expiryTimer.unref?.();
+      }
+    },
+    cancel() {
+      close(subscriber);
+    }
+  }, new ByteLengthQueuingStrategy({ highWaterMark: 64 * 1024 }));
+}
+
+export function openStreamCount() {
+  return subscribers.size;
+}
+
+export function closeAllStreams() {
+  for (const subscriber of [...subscribers]) close(subscriber);
+}
@@ -0,0 +1,66 @@
+// Cache invalidation bus over MongoDB change streams. Every worker watches the
+// collections it caches, so a write handled by one PM2 instance evicts the
+// stale entries of all the others. Change streams need a replica set (a
+// single-node one is enough); when the stream is unavailable the caller is
+// told through onStatus and falls back to short TTLs while we reconnect.
+const RECONNECT_MIN_MS = 500;
+const RECONNECT_MAX_MS = 30000;
+
+export function watchCollections(database, { collections, match = {}, onChange, onStatus }) {
+  let stream = null;
+  let delay = RECONNECT_MIN_MS;
+  let timer = null;
+  let stopped = false;
+
+  const reconnect = (error) => {
+    if (stopped || timer) return;
+    onStatus({ connected: false, error });
+    timer = setTimeout(() => {
+      timer = null;
+      open();
+    }, delay);
+    timer.unref?.();
+    delay = Math.min(delay * 2, RECONNECT_MAX_MS);
+  };
+
+  const open = () => {
+    const current = database.watch(
+      [{ $match: { ...match, 'ns.coll': { $in: collections } } }],
+      // Deletes carry only the _id; updates look up the document to know its site
+      { fullDocument: 'updateLookup' }
+    );
+    stream = current;
+
+    // The first batch (even empty) carries a resume token: the stream is live
+    let live = false;
+    current.on('resumeTokenChanged', () => {
+      if (live || stream !== current) return;
+      live = true;
+      delay = RECONNECT_MIN_MS;
+      onStatus({ connected: true });
+    });
+    current.on('change', onChange);
+    // The driver resumes transient errors on its own; anything reaching us closed the stream
+    current.on('error', (error) => {
+      if (stream !== current) return;
+      stream = null;
+      current.close().catch(() => {});
+      reconnect(error);
+    });
+    current.on('close', () => {
+      if (stream !== current) return;
+      stream = null;
+      reconnect(null);
+    });
+  };
+
+  open();
+
+  return async function stop() {
+    stopped = true;
+    clearTimeout(timer);
+    const current = stream;
+    stream = null;
+    await current?.close();
+  };
+}
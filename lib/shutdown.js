@@ -0,0 +1,36 @@
+// Graceful shutdown hooks shared across bundles (instrumentation and API routes).
+// Next.js only leaves SIGTERM/SIGINT to us when NEXT_MANUAL_SIG_HANDLE=true
+// (set in ecosystem.config.js); the hooks then run before the process exits.
+const SHUTDOWN_TIMEOUT = 4000; // below PM2 kill_timeout (5000ms)
+
+const hooks = globalThis.__getyoursiteShutdownHooks || (globalThis.__getyoursiteShutdownHooks = new Map());
+
+export function onShutdown(name, hook) {
+  hooks.set(name, hook);
+}
+
+async function runShutdownHooks(signal) {
+  console.log(`${signal} received, running ${hooks.size} shutdown hook(s)`);
+
+  const timeout = new Promise(resolve => setTimeout(resolve, SHUTDOWN_TIMEOUT).unref());
+  const all = Promise.allSettled([...hooks].map(async ([name, hook]) => {
+    try {
+      await hook();
+    } catch (error) {
+      console.error(`Shutdown hook ${name} failed:`, error);
+    }
+  }));
+
+  await Promise.race([all, timeout]);
+}
+
+export function installShutdownHandlers() {
+  if (globalThis.__getyoursiteShutdownInstalled) return;
+  globalThis.__getyoursiteShutdownInstalled = true;
+
+  for (const signal of ['SIGTERM', 'SIGINT']) {
+    process.once(signal, () => {
+      runShutdownHooks(signal).finally(() => process.exit(0));
+    });
+  }
+}
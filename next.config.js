@@ -1,11 +1,15 @@
 const nextConfig = {
-  // output: 'standalone', // Disabled to fix PM2 compatibility issue
+  // PM2 runs .next/standalone/server.js directly (see ecosystem.config.js);
+  // scripts/prepare-standalone.js copies static/public assets after each build
+  output: 'standalone',
   images: {
     unoptimized: true,
   },
   experimental: {
     // Remove if not using Server Components
     serverComponentsExternalPackages: ['mongodb'],
+    // instrumentation.js warms up the MongoDB connection at boot
+    instrumentationHook: true,
   },
   webpack(config, { dev }) {
     if (dev) {
@@ -30,7 +34,7 @@ const nextConfig = {
           { key: "X-Frame-Options", value: "ALLOWALL" },
           { key: "Content-Security-Policy", value: "frame-ancestors *;" },
           { key: "Access-Control-Allow-Origin", value: process.env.CORS_ORIGINS || "*" },
-          { key: "Access-Control-Allow-Methods", value: "GET, POST, PUT, DELETE, OPTIONS" },
+          { key: "Access-Control-Allow-Methods", value: "GET, POST, PUT, PATCH, DELETE, OPTIONS" },
           { key: "Access-Control-Allow-Headers", value: "*" },
         ],
       },
@@ -0,0 +1,32 @@
+// Copies what `next build` leaves out of .next/standalone so that
+// `node .next/standalone/server.js` can serve the whole site on its own.
+const fs = require('fs');
+const path = require('path');
+
+const root = path.join(__dirname, '..');
+const standaloneDir = path.join(root, '.next', 'standalone');
+
+if (!fs.existsSync(path.join(standaloneDir, 'server.js'))) {
+  console.log('No standalone build found (output: \'standalone\' disabled?), nothing to prepare');
+  process.exit(0);
+}
+
+// Static chunks and public assets are not traced into the standalone folder
+for (const dir of [path.join('.next', 'static'), 'public']) {
+  const source = path.join(root, dir);
+  const target = path.join(standaloneDir, dir);
+  if (!fs.existsSync(source)) continue;
+
+  fs.rmSync(target, { recursive: true, force: true });
+  fs.cpSync(source, target, { recursive: true });
+  console.log(`Copied ${dir} -> .next/standalone/${dir}`);
+}
+
+// Link .env instead of copying it so edits apply on the next restart without a rebuild
+const envSource = path.join(root, '.env');
+const envTarget = path.join(standaloneDir, '.env');
+if (fs.existsSync(envSource)) {
+  fs.rmSync(envTarget, { force: true });
+  fs.symlinkSync(path.relative(standaloneDir, envSource), envTarget);
+  console.log('Linked .env -> .next/standalone/.env');
+}
@@ -263,7 +263,8 @@ create_config_files() {
     "scripts": {
         "dev": "next dev --hostname 0.0.0.0 --port 3000",
         "build": "next build",
-        "start": "next start --hostname 0.0.0.0 --port 3000",
+        "postbuild": "node scripts/prepare-standalone.js",
+        "start": "node .next/standalone/server.js",
         "lint": "next lint"
     },
     "dependencies": {
@@ -321,6 +322,12 @@ const nextConfig = {
   output: 'standalone',
   poweredByHeader: false,
   compress: true,
+  experimental: {
+    serverComponentsExternalPackages: ['mongodb'],
+    // instrumentation.js: connexion MongoDB au démarrage et arrêt propre sur SIGTERM
+    // (requis par NEXT_MANUAL_SIG_HANDLE dans ecosystem.config.js)
+    instrumentationHook: true,
+  },
 }
 
 module.exports = nextConfig
@@ -446,12 +453,23 @@ copy_source_files() {
         cp -r "$SCRIPT_DIR/components"/* "$PROJECT_DIR/components/" 2>/dev/null || true
         cp -r "$SCRIPT_DIR/lib"/* "$PROJECT_DIR/lib/" 2>/dev/null || true
         cp -r "$SCRIPT_DIR/hooks"/* "$PROJECT_DIR/hooks/" 2>/dev/null || true
+        # Démarrage (connexion MongoDB) et arrêt propre du serveur
+        cp "$SCRIPT_DIR/instrumentation.js" "$PROJECT_DIR/"
         
         print_success "Fichiers source copiés depuis le répertoire existant"
     else
         print_warning "Fichiers source non trouvés, création des fichiers de base..."
         create_basic_files
     fi
+
+    # Préparation du build standalone (assets statiques copiés après chaque build, cf. postbuild)
+    if [[ -f "$SCRIPT_DIR/scripts/prepare-standalone.js" ]]; then
+        mkdir -p "$PROJECT_DIR/scripts"
+        cp -r "$SCRIPT_DIR/scripts"/* "$PROJECT_DIR/scripts/"
+    else
+        print_warning "scripts/prepare-standalone.js introuvable, postbuild désactivé (assets statiques à copier à la main)"
+        (cd "$PROJECT_DIR" && npm pkg delete scripts.postbuild)
+    fi
 }
 
 # Création des fichiers de base si les sources ne sont pas disponibles
@@ -648,10 +666,15 @@ install_and_build() {
     
     print_step "Build de l'application..."
     
-    # Build de production
+    # Build de production (le postbuild prépare .next/standalone)
     yarn build
     
-    print_success "Application buildée avec succès"
+    if [[ ! -f .next/standalone/server.js ]] || [[ ! -d .next/standalone/.next/static ]]; then
+        print_error "Build standalone incomplet (.next/standalone/server.js ou assets statiques manquants)"
+        exit 1
+    fi
+    
+    print_success "Application buildée avec succès (standalone)"
 }
 
 # Configuration PM2
@@ -660,13 +683,23 @@ setup_pm2() {
     
     cd "$PROJECT_DIR"
     
+    # NEXT_MANUAL_SIG_HANDLE coupe la gestion SIGTERM de Next : seulement si
+    # instrumentation.js a été copié (fichiers de base sinon)
+    local sig_handle_env=""
+    if [[ -f "$PROJECT_DIR/instrumentation.js" ]]; then
+        sig_handle_env="
+      // Let instrumentation.js handle SIGTERM so buffered view counts are flushed
+      NEXT_MANUAL_SIG_HANDLE: 'true',"
+    fi
+
     # Configuration PM2
     cat > ecosystem.config.js << EOF
 module.exports = {
   apps: [{
     name: '${PROJECT_NAME}',
-    script: 'yarn',
-    args: 'start',
+    // Standalone build: node runs the traced server directly, no yarn/next CLI in between
+    script: '.next/standalone/server.js',
+    interpreter: 'node',
     cwd: '${PROJECT_DIR}',
     instances: 1,
     autorestart: true,
@@ -675,14 +708,17 @@ module.exports = {
     env: {
       NODE_ENV: 'production',
       PORT: 3000,
-      HOSTNAME: '0.0.0.0'
+      HOSTNAME: '0.0.0.0',${sig_handle_env}
+      // Outside .next/standalone so archives survive rebuilds
+      MESSAGE_ARCHIVE_DIR: '${PROJECT_DIR}/archives'
     },
     error_file: '/var/log/pm2/${PROJECT_NAME}-error.log',
     out_file: '/var/log/pm2/${PROJECT_NAME}-out.log',
     log_file: '/var/log/pm2/${PROJECT_NAME}.log',
     time: true,
     kill_timeout: 5000,
-    wait_ready: true,
+    // server.js never calls process.send('ready'); waiting for it only stalled restarts for listen_timeout
+    wait_ready: false,
     listen_timeout: 10000
   }]
 }
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Admin live feed benchmark: many concurrent SSE connections on /api/admin/events.
+
+Opens N connections with a raw asyncio client, reads the server memory before
+and after from /api/admin/metrics, then publishes draft publications through
+the admin API and measures how long each event takes to reach every connection.
+
+    python -m tests.bench_events --connections 1000 --events 20 --json test-reports/events.json
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+
+from tests.conftest import ADMIN_CREDENTIALS, BASE_URL, REQUEST_TIMEOUT
+
+
+class SseConnection:
+    """One EventSource-like connection; records when each event type/marker arrives"""
+
+    def __init__(self, token=None, path="/api/admin/events"):
+        self.token = token
+        self.path = path
+        self.reader = None
+        self.writer = None
+        self.received = {}
+        self.payloads = {}
+        self.status = None
+
+    async def open(self, base_url=BASE_URL, headers=None):
+        url = urlparse(base_url)
+        self.reader, self.writer = await asyncio.open_connection(url.hostname, url.port or 80)
+        lines = [f"GET {self.path} HTTP/1.1", f"Host: {url.netloc}",
+                 "Accept: text/event-stream", "Cache-Control: no-cache"]
+        if self.token:
+            lines.append(f"Authorization: Bearer {self.token}")
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        self.status = int(head.split(b" ", 2)[1])
+        if b"chunked" in head.lower():
+            self.reader = ChunkedLines(self.reader)
+        return self.status
+
+    async def listen(self):
+        """Parse events until the connection closes; keyed by the data's title or _id"""
+        event = {}
+        async for raw in self.reader:
+            line = raw.decode().rstrip("\r\n")
+            if line:
+                field, _, value = line.partition(":")
+                event[field] = value.lstrip(" ")
+                continue
+            if "data" in event:
+                data = json.loads(event["data"])
+                key = data.get("title") or data.get("_id")
+                self.received[(event.get("event"), key)] = time.time()
+                self.payloads[(event.get("event"), key)] = data
+            event = {}
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+
+
+class ChunkedLines:
+    """Line iterator over an HTTP/1.1 chunked body"""
+
+    def __init__(self, reader):
+        self.reader = reader
+        self.buffer = b""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while b"\n" not in self.buffer:
+            size = int((await self.reader.readuntil(b"\r\n")).strip(), 16)
+            if size == 0:
+                raise StopAsyncIteration
+            self.buffer += (await self.reader.readexactly(size + 2))[:-2]
+        line, _, self.buffer = self.buffer.partition(b"\n")
+        return line + b"\n"
+
+
+def raise_open_files_limit(needed):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+
+def metrics(token):
+    return requests.get(f"{BASE_URL}/api/admin/metrics", headers={"Authorization": f"Bearer {token}"},
+                        timeout=REQUEST_TIMEOUT).json()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def run(token, connections=1000, events=20, interval=0.2, batch=100):
+    """Hold `connections` streams open, publish `events` changes; returns the report"""
+    headers = {"Authorization": f"Bearer {token}"}
+    raise_open_files_limit(connections + 256)
+    before = metrics(token)
+    clients = [SseConnection(token) for _ in range(connections)]
+    # Open in batches so the listen backlog is not the thing being measured
+    for start in range(0, connections, batch):
+        statuses = await asyncio.gather(*(client.open() for client in clients[start:start + batch]))
+        assert set(statuses) == {200}, f"Unexpected statuses {set(statuses)}"
+    listeners = [asyncio.create_task(client.listen()) for client in clients]
+    await asyncio.sleep(1)
+    opened = metrics(token)
+
+    sent = {}
+    created = []
+    try:
+        for _ in range(events):
+            title = f"sse-{uuid.uuid4().hex[:10]}"
+            sent[title] = time.time()
+            response = await asyncio.to_thread(
+                requests.post, f"{BASE_URL}/api/admin/publications", headers=headers, timeout=REQUEST_TIMEOUT,
+                json={"title": title, "content": "Live feed benchmark.", "author": "Bench", "status": "draft"})
+            created.append(response.json()["publication"]["id"])
+            await asyncio.sleep(interval)
+        await asyncio.sleep(2)
+    finally:
+        for client in clients:
+            client.close()
+        for listener in listeners:
+            listener.cancel()
+        for publication_id in created:
+            requests.delete(f"{BASE_URL}/api/admin/publications/{publication_id}", headers=headers,
+                            timeout=REQUEST_TIMEOUT)
+
+    latencies = []
+    missing = 0
+    for client in clients:
+        for title, sent_at in sent.items():
+            received_at = client.received.get(("publication.created", title))
+            if received_at is None:
+                missing += 1
+            else:
+                latencies.append((received_at - sent_at) * 1000)
+
+    rss_delta = opened["memory"]["rss"] - before["memory"]["rss"]
+    return {
+        "connections": connections,
+        "events": events,
+        "deliveries": len(latencies),
+        "missing": missing,
+        "latency_ms": {"p50": round(percentile(latencies, 50), 1), "p95": round(percentile(latencies, 95), 1),
+                       "p99": round(percentile(latencies, 99), 1), "max": round(max(latencies), 1),
+                       "mean": round(statistics.mean(latencies), 1)} if latencies else {},
+        "rss_mb": {"before": round(before["memory"]["rss"] / 2**20, 1), "open": round(opened["memory"]["rss"] / 2**20, 1)},
+        "rss_per_connection_kb": round(rss_delta / 1024 / connections, 1),
+        "server_events": opened.get("events", {})
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hold many admin SSE connections and time event delivery")
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--json", type=Path, help="Write the report to this file")
+    args = parser.parse_args(argv)
+
+    token = requests.post(f"{BASE_URL}/api/admin/login", json=ADMIN_CREDENTIALS, timeout=REQUEST_TIMEOUT).json()["token"]
+    report = asyncio.run(run(token, args.connections, args.events))
+
+    print(f"{report['connections']} connections, {report['deliveries']} deliveries, {report['missing']} missing")
+    print(f"latency {report['latency_ms']}")
+    print(f"rss {report['rss_mb']['before']}MB -> {report['rss_mb']['open']}MB "
+          f"(~{report['rss_per_connection_kb']}KB per connection)")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
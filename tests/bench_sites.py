@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Multi-site benchmark: many virtual hosts served by one deployment.
+
+Registers N sites through /api/admin/sites (bench-NNNN.sites.test), then
+drives every host concurrently through /api/content and /api/publications
+with the matching Host header. Reports per-site latency and the server's
+memory and content cache counters from /api/admin/metrics.
+
+    python -m tests.bench_sites --sites 500 --rounds 5 --json test-reports/sites.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from tests.conftest import ADMIN_CREDENTIALS, BASE_URL, REQUEST_TIMEOUT, ApiClient
+
+PATHS = ("/content", "/publications")
+
+
+def bench_site_id(index):
+    return f"bench-{index:04d}"
+
+
+def bench_host(site_id):
+    return f"{site_id}.sites.test"
+
+
+def register(api, headers, sites, concurrency):
+    def create(index):
+        site_id = bench_site_id(index)
+        response = api.post("/admin/sites", json={"id": site_id, "name": f"Bench {index}",
+                                                  "hosts": [bench_host(site_id)]}, headers=headers)
+        assert response.status_code == 200, f"Site {site_id}: {response.status_code} {response.text}"
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(create, range(sites)))
+
+
+def cleanup(api, headers, sites, concurrency):
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda index: api.delete(f"/admin/sites/{bench_site_id(index)}", headers=headers), range(sites)))
+
+
+def drive(api, sites, rounds, concurrency):
+    """Request every path of every host `rounds` times; returns {site_id: [latency_ms, ...]}"""
+    def visit(index):
+        site_id = bench_site_id(index)
+        latencies = []
+        for _ in range(rounds):
+            for path in PATHS:
+                start = time.perf_counter()
+                response = api.get(path, headers={"Host": bench_host(site_id)})
+                latencies.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200, f"{site_id} {path}: {response.status_code}"
+        return site_id, latencies
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return dict(pool.map(visit, range(sites)))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(api, headers, sites=500, rounds=5, concurrency=64, keep=False):
+    """Register, drive and (unless keep) delete the bench sites; returns the report"""
+    before = api.get("/admin/metrics", headers=headers).json()
+    register(api, headers, sites, concurrency)
+    try:
+        start = time.perf_counter()
+        per_site = drive(api, sites, rounds, concurrency)
+        elapsed = time.perf_counter() - start
+        after = api.get("/admin/metrics", headers=headers).json()
+    finally:
+        if not keep:
+            cleanup(api, headers, sites, concurrency)
+
+    medians = [statistics.median(latencies) for latencies in per_site.values()]
+    p95s = [percentile(latencies, 95) for latencies in per_site.values()]
+    everything = [ms for latencies in per_site.values() for ms in latencies]
+    return {
+        "sites": sites,
+        "requests": len(everything),
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(len(everything) / elapsed, 1),
+        "latency_ms": {"p50": round(percentile(everything, 50), 1), "p95": round(percentile(everything, 95), 1),
+                       "max": round(max(everything), 1)},
+        "per_site_ms": {"median_of_medians": round(statistics.median(medians), 1),
+                        "worst_median": round(max(medians), 1), "worst_p95": round(max(p95s), 1)},
+        "rss_mb": {"before": round(before["memory"]["rss"] / 2**20, 1), "after": round(after["memory"]["rss"] / 2**20, 1),
+                   "per_site_kb": round((after["memory"]["rss"] - before["memory"]["rss"]) / 1024 / sites, 1)},
+        "cache": after.get("sites", {})
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive many virtual hosts against one deployment")
+    parser.add_argument("--sites", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5, help="Requests per path and host")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--keep", action="store_true", help="Leave the bench sites registered")
+    parser.add_argument("--json", type=Path, help="Write the report to this file")
+    args = parser.parse_args(argv)
+
+    api = ApiClient(BASE_URL, REQUEST_TIMEOUT)
+    try:
+        token = api.post("/admin/login", json=ADMIN_CREDENTIALS).json()["token"]
+        report = run(api, {"Authorization": f"Bearer {token}"}, args.sites, args.rounds, args.concurrency, args.keep)
+    finally:
+        api.close()
+
+    print(f"{report['sites']} sites, {report['requests']} requests in {report['elapsed_s']}s "
+          f"({report['throughput_rps']} req/s)")
+    print(f"latency p50 {report['latency_ms']['p50']}ms, p95 {report['latency_ms']['p95']}ms; "
+          f"worst site median {report['per_site_ms']['worst_median']}ms, p95 {report['per_site_ms']['worst_p95']}ms")
+    print(f"rss {report['rss_mb']['before']}MB -> {report['rss_mb']['after']}MB "
+          f"(~{report['rss_mb']['per_site_kb']}KB per site); cache {report['cache'].get('content')}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
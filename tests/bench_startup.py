@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the standalone server.
+
+Restarts .next/standalone/server.js repeatedly and records, for each endpoint,
+the time from process start until its first successful response. Every
+endpoint is polled concurrently, so the numbers show which routes are held
+back by module loading or the MongoDB connection.
+
+    python -m tests.bench_startup --runs 10 --json test-reports/startup.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from tests.conftest import ADMIN_CREDENTIALS
+from tests.server_process import STANDALONE_SERVER, ServerProcess, content_ready
+
+ENDPOINTS = {
+    "GET /api/contact": {"path": "/contact"},
+    "GET /api/content": {"path": "/content", "ready": content_ready},
+    "GET /api/publications": {"path": "/publications"},
+    "POST /api/admin/login": {"path": "/admin/login", "method": "POST", "json": ADMIN_CREDENTIALS},
+}
+
+
+def run_once(timeout):
+    with ServerProcess() as server:
+        with ThreadPoolExecutor(max_workers=len(ENDPOINTS)) as pool:
+            futures = {
+                name: pool.submit(server.time_to_first_success, timeout=timeout, **spec)
+                for name, spec in ENDPOINTS.items()
+            }
+            return {name: future.result() * 1000 for name, future in futures.items()}
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "min_ms": round(ordered[0], 1),
+        "median_ms": round(statistics.median(ordered), 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 1),
+        "max_ms": round(ordered[-1], 1)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start time to first successful response")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--json", type=Path, help="Write raw samples and summary to this file")
+    args = parser.parse_args(argv)
+
+    if not STANDALONE_SERVER.exists():
+        print(f"❌ {STANDALONE_SERVER} not found, run `yarn build` first")
+        return 1
+
+    runs = []
+    for index in range(args.runs):
+        result = run_once(args.timeout)
+        runs.append(result)
+        print(f"run {index + 1}/{args.runs}: " + ", ".join(f"{name} {ms:.0f}ms" for name, ms in result.items()))
+
+    summary = {name: summarize([run[name] for run in runs]) for name in ENDPOINTS}
+
+    print(f"\n{'endpoint':<26}{'min':>9}{'median':>9}{'p95':>9}{'max':>9}")
+    for name, stats in summary.items():
+        print(f"{name:<26}{stats['min_ms']:>9}{stats['median_ms']:>9}{stats['p95_ms']:>9}{stats['max_ms']:>9}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"runs": runs, "summary": summary}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
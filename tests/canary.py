@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Synthetic canary with SLO tracking.
+
+Probes the public content and publications endpoints, admin login and a
+dry-run contact submission (validated by the server, never stored or sent) on
+a schedule, against several targets at once: typically through nginx and
+directly on port 3000. Every result goes into a local SQLite file; `report`
+computes rolling availability and latency windows, SLO burn rates, and tells
+proxy failures (nginx answers 502/504 while the app answers directly) apart
+from application failures and slowness.
+
+    python -m tests.canary run --target proxy=http://localhost --target direct=http://127.0.0.1:3000
+    python -m tests.canary report --window 1h --window 24h
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+
+import requests
+
+from tests.conftest import ADMIN_CREDENTIALS, REPO_ROOT
+
+DEFAULT_DB = REPO_ROOT / "test-reports" / "canary.sqlite"
+DEFAULT_TARGETS = ["proxy=http://localhost", "direct=http://127.0.0.1:3000"]
+PROBE_TIMEOUT = float(os.environ.get("GYS_CANARY_TIMEOUT", "5"))
+
+# Service level objectives, per probe and target
+AVAILABILITY_SLO = float(os.environ.get("GYS_SLO_AVAILABILITY", "0.995"))
+LATENCY_SLO = float(os.environ.get("GYS_SLO_LATENCY", "0.95"))
+LATENCY_THRESHOLD_MS = float(os.environ.get("GYS_SLO_LATENCY_MS", "500"))
+
+WINDOWS = {"5m": 300, "30m": 1800, "1h": 3600, "6h": 6 * 3600, "24h": 24 * 3600, "7d": 7 * 24 * 3600}
+# Multiwindow burn-rate alerts: (long window, short window, burn rate, severity)
+BURN_ALERTS = [("1h", "5m", 14.4, "page"), ("6h", "30m", 6.0, "page"), ("24h", "6h", 1.0, "ticket")]
+PROXY_ERROR_STATUSES = {502, 503, 504}
+
+CONTACT_DRY_RUN = {
+    "name": "Canary",
+    "email": "canary@example.com",
+    "subject": "Canary",
+    "message": "Vérification automatique du formulaire de contact (non envoyée)."
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS probes (
+    id INTEGER PRIMARY KEY,
+    round INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    target TEXT NOT NULL,
+    probe TEXT NOT NULL,
+    ok INTEGER NOT NULL,
+    status INTEGER,
+    latency_ms REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS probes_ts ON probes (ts);
+CREATE INDEX IF NOT EXISTS probes_series ON probes (target, probe, ts);
+"""
+
+
+def connect(path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+# --- Probes -----------------------------------------------------------------
+# Each probe returns (ok, status, error); None status means no HTTP response.
+
+def check_content(response):
+    return "hero" in response.json(), "content without hero"
+
+
+def check_publications(response):
+    return isinstance(response.json(), list), "publications is not a list"
+
+
+def check_login(response):
+    return bool(response.json().get("token")), "login without token"
+
+
+def check_dry_run(response):
+    return response.json().get("dryRun") is True, "contact not handled as a dry run"
+
+
+PROBES = {
+    "content": {"method": "GET", "path": "/api/content", "check": check_content},
+    "publications": {"method": "GET", "path": "/api/publications", "check": check_publications},
+    "admin_login": {"method": "POST", "path": "/api/admin/login", "check": check_login,
+                    "json": ADMIN_CREDENTIALS},
+    "contact_dry_run": {"method": "POST", "path": "/api/contact", "check": check_dry_run,
+                        "json": CONTACT_DRY_RUN, "needs_token": True},
+}
+
+
+def probe(session, base_url, name, token=None, host=None):
+    """Run one probe; returns (ok, status, latency_ms, error, response_json)"""
+    spec = PROBES[name]
+    headers = {"Host": host} if host else {}
+    if spec.get("needs_token"):
+        if not token:
+            return False, None, None, "no_token", None
+        headers.update({"Authorization": f"Bearer {token}", "X-Canary-Dry-Run": "true"})
+
+    start = time.perf_counter()
+    try:
+        response = session.request(spec["method"], base_url + spec["path"], json=spec.get("json"),
+                                   headers=headers, timeout=PROBE_TIMEOUT)
+        latency = (time.perf_counter() - start) * 1000
+    except requests.Timeout:
+        return False, None, (time.perf_counter() - start) * 1000, "timeout", None
+    except requests.ConnectionError:
+        return False, None, None, "connection", None
+
+    if response.status_code != 200:
+        return False, response.status_code, latency, f"http_{response.status_code}", None
+    try:
+        ok, message = spec["check"](response)
+        body = response.json()
+    except ValueError:
+        return False, response.status_code, latency, "invalid_json", None
+    return ok, response.status_code, latency, None if ok else message, body
+
+
+def probe_target(session, base_url, host=None):
+    """All probes against one target; login first so the dry run can use its token"""
+    results = {}
+    ok, status, latency, error, body = probe(session, base_url, "admin_login", host=host)
+    results["admin_login"] = (ok, status, latency, error)
+    token = body.get("token") if ok else None
+    for name in ("content", "publications", "contact_dry_run"):
+        results[name] = probe(session, base_url, name, token=token, host=host)[:4]
+    return results
+
+
+# --- Scheduler --------------------------------------------------------------
+
+def parse_target(value):
+    name, _, url = value.partition("=")
+    if not url:
+        raise argparse.ArgumentTypeError(f"Target must look like name=http://host:port, got {value!r}")
+    return name, url.rstrip("/")
+
+
+async def run_round(db, round_id, targets, sessions, host):
+    now = time.time()
+    outcomes = await asyncio.gather(*(
+        asyncio.to_thread(probe_target, sessions[name], url, host) for name, url in targets
+    ))
+    rows = [
+        (round_id, now, target, probe_name, int(ok), status, latency, error)
+        for (target, _), results in zip(targets, outcomes)
+        for probe_name, (ok, status, latency, error) in results.items()
+    ]
+    db.executemany(
+        "INSERT INTO probes (round, ts, target, probe, ok, status, latency_ms, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows
+    )
+    db.commit()
+    return rows
+
+
+def prune(db, retention_days):
+    db.execute("DELETE FROM probes WHERE ts < ?", (time.time() - retention_days * 86400,))
+    db.commit()
+
+
+async def run(db, targets, interval, host=None, rounds=None, retention_days=30):
+    sessions = {name: requests.Session() for name, _ in targets}
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    round_id = (db.execute("SELECT COALESCE(MAX(round), 0) FROM probes").fetchone()[0]) + 1
+    started = time.monotonic()
+    done = 0
+    try:
+        while not stop.is_set() and (rounds is None or done < rounds):
+            rows = await run_round(db, round_id, targets, sessions, host)
+            failures = [f"{target}/{name}: {error or status}" for _, _, target, name, ok, status, _, error in rows if not ok]
+            print(f"[{time.strftime('%H:%M:%S')}] round {round_id}: "
+                  f"{len(rows) - len(failures)}/{len(rows)} ok" + (f" - {', '.join(failures)}" if failures else ""),
+                  flush=True)
+            if round_id % max(1, int(3600 / interval)) == 0:
+                prune(db, retention_days)
+            round_id += 1
+            done += 1
+
+            # Fixed schedule: a slow round shortens the next wait instead of drifting
+            next_at = started + done * interval
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=max(0, next_at - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for session in sessions.values():
+            session.close()
+
+
+# --- Report -----------------------------------------------------------------
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def burn_rate(bad, total, slo):
+    """How fast the error budget is spent: 1.0 uses exactly the budget over the SLO period"""
+    if not total:
+        return None
+    return (bad / total) / (1 - slo)
+
+
+def window_stats(db, target, probe_name, seconds, now):
+    rows = db.execute(
+        "SELECT ok, latency_ms FROM probes WHERE target = ? AND probe = ? AND ts >= ?",
+        (target, probe_name, now - seconds)
+    ).fetchall()
+    total = len(rows)
+    failed = sum(1 for ok, _ in rows if not ok)
+    latencies = [latency for ok, latency in rows if ok and latency is not None]
+    slow = sum(1 for latency in latencies if latency > LATENCY_THRESHOLD_MS)
+    return {
+        "samples": total,
+        "availability": (total - failed) / total if total else None,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "availability_burn": burn_rate(failed, total, AVAILABILITY_SLO),
+        "latency_burn": burn_rate(slow, len(latencies), LATENCY_SLO),
+    }
+
+
+def attribute_failures(db, since, proxy, direct):
+    """Pair each round's proxy and direct results: who is to blame for each failure"""
+    rows = db.execute(
+        "SELECT round, target, probe, ok, status, latency_ms FROM probes WHERE ts >= ? AND target IN (?, ?)",
+        (since, proxy, direct)
+    ).fetchall()
+    pairs = {}
+    for round_id, target, probe_name, ok, status, latency in rows:
+        pairs.setdefault((round_id, probe_name), {})[target] = (ok, status, latency)
+
+    counts = {"proxy": 0, "app": 0, "app_slow": 0}
+    for pair in pairs.values():
+        if proxy not in pair or direct not in pair:
+            continue
+        (proxy_ok, proxy_status, _), (direct_ok, _, direct_latency) = pair[proxy], pair[direct]
+        if not proxy_ok and direct_ok and proxy_status in PROXY_ERROR_STATUSES:
+            counts["proxy"] += 1
+        elif not direct_ok:
+            counts["app"] += 1
+        elif direct_latency is not None and direct_latency > LATENCY_THRESHOLD_MS:
+            counts["app_slow"] += 1
+    return counts
+
+
+def alerts_for(series):
+    fired = []
+    for long_window, short_window, threshold, severity in BURN_ALERTS:
+        for kind in ("availability_burn", "latency_burn"):
+            long_burn = series[long_window][kind]
+            short_burn = series[short_window][kind]
+            if long_burn is not None and short_burn is not None and long_burn >= threshold and short_burn >= threshold:
+                fired.append(f"{severity}: {kind.split('_')[0]} burn {long_burn:.1f}x over {long_window} "
+                             f"(and {short_burn:.1f}x over {short_window})")
+    return fired
+
+
+def build_report(db, windows, now=None):
+    now = now or time.time()
+    needed = sorted(set(windows) | {w for alert in BURN_ALERTS for w in alert[:2]}, key=WINDOWS.get)
+    series = db.execute("SELECT DISTINCT target, probe FROM probes ORDER BY target, probe").fetchall()
+    report = {"generated": now, "slo": {"availability": AVAILABILITY_SLO, "latency": LATENCY_SLO,
+                                        "latency_threshold_ms": LATENCY_THRESHOLD_MS}, "series": []}
+
+    for target, probe_name in series:
+        stats = {window: window_stats(db, target, probe_name, WINDOWS[window], now) for window in needed}
+        # Trend: the last hour against the day before it
+        day = stats["24h"]["p95_ms"]
+        hour = stats["1h"]["p95_ms"]
+        report["series"].append({
+            "target": target,
+            "probe": probe_name,
+            "windows": {window: stats[window] for window in windows},
+            "alerts": alerts_for(stats),
+            "p95_trend": (hour / day) if hour and day else None
+        })
+
+    targets = [row[0] for row in db.execute("SELECT DISTINCT target FROM probes")]
+    if "proxy" in targets and "direct" in targets:
+        report["attribution"] = {
+            window: attribute_failures(db, now - WINDOWS[window], "proxy", "direct") for window in windows
+        }
+    return report
+
+
+def fmt(value, spec, suffix=""):
+    return "-" if value is None else f"{value:{spec}}{suffix}"
+
+
+def print_report(report, windows):
+    print(f"SLO: availability {report['slo']['availability']:.2%}, "
+          f"{report['slo']['latency']:.0%} under {report['slo']['latency_threshold_ms']:.0f}ms\n")
+    header = f"{'target':<8}{'probe':<17}{'window':>7}{'n':>7}{'avail':>9}{'p50':>8}{'p95':>8}{'burn A':>8}{'burn L':>8}"
+    print(header)
+    for entry in report["series"]:
+        for window in windows:
+            stats = entry["windows"][window]
+            print(f"{entry['target']:<8}{entry['probe']:<17}{window:>7}{stats['samples']:>7}"
+                  f"{fmt(stats['availability'], '.2%'):>9}{fmt(stats['p50_ms'], '.0f'):>8}{fmt(stats['p95_ms'], '.0f'):>8}"
+                  f"{fmt(stats['availability_burn'], '.1f'):>8}{fmt(stats['latency_burn'], '.1f'):>8}")
+        if entry["p95_trend"] and entry["p95_trend"] > 1.5:
+            print(f"  ↗ p95 over the last hour is {entry['p95_trend']:.1f}x the 24h value")
+        for alert in entry["alerts"]:
+            print(f"  ⚠️  {alert}")
+
+    for window, counts in report.get("attribution", {}).items():
+        print(f"\nFailures over {window}: {counts['proxy']} proxy only (nginx 5xx, app fine), "
+              f"{counts['app']} app down, {counts['app_slow']} app slow")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Probe the targets on a schedule")
+    run_parser.add_argument("--target", type=parse_target, action="append",
+                            help="name=base_url, repeatable (default: proxy=http://localhost direct=http://127.0.0.1:3000)")
+    run_parser.add_argument("--interval", type=float, default=30, help="Seconds between rounds")
+    run_parser.add_argument("--rounds", type=int, help="Stop after this many rounds")
+    run_parser.add_argument("--host", help="Host header to send (selects the site on multi-site deployments)")
+    run_parser.add_argument("--retention-days", type=int, default=30)
+
+    report_parser = sub.add_parser("report", help="Availability, latency and burn rates from the recorded probes")
+    report_parser.add_argument("--window", action="append", choices=WINDOWS, help="Repeatable (default: 1h, 24h)")
+    report_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args(argv)
+    with closing(connect(args.db)) as db:
+        if args.command == "run":
+            targets = args.target or [parse_target(value) for value in DEFAULT_TARGETS]
+            asyncio.run(run(db, targets, args.interval, args.host, args.rounds, args.retention_days))
+        else:
+            windows = args.window or ["1h", "24h"]
+            report = build_report(db, windows)
+            if args.json:
+                print(json.dumps(report, indent=2))
+            else:
+                print_report(report, windows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
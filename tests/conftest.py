@@ -0,0 +1,221 @@
+"""
+Shared fixtures for the GetYourSite backend test suite.
+
+The suite runs against a live server (GYS_BASE_URL, default http://localhost:3000).
+Contact form tests need the server started with TEST_MODE=true so every test
+gets its own rate limit namespace.
+"""
+
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+import requests
+
+BASE_URL = os.environ.get("GYS_BASE_URL", "http://localhost:3000").rstrip("/")
+REQUEST_TIMEOUT = float(os.environ.get("GYS_TEST_TIMEOUT", "5"))
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+ADMIN_CREDENTIALS = {
+    "username": os.environ.get("ADMIN_USERNAME", "admin_getyoursite"),
+    "password": os.environ.get("ADMIN_PASSWORD", "AdminGYS2024")
+}
+
+
+class ApiClient:
+    """Thin wrapper around requests.Session with the API prefix and a default timeout"""
+
+    def __init__(self, base_url, timeout):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def request(self, method, path, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, f"{self.base_url}/api{path}", **kwargs)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--json-report",
+        default=str(REPO_ROOT / "test-reports" / "results.json"),
+        help="Write per-test outcomes and durations to this JSON file"
+    )
+
+
+_results_store = []
+
+
+def pytest_runtest_logreport(report):
+    # Under xdist the controller receives every worker report, so it sees the whole run
+    if report.when != "call" and not (report.when == "setup" and report.outcome != "passed"):
+        return
+    node = getattr(report, "node", None)
+    _results_store.append({
+        "test": report.nodeid,
+        "outcome": report.outcome,
+        "duration": round(report.duration, 4),
+        "worker": node.gateway.id if node is not None else "master"
+    })
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        return
+
+    path = Path(config.getoption("--json-report"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    summary = {}
+    for result in _results_store:
+        summary[result["outcome"]] = summary.get(result["outcome"], 0) + 1
+
+    path.write_text(json.dumps({
+        "base_url": BASE_URL,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "exit_status": int(exitstatus),
+        "summary": summary,
+        "total_duration": round(sum(r["duration"] for r in _results_store), 4),
+        "tests": sorted(_results_store, key=lambda r: r["duration"], reverse=True)
+    }, indent=2))
+
+
+@pytest.fixture(scope="session")
+def worker_id(request):
+    if hasattr(request.config, "workerinput"):
+        return request.config.workerinput["workerid"]
+    return "master"
+
+
+@pytest.fixture(scope="session")
+def api():
+    """HTTP session shared by all tests of a worker; skips the run if the server is down"""
+    client = ApiClient(BASE_URL, REQUEST_TIMEOUT)
+    try:
+        client.get("", timeout=2)
+    except requests.ConnectionError:
+        client.close()
+        pytest.skip(f"GetYourSite API not reachable at {BASE_URL}")
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def admin_token(api):
+    response = api.post("/admin/login", json=ADMIN_CREDENTIALS)
+    assert response.status_code == 200, f"Admin login failed: {response.status_code} {response.text}"
+    data = response.json()
+    assert data.get("success") and data.get("token"), f"Login response missing token: {data}"
+    return data["token"]
+
+
+@pytest.fixture(scope="session")
+def auth_headers(admin_token):
+    return {"Authorization": f"Bearer {admin_token}"}
+
+
+@pytest.fixture(scope="session")
+def test_mode(api, auth_headers):
+    """True when the server accepts per-test rate limit namespaces (TEST_MODE=true)"""
+    response = api.delete("/admin/test/rate-limit", params={"namespace": "probe"}, headers=auth_headers)
+    return response.status_code == 200
+
+
+@pytest.fixture
+def contact_headers(api, auth_headers, test_mode, worker_id):
+    """Headers giving the current test its own contact rate limit bucket"""
+    if not test_mode:
+        pytest.skip("Contact tests need the server started with TEST_MODE=true")
+
+    namespace = f"{worker_id}-{uuid.uuid4().hex[:12]}"
+    yield {**auth_headers, "X-Test-Run-Id": namespace}
+    api.delete("/admin/test/rate-limit", params={"namespace": namespace}, headers=auth_headers)
+
+
+@pytest.fixture(scope="session")
+def mongo_db():
+    """Direct database handle (MONGO_URL / DB_NAME) for dataset-backed performance tests"""
+    pymongo = pytest.importorskip("pymongo")
+    from tests.datagen import DB_NAME, MONGO_URL
+
+    if not DB_NAME:
+        pytest.fail("DB_NAME is not set (environment or .env): database assertions would read the wrong database")
+
+    client = pymongo.MongoClient(MONGO_URL, serverSelectionTimeoutMS=2000)
+    try:
+        client.admin.command("ping")
+    except pymongo.errors.PyMongoError:
+        client.close()
+        pytest.skip(f"MongoDB not reachable at {MONGO_URL}")
+    yield client[DB_NAME]
+    client.close()
+
+
+@pytest.fixture(scope="module")
+def dataset(mongo_db, test_mode):
+    """Restore the GYS_DATASET_SNAPSHOT snapshot (see tests/datagen.py) before the module runs"""
+    from tests.datagen import COLLECTIONS, restore
+
+    name = os.environ.get("GYS_DATASET_SNAPSHOT")
+    if not name:
+        pytest.skip("Set GYS_DATASET_SNAPSHOT to run dataset-backed performance tests")
+    # Restoring replaces the live collections: never against a production server
+    if not test_mode:
+        pytest.skip("Dataset restore needs the server started with TEST_MODE=true")
+    restore(mongo_db, name, COLLECTIONS)
+    return {collection: mongo_db[collection].estimated_document_count() for collection in COLLECTIONS}
+
+
+@pytest.fixture
+def site(api, auth_headers):
+    """A freshly registered site with its own content and data; yields (id, Host header)"""
+    site_id = f"test-{uuid.uuid4().hex[:10]}"
+    host = f"{site_id}.sites.test"
+    response = api.post("/admin/sites", json={"id": site_id, "hosts": [host]}, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    yield site_id, {"Host": host}
+    api.delete(f"/admin/sites/{site_id}", headers=auth_headers)
+
+
+@pytest.fixture
+def publication_factory(api, auth_headers):
+    """Create publications through the admin API and delete them after the test"""
+    created = []
+
+    def create(title="Test Publication", content="Publication created by the test suite.",
+               author="Test Author", status="draft"):
+        response = api.post(
+            "/admin/publications",
+            json={"title": title, "content": content, "author": author, "status": status},
+            headers=auth_headers
+        )
+        assert response.status_code == 200, f"Create failed: {response.status_code} {response.text}"
+        publication = response.json()["publication"]
+        created.append(publication["id"])
+        return publication
+
+    yield create
+
+    for publication_id in created:
+        api.delete(f"/admin/publications/{publication_id}", headers=auth_headers)
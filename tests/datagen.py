@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Synthetic dataset generator for MongoDB performance testing.
+
+Bulk-loads reproducible datasets into publications, contact_submissions and
+site_content, and snapshots / restores them so benchmarks start from
+identical states.
+
+    python -m tests.datagen --db gys_bench load --scale 100k --seed 42 --drop
+    python -m tests.datagen --db gys_bench load --scale 100k --sites 500
+    python -m tests.datagen --db gys_bench snapshot --name bench-100k
+    python -m tests.datagen --db gys_bench restore --name bench-100k
+
+Connection settings come from MONGO_URL and DB_NAME: the environment first,
+then the .env file the application reads. Commands that replace documents
+(load --drop, restore) refuse to run without an explicit --db, so the
+application's own database is never wiped by default.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from pymongo import MongoClient
+
+ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+
+
+def read_env_file(path=ENV_FILE):
+    """KEY=VALUE lines of the application's .env (comments and blank lines skipped)"""
+    values = {}
+    if path.is_file():
+        for line in path.read_text().splitlines():
+            key, sep, value = line.strip().partition("=")
+            if sep and not key.startswith("#"):
+                values[key.strip()] = value.strip().strip("'\"")
+    return values
+
+
+# Like Next.js, the process environment wins over .env
+_ENV = {**read_env_file(), **os.environ}
+MONGO_URL = _ENV.get("MONGO_URL", "mongodb://localhost:27017")
+DB_NAME = _ENV.get("DB_NAME")
+
+COLLECTIONS = ("publications", "contact_submissions", "site_content")
+DEFAULT_SITE_ID = "default"
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+BATCH_SIZE = 5_000
+BASE_DATE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Same limits as validateInput() in app/api/[[...path]]/route.js
+MAX_TITLE = 200
+MAX_CONTENT = 5_000
+MAX_AUTHOR = 100
+MAX_MESSAGE = 2_000
+# Same as buildPublicationSummary() in app/api/[[...path]]/route.js
+EXCERPT_LENGTH = 200
+WORDS_PER_MINUTE = 200
+
+WORDS = (
+    "site web conception refonte déploiement hébergement design responsive "
+    "performance sécurité optimisation référencement client projet boutique "
+    "application portfolio contenu page navigation mobile serveur domaine "
+    "certificat analyse audit maquette interface expérience utilisateur "
+    "moderne rapide fiable accompagnement devis maintenance évolution"
+).split()
+FIRST_NAMES = ["Pierre", "Sophie", "Lucas", "Camille", "Hugo", "Léa", "Nathan", "Chloé", "Louis", "Emma"]
+LAST_NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau"]
+DOMAINS = ["example.com", "example.org", "mail.example.net"]
+
+
+def parse_scale(value):
+    """Accept a named scale (1k, 100k, 1m) or a plain document count"""
+    key = value.lower()
+    if key in SCALES:
+        return SCALES[key]
+    try:
+        return int(key)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Unknown scale {value!r}, use one of {', '.join(SCALES)} or an integer")
+
+
+def sentence(rng, min_words, max_words):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def text_of_length(rng, length):
+    parts = []
+    size = 0
+    while size < length:
+        part = sentence(rng, 6, 18)
+        parts.append(part)
+        size += len(part) + 1
+    return " ".join(parts)[:length].rstrip()
+
+
+def content_length(rng):
+    # Log-normal around ~1200 chars with a long tail clipped at the API limit
+    return max(80, min(MAX_CONTENT, int(rng.lognormvariate(7.0, 0.6))))
+
+
+def created_at(rng, index, count, span_days):
+    # Newer documents are denser: the square root of the position skews towards BASE_DATE
+    position = ((index + rng.random()) / count) ** 0.5
+    return BASE_DATE - timedelta(days=span_days * (1 - position))
+
+
+def publication_summary(content):
+    """Excerpt and reading time as the API stores them, so loaded data needs no backfill"""
+    text = " ".join(content.split())
+    excerpt = text
+    if len(text) > EXCERPT_LENGTH:
+        cut = text[:EXCERPT_LENGTH]
+        last_space = cut.rfind(" ")
+        excerpt = (cut[:last_space] if last_space > EXCERPT_LENGTH / 2 else cut).rstrip() + "…"
+    words = len(text.split(" ")) if text else 0
+    return {"excerpt": excerpt, "readingTime": max(1, -(-words // WORDS_PER_MINUTE))}
+
+
+def make_publication(rng, index, count):
+    created = created_at(rng, index, count, span_days=3 * 365)
+    status = "published" if rng.random() < 0.7 else "draft"
+    updated = created + timedelta(hours=rng.expovariate(1 / 48)) if rng.random() < 0.3 else created
+    published = created + timedelta(minutes=rng.randint(0, 72 * 60)) if status == "published" else None
+
+    # Title before content: the draw order defines the seeded dataset
+    title = sentence(rng, 3, 10)[:MAX_TITLE]
+    content = text_of_length(rng, content_length(rng))
+
+    return {
+        "id": f"{int(created.timestamp() * 1000)}-{index:07x}",
+        "title": title,
+        "content": content,
+        **publication_summary(content),
+        "author": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"[:MAX_AUTHOR],
+        "status": status,
+        "createdAt": created,
+        "updatedAt": max(updated, published or updated),
+        "publishedAt": published
+    }
+
+
+def make_contact_submission(rng, index, count):
+    created = created_at(rng, index, count, span_days=2 * 365)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    age_days = (BASE_DATE - created).days
+
+    return {
+        "name": f"{first} {last}",
+        "email": f"{first.lower()}.{last.lower()}{index}@{rng.choice(DOMAINS)}",
+        "subject": sentence(rng, 2, 8)[:200],
+        "message": text_of_length(rng, rng.randint(40, MAX_MESSAGE)),
+        "ip": f"{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+        "createdAt": created,
+        # Older messages are much more likely to have been read
+        "read": rng.random() < min(0.98, 0.2 + age_days / 60)
+    }
+
+
+def make_site_content(rng, index, count):
+    if index == 0:
+        return {
+            "type": "main",
+            "hero": {
+                "title": "Créez votre",
+                "subtitle": "présence en ligne",
+                "description": sentence(rng, 15, 25),
+                "image": "https://images.unsplash.com/photo-1488590528505-98d2b5aba04b",
+                "stats": [{"number": f"{rng.randint(10, 99)}+", "label": "Sites créés"}]
+            },
+            "services": [
+                {"id": f"service-{i}", "icon": "Code2", "title": sentence(rng, 2, 4),
+                 "description": sentence(rng, 10, 20), "features": [sentence(rng, 2, 3) for _ in range(3)]}
+                for i in range(3)
+            ],
+            "portfolio": [
+                {"id": f"portfolio-{i}", "title": sentence(rng, 2, 4), "category": "Conception",
+                 "description": sentence(rng, 6, 12), "image": "https://images.unsplash.com/photo-1591439657848-9f4b9ce436b9"}
+                for i in range(3)
+            ],
+            "contact": {"email": "contact@getyoursite.com", "phone": "+33 (0)1 23 45 67 89", "location": "France"},
+            "createdAt": BASE_DATE,
+            "updatedAt": BASE_DATE
+        }
+
+    # Filler documents make findOne({type: 'main'}) pay for a realistic collection size
+    created = created_at(rng, index, count, span_days=365)
+    return {
+        "type": f"synthetic-{index:07d}",
+        "data": {"title": sentence(rng, 3, 8), "body": text_of_length(rng, rng.randint(200, 2000))},
+        "createdAt": created,
+        "updatedAt": created
+    }
+
+
+GENERATORS = {
+    "publications": make_publication,
+    "contact_submissions": make_contact_submission,
+    "site_content": make_site_content
+}
+
+
+def default_count(collection, scale):
+    if collection == "site_content":
+        return max(1, scale // 100)
+    return scale
+
+
+def site_ids(sites):
+    return [f"site-{index:04d}" for index in range(sites)] if sites else [DEFAULT_SITE_ID]
+
+
+def site_host(site_id):
+    return f"{site_id}.sites.test"
+
+
+def register_sites(db, sites):
+    """Register site-NNNN sites answering on site-NNNN.sites.test"""
+    now = datetime.now(timezone.utc)
+    db.sites.delete_many({"_id": {"$regex": "^site-[0-9]{4}$"}})
+    db.sites.insert_many([
+        {"_id": site_id, "name": site_id, "hosts": [site_host(site_id)], "createdAt": now, "updatedAt": now}
+        for site_id in site_ids(sites)
+    ])
+
+
+def load_collection(db, collection, count, seed, sites=0, site_id=None):
+    """Insert `count` generated documents, spread over `sites` sites or all owned by `site_id`"""
+    # One RNG per collection keeps each collection reproducible on its own
+    rng = random.Random(f"{seed}:{collection}")
+    generator = GENERATORS[collection]
+    target = db[collection]
+    owners = [site_id] if site_id else site_ids(sites)
+    inserted = 0
+    start = time.perf_counter()
+
+    batch = []
+    if collection == "site_content":
+        # Every site gets its main document; the rest of the collection is filler
+        batch = [{**generator(rng, 0, count), "siteId": site_id} for site_id in owners]
+    for index in range(len(batch) if collection == "site_content" else 0, count):
+        batch.append({**generator(rng, index, count), "siteId": owners[index % len(owners)]})
+        if len(batch) >= BATCH_SIZE:
+            inserted += len(target.insert_many(batch, ordered=False).inserted_ids)
+            batch = []
+    if batch:
+        inserted += len(target.insert_many(batch, ordered=False).inserted_ids)
+
+    elapsed = time.perf_counter() - start
+    print(f"  {collection}: {inserted} documents in {elapsed:.1f}s ({inserted / max(elapsed, 1e-9):,.0f} docs/s)")
+    return inserted
+
+
+def load(db, scale, seed, collections, drop=False, sites=0):
+    print(f"Loading scale={scale} seed={seed} sites={sites or 1} into {db.name}")
+    if sites:
+        register_sites(db, sites)
+    for collection in collections:
+        if drop:
+            db[collection].delete_many({})
+        load_collection(db, collection, default_count(collection, scale), seed, sites)
+
+
+def snapshot_name(collection, name):
+    return f"{collection}__snapshot_{name}"
+
+
+def snapshot(db, name, collections):
+    """Copy each collection server-side into <collection>__snapshot_<name>"""
+    for collection in collections:
+        db[collection].aggregate([{"$match": {}}, {"$out": snapshot_name(collection, name)}])
+        print(f"  {collection} -> {snapshot_name(collection, name)}")
+
+
+def restore(db, name, collections):
+    """Replace each collection with its snapshot; $out keeps the target's indexes"""
+    existing = set(db.list_collection_names())
+    for collection in collections:
+        source = snapshot_name(collection, name)
+        if source not in existing:
+            raise SystemExit(f"Snapshot {source} not found")
+        db[source].aggregate([{"$match": {}}, {"$out": collection}])
+        print(f"  {source} -> {collection}")
+
+
+def drop_snapshot(db, name, collections):
+    for collection in collections:
+        db.drop_collection(snapshot_name(collection, name))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mongo-url", default=MONGO_URL)
+    parser.add_argument("--db", help="Database name (default: DB_NAME from the environment or .env; "
+                                      "required by load --drop and restore)")
+    parser.add_argument("--collections", nargs="+", choices=COLLECTIONS, default=list(COLLECTIONS))
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    load_parser = sub.add_parser("load", help="Bulk-load a seeded dataset")
+    load_parser.add_argument("--scale", type=parse_scale, default=SCALES["1k"])
+    load_parser.add_argument("--seed", type=int, default=42)
+    load_parser.add_argument("--drop", action="store_true", help="Delete existing documents first instead of appending")
+    load_parser.add_argument("--sites", type=int, default=0,
+                             help="Spread documents over this many registered sites (default: the default site only)")
+
+    for command in ("snapshot", "restore", "drop-snapshot"):
+        sub.add_parser(command).add_argument("--name", required=True)
+
+    args = parser.parse_args(argv)
+    destructive = args.command == "restore" or (args.command == "load" and args.drop)
+    if destructive and not args.db:
+        parser.error(f"{args.command} replaces documents: pass --db explicitly (the application uses {DB_NAME!r})")
+    if not (args.db or DB_NAME):
+        parser.error("DB_NAME is not set (environment or .env): pass --db")
+
+    client = MongoClient(args.mongo_url)
+    db = client[args.db or DB_NAME]
+
+    try:
+        if args.command == "load":
+            load(db, args.scale, args.seed, args.collections, args.drop, args.sites)
+        elif args.command == "snapshot":
+            snapshot(db, args.name, args.collections)
+        elif args.command == "restore":
+            restore(db, args.name, args.collections)
+        else:
+            drop_snapshot(db, args.name, args.collections)
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
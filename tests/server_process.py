@@ -0,0 +1,80 @@
+"""
+Helpers to start the standalone Next.js server as a child process and time
+how long it takes to serve its first successful responses.
+"""
+
+import os
+import socket
+import subprocess
+import time
+
+import requests
+
+from tests.conftest import REPO_ROOT
+
+STANDALONE_SERVER = REPO_ROOT / ".next" / "standalone" / "server.js"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def content_ready(response):
+    # /api/content falls back to the generic "API active" payload when MongoDB is down
+    return response.status_code == 200 and "hero" in response.json()
+
+
+class ServerProcess:
+    """A standalone server.js child process listening on its own port"""
+
+    def __init__(self, port=None, env=None):
+        self.port = port or free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.env = {**os.environ, "PORT": str(self.port), "HOSTNAME": "127.0.0.1", **(env or {})}
+        self.process = None
+        self.started_at = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self.process = subprocess.Popen(
+            ["node", str(STANDALONE_SERVER)],
+            env=self.env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        return self
+
+    def stop(self, timeout=10):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+    def time_to_first_success(self, path, ready=None, method="GET", timeout=30, interval=0.02, **kwargs):
+        """Seconds from process start until <method> /api<path> satisfies `ready` (default: HTTP 200)"""
+        ready = ready or (lambda response: response.status_code == 200)
+        deadline = self.started_at + timeout
+
+        while time.perf_counter() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"server.js exited with code {self.process.returncode}")
+            try:
+                response = requests.request(method, f"{self.base_url}/api{path}", timeout=2, **kwargs)
+                if ready(response):
+                    return time.perf_counter() - self.started_at
+            except requests.RequestException:
+                pass
+            time.sleep(interval)
+
+        raise TimeoutError(f"{method} /api{path} not ready after {timeout}s")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,85 @@
+"""
+Canary report tests: percentiles, burn rates, SQLite windows and proxy/app
+attribution from tests/canary.py. No server needed, probes are recorded
+directly into a temporary database.
+"""
+
+import argparse
+
+import pytest
+
+from tests import canary
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def db(tmp_path):
+    connection = canary.connect(tmp_path / "canary.sqlite")
+    yield connection
+    connection.close()
+
+
+def record(db, round_id, age, target, probe, ok, status=200, latency=50.0, error=None):
+    db.execute("INSERT INTO probes (round, ts, target, probe, ok, status, latency_ms, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+               (round_id, NOW - age, target, probe, int(ok), status, latency, error))
+
+
+def test_burn_rate():
+    assert canary.burn_rate(0, 100, 0.995) == 0
+    assert canary.burn_rate(1, 200, 0.995) == pytest.approx(1.0)
+    assert canary.burn_rate(10, 100, 0.99) == pytest.approx(10.0)
+    assert canary.burn_rate(0, 0, 0.995) is None
+
+
+def test_windows_only_count_recent_probes(db):
+    for round_id in range(10):
+        record(db, round_id, age=60, target="direct", probe="content", ok=round_id != 0, latency=100 + round_id)
+    record(db, 99, age=7200, target="direct", probe="content", ok=False, status=None, latency=None, error="timeout")
+
+    recent = canary.window_stats(db, "direct", "content", canary.WINDOWS["5m"], NOW)
+    day = canary.window_stats(db, "direct", "content", canary.WINDOWS["24h"], NOW)
+
+    assert recent["samples"] == 10
+    assert recent["availability"] == pytest.approx(0.9)
+    assert recent["p50_ms"] == 105
+    assert recent["availability_burn"] == pytest.approx(0.1 / (1 - canary.AVAILABILITY_SLO))
+    assert day["samples"] == 11
+
+
+def test_fast_burn_pages_only_when_both_windows_burn(db):
+    for round_id in range(20):
+        record(db, round_id, age=120, target="proxy", probe="content", ok=round_id % 2, status=502)
+    report = canary.build_report(db, ["5m", "1h"], now=NOW)
+
+    alerts = report["series"][0]["alerts"]
+    assert any(alert.startswith("page: availability") for alert in alerts)
+
+    # Old failures alone keep the long window burning but not the short one
+    for round_id in range(20, 40):
+        record(db, round_id, age=30, target="direct", probe="content", ok=True)
+        record(db, round_id, age=1800, target="direct", probe="content", ok=False, status=500)
+    direct = canary.build_report(db, ["5m", "1h"], now=NOW)["series"][0]
+    assert direct["target"] == "direct"
+    assert not any(alert.startswith("page") and "over 1h" in alert for alert in direct["alerts"])
+
+
+def test_attribution_separates_proxy_from_app(db):
+    # Round 1: nginx 502 while the app answers directly, proxy problem
+    record(db, 1, 10, "proxy", "content", ok=False, status=502)
+    record(db, 1, 10, "direct", "content", ok=True)
+    # Round 2: both fail, application problem
+    record(db, 2, 10, "proxy", "content", ok=False, status=504)
+    record(db, 2, 10, "direct", "content", ok=False, status=None, error="timeout")
+    # Round 3: both answer, but the app itself is slow
+    record(db, 3, 10, "proxy", "content", ok=True, latency=900)
+    record(db, 3, 10, "direct", "content", ok=True, latency=880)
+
+    counts = canary.attribute_failures(db, NOW - 60, "proxy", "direct")
+    assert counts == {"proxy": 1, "app": 1, "app_slow": 1}
+
+
+def test_parse_target():
+    assert canary.parse_target("direct=http://127.0.0.1:3000/") == ("direct", "http://127.0.0.1:3000")
+    with pytest.raises(argparse.ArgumentTypeError):
+        canary.parse_target("http://localhost")
@@ -0,0 +1,329 @@
+"""
+Contact form tests: valid submissions, validation, security, error handling
+and load shedding. Ported from pm2_fix_test.py; every test runs in its own
+rate limit namespace (the server sends no email for it) and removes the
+messages it stores.
+"""
+
+import os
+import random
+import socket
+import string
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import pytest
+
+from tests.conftest import BASE_URL
+
+pytestmark = pytest.mark.functional
+
+CONTACT_BODY_LIMIT = 16 * 1024
+BODY_READ_TIMEOUT_S = float(os.environ.get("BODY_READ_TIMEOUT_MS", "10000")) / 1000
+SMTP_BUCKET_CAPACITY = int(os.environ.get("SMTP_BUCKET_CAPACITY", "10"))
+SMTP_RATE_PER_MINUTE = int(os.environ.get("SMTP_RATE_PER_MINUTE", "20"))
+
+VALID_SUBMISSION = {
+    "name": "Pierre Dubois",
+    "email": "pierre.dubois@example.com",
+    "message": "Bonjour, je souhaite en savoir plus sur vos services de développement web.",
+    "subject": "Demande d'information services web"
+}
+
+
+@pytest.fixture
+def sender(api, auth_headers):
+    """Unique sender address; its messages are deleted from the inbox after the test"""
+    email = f"contact-{uuid.uuid4().hex[:10]}@example.com"
+    yield email
+    for message in api.get("/admin/messages", headers=auth_headers).json():
+        if message["email"] == email:
+            api.delete(f"/admin/messages/{message['_id']}", headers=auth_headers)
+
+
+def test_valid_submission(api, contact_headers, sender):
+    response = api.post("/contact", json={**VALID_SUBMISSION, "email": sender}, headers=contact_headers)
+
+    assert response.status_code == 200
+    assert response.json().get("success") is True
+
+
+@pytest.mark.parametrize("payload", [
+    pytest.param({"email": "test@example.com", "message": "Test message"}, id="missing-name"),
+    pytest.param({"name": "Test User", "email": "not-an-email", "message": "Test message"}, id="invalid-email"),
+    pytest.param({"name": "Test User", "email": "test@example.com"}, id="missing-message"),
+    pytest.param({"name": "x" * 101, "email": "test@example.com", "message": "Test"}, id="name-too-long"),
+    pytest.param({"name": "Test User", "email": "test@example.com", "message": "x" * 2001}, id="message-too-long"),
+    pytest.param({"name": "Test", "email": "test@example.com", "message": "Test", "subject": "x" * 201},
+                 id="subject-too-long"),
+    pytest.param({}, id="empty"),
+])
+def test_invalid_submission_rejected(api, contact_headers, payload):
+    response = api.post("/contact", json=payload, headers=contact_headers)
+
+    assert response.status_code == 400
+    assert response.json().get("error")
+
+
+def test_xss_payload_accepted_and_sanitized(api, contact_headers, auth_headers, sender):
+    payload = {
+        "name": "XSS Test <script>alert('xss')</script>",
+        "email": sender,
+        "message": "Testing XSS: <img src=x onerror=alert('xss')>",
+        "subject": "XSS Test"
+    }
+    response = api.post("/contact", json=payload, headers=contact_headers)
+    assert response.status_code == 200
+
+    messages = api.get("/admin/messages", headers=auth_headers).json()
+    stored = next(m for m in messages if m["email"] == sender)
+    assert "<script>" not in stored["name"]
+    assert "<img" not in stored["message"]
+
+
+def test_malformed_json_rejected(api, contact_headers):
+    response = api.post(
+        "/contact",
+        data="invalid json",
+        headers={**contact_headers, "Content-Type": "application/json"}
+    )
+
+    assert response.status_code >= 400
+
+
+def test_rate_limit_enforced_within_namespace(api, contact_headers):
+    statuses = [
+        api.post("/contact", json={}, headers=contact_headers).status_code
+        for _ in range(6)
+    ]
+
+    assert statuses[:5] == [400] * 5
+    assert statuses[5] == 429
+
+
+def test_honeypot_hit_answers_success_without_storing(api, contact_headers, mongo_db):
+    marker = f"honeypot-{uuid.uuid4().hex[:8]}@example.com"
+    response = api.post("/contact", json={**VALID_SUBMISSION, "email": marker, "website": "http://spam.example"},
+                        headers=contact_headers)
+
+    assert response.status_code == 200
+    assert response.json().get("success") is True
+    assert mongo_db.contact_submissions.count_documents({"email": marker}) == 0
+
+
+def test_near_duplicate_stored_once(api, contact_headers, mongo_db):
+    subject = f"dup-{uuid.uuid4().hex[:8]}"
+    variants = [
+        "Bonjour, je voudrais un devis pour mon site vitrine.",
+        "BONJOUR je voudrais un devis pour mon site VITRINE !!!",
+        "bonjour,  je voudrais un dévis pour mon site vitrine ?"
+    ]
+    for variant in variants:
+        response = api.post("/contact", json={**VALID_SUBMISSION, "subject": subject, "message": variant},
+                            headers=contact_headers)
+        assert response.status_code == 200
+
+    assert mongo_db.contact_submissions.count_documents({"subject": subject}) == 1
+    mongo_db.contact_submissions.delete_many({"subject": subject})
+
+
+def test_canary_dry_run_validates_without_storing(api, auth_headers, mongo_db):
+    marker = f"canary-{uuid.uuid4().hex[:8]}@example.com"
+    dry_run = {**auth_headers, "X-Canary-Dry-Run": "true"}
+
+    response = api.post("/contact", json={**VALID_SUBMISSION, "email": marker}, headers=dry_run)
+    assert response.status_code == 200
+    assert response.json().get("dryRun") is True
+    assert mongo_db.contact_submissions.count_documents({"email": marker}) == 0
+
+    assert api.post("/contact", json={**VALID_SUBMISSION, "email": "invalid"}, headers=dry_run).status_code == 400
+    assert api.post("/contact", json=VALID_SUBMISSION, headers={"X-Canary-Dry-Run": "true"}).status_code == 401
+
+
+def test_same_short_request_from_different_senders_all_stored(api, contact_headers, mongo_db):
+    subject = f"senders-{uuid.uuid4().hex[:8]}"
+    submissions = [
+        ("alice@example.com", "Bonjour, je voudrais un devis pour un site vitrine."),
+        ("bruno@example.com", "Bonjour, je voudrais un devis pour un site vitrine."),
+        ("alice@example.com", "Devis pour 3 pages"),
+        ("alice@example.com", "Devis pour 5 pages"),
+    ]
+    for email, message in submissions:
+        response = api.post("/contact", json={**VALID_SUBMISSION, "email": email, "subject": subject, "message": message},
+                            headers=contact_headers)
+        assert response.status_code == 200
+
+    assert mongo_db.contact_submissions.count_documents({"subject": subject}) == len(submissions)
+    mongo_db.contact_submissions.delete_many({"subject": subject})
+
+
+def raw_post(path, headers, chunks=(), delay=0.0, timeout=30):
+    """POST over a raw socket so tests control Content-Length and pacing; returns the status code"""
+    url = urlparse(BASE_URL)
+    with socket.create_connection((url.hostname, url.port or 80), timeout=timeout) as sock:
+        head = [f"POST /api{path} HTTP/1.1", f"Host: {url.netloc}", "Content-Type: application/json",
+                "Connection: close"]
+        head += [f"{name}: {value}" for name, value in headers.items()]
+        sock.sendall(("\r\n".join(head) + "\r\n\r\n").encode())
+        try:
+            for chunk in chunks:
+                sock.sendall(chunk)
+                time.sleep(delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The server may answer and close before the body is fully sent
+        status_line = sock.recv(1024).split(b"\r\n", 1)[0]
+    return int(status_line.split()[1])
+
+
+def test_oversized_declared_body_rejected_before_upload(contact_headers):
+    # Only the headers are sent: the 413 must come from Content-Length alone
+    status = raw_post("/contact", {**contact_headers, "Content-Length": str(50 * 1024 * 1024)})
+
+    assert status == 413
+
+
+def test_oversized_chunked_body_rejected(api, contact_headers):
+    def body():
+        yield b'{"name": "Chunked", "message": "'
+        for _ in range(64):
+            yield b"x" * 1024
+        yield b'"}'
+
+    response = api.post("/contact", data=body(), headers={**contact_headers, "Content-Type": "application/json"})
+
+    assert response.status_code == 413
+
+
+def test_body_just_under_limit_accepted_for_validation(api, contact_headers):
+    payload = {"name": "Limit", "email": "limit@example.com", "message": "x" * 2001, "padding": "y" * 8000}
+
+    response = api.post("/contact", json=payload, headers=contact_headers)
+
+    assert response.status_code == 400  # parsed, then rejected by validation (message too long)
+
+
+def test_oversized_publication_rejected(api, auth_headers):
+    payload = {"title": "Big", "content": "x" * (128 * 1024), "author": "Test"}
+
+    response = api.post("/admin/publications", json=payload, headers=auth_headers)
+
+    assert response.status_code == 413
+
+
+def test_slow_drip_body_times_out(contact_headers):
+    body = b'{"name": "Slow", "email": "slow@example.com", "message": "drip"}'
+    chunks = [body[i:i + 1] for i in range(len(body))]
+    delay = (BODY_READ_TIMEOUT_S + 2) / len(chunks)
+
+    status = raw_post("/contact", {**contact_headers, "Content-Length": str(len(body))}, chunks, delay)
+
+    assert status == 408
+
+
+@pytest.mark.performance
+def test_oversized_flood_keeps_memory_flat(api, auth_headers, test_mode):
+    if not test_mode:
+        pytest.skip("Needs the server started with TEST_MODE=true")
+    before = api.get("/admin/metrics", headers=auth_headers).json()["memory"]["rss"]
+    chunk = b"x" * (1024 * 1024)
+
+    def flood(_):
+        # A fresh namespace per request so every body reaches the size check instead of the rate limiter
+        headers = {**auth_headers, "X-Test-Run-Id": f"flood-{uuid.uuid4().hex[:12]}",
+                   "Content-Length": str(50 * 1024 * 1024)}
+        return raw_post("/contact", headers, [chunk] * 50)
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        statuses = list(pool.map(flood, range(40)))
+    after = api.get("/admin/metrics", headers=auth_headers).json()["memory"]["rss"]
+
+    print(f"rss before {before / 2**20:.0f}MB, after 40 x 50MB bodies {after / 2**20:.0f}MB")
+    api.delete("/admin/test/rate-limit", headers=auth_headers)
+    assert set(statuses) == {413}
+    assert after - before < 64 * 1024 * 1024
+
+
+def spam_text(rng):
+    # Template-length texts: only those long count as duplicates across senders
+    return " ".join("".join(rng.choices(string.ascii_lowercase, k=8)) for _ in range(60))
+
+
+def near_duplicate(rng, text):
+    # Case, punctuation and spacing are ignored by the near-duplicate check
+    return f"{text.upper()} {rng.choice(['!!!', '?!', '...'])}".replace(" ", "  ", rng.randint(1, 5))
+
+
+@pytest.mark.performance
+def test_spam_flood_sheds_duplicates_before_io(api, auth_headers, contact_headers, mongo_db):
+    """10k messages from distinct IPs: only unique texts are written and SMTP stays within its bucket"""
+    rng = random.Random(36)
+    subject = f"flood-{uuid.uuid4().hex[:8]}"
+    payloads = []
+    unique_texts = set()
+    for _ in range(1_000):
+        originals = [spam_text(rng) for _ in range(4)]
+        unique_texts.update(originals)
+        payloads += [{"message": text} for text in originals]
+        payloads += [{"message": rng.choice(originals)} for _ in range(2)]
+        payloads += [{"message": near_duplicate(rng, rng.choice(originals))} for _ in range(2)]
+        payloads += [{"message": spam_text(rng), "website": "http://spam.example"} for _ in range(2)]
+    unique = len(unique_texts)
+    rng.shuffle(payloads)
+
+    before = api.get("/admin/metrics", headers=auth_headers).json()["contact"]
+    done = [0]
+    lock = threading.Lock()
+    stop = threading.Event()
+    samples = []
+
+    def sampler():
+        last_done, last_written = 0, 0
+        while not stop.wait(0.5):
+            written = mongo_db.contact_submissions.count_documents({"subject": subject})
+            with lock:
+                sent = done[0]
+            samples.append((sent - last_done, written - last_written))
+            last_done, last_written = sent, written
+
+    def post(indexed):
+        index, payload = indexed
+        # Distinct source addresses, so the per-IP rate limiter never kicks in
+        headers = {**contact_headers, "X-Forwarded-For": f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}"}
+        body = {"name": "Spam Bot", "email": f"bot{index}@example.com", "subject": subject, **payload}
+        status = api.post("/contact", json=body, headers=headers).status_code
+        with lock:
+            done[0] += 1
+        return status
+
+    watcher = threading.Thread(target=sampler, daemon=True)
+    watcher.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        statuses = list(pool.map(post, enumerate(payloads)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    watcher.join()
+
+    after = api.get("/admin/metrics", headers=auth_headers).json()["contact"]
+    written = mongo_db.contact_submissions.count_documents({"subject": subject})
+    mongo_db.contact_submissions.delete_many({"subject": subject})
+    for requests_done, writes in samples:
+        print(f"{requests_done / 0.5:>8.0f} req/s {writes / 0.5:>8.0f} writes/s")
+    granted = after["smtp"]["granted"] - before["smtp"]["granted"]
+    throttled = after["smtp"]["throttled"] - before["smtp"]["throttled"]
+    print(f"{len(payloads)} messages in {elapsed:.1f}s: {written} written, {granted} emails allowed, {throttled} throttled")
+
+    assert set(statuses) == {200}
+    assert written == unique
+    assert after["dropped"]["honeypot"] - before["dropped"]["honeypot"] >= 2_000
+    assert after["dropped"]["duplicate"] - before["dropped"]["duplicate"] >= len(payloads) - 2_000 - unique
+    # Every stored message asks the bucket, with or without SMTP credentials;
+    # it is global, so the bound holds whatever else the server is doing
+    assert granted + throttled >= written
+    assert throttled > 0
+    assert granted <= SMTP_BUCKET_CAPACITY + SMTP_RATE_PER_MINUTE * elapsed / 60 + 1
+    # Dropped messages never reach the database: writes track the unique share of the traffic
+    assert all(writes <= requests_done * 0.6 + 20 for requests_done, writes in samples if requests_done >= 200)
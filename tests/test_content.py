@@ -0,0 +1,164 @@
+"""
+Content editing tests: JSON-patch updates, optimistic concurrency between
+editors, the revision log and rollback. Each test edits its own site.
+"""
+
+import json
+import threading
+
+import pytest
+
+pytestmark = pytest.mark.functional
+
+
+@pytest.fixture
+def editor(api, auth_headers, site):
+    """Headers for the test site plus a helper returning its current content"""
+    _, host = site
+    headers = {**auth_headers, **host}
+
+    def content():
+        return api.get("/content", headers=host).json()
+
+    return headers, content
+
+
+def test_patch_changes_only_targeted_fields(api, editor):
+    headers, content = editor
+    before = content()
+
+    response = api.patch("/admin/content", headers=headers, json={
+        "version": before.get("version", 0),
+        "ops": [
+            {"op": "replace", "path": "/hero/title", "value": "Nouveau titre"},
+            {"op": "add", "path": "/services/-", "value": {"id": "seo", "title": "SEO"}},
+            {"op": "remove", "path": "/portfolio/0"}
+        ]
+    })
+    assert response.status_code == 200, response.text
+
+    after = content()
+    assert after["version"] == before.get("version", 0) + 1
+    assert after["hero"]["title"] == "Nouveau titre"
+    assert after["hero"]["subtitle"] == before["hero"]["subtitle"]
+    assert after["services"][-1]["id"] == "seo"
+    assert after["portfolio"] == before["portfolio"][1:]
+
+
+def test_patch_payload_smaller_than_section(api, editor):
+    headers, content = editor
+    before = content()
+    services = [{**service} for service in before["services"]]
+    services[1]["title"] = "Déploiement+"
+    section_body = json.dumps({"type": "services", "data": services}).encode()
+
+    response = api.patch("/admin/content", headers=headers, json={
+        "version": before.get("version", 0),
+        "ops": [{"op": "replace", "path": "/services/1/title", "value": "Déploiement+"}]
+    })
+    assert response.status_code == 200, response.text
+    # What actually went over the wire, against the whole-section PUT it replaces
+    assert len(response.request.body) * 3 < len(section_body)
+    assert content()["services"] == services
+
+
+@pytest.mark.parametrize("ops", [
+    pytest.param([{"op": "move", "path": "/hero/title", "from": "/hero/subtitle"}], id="unsupported-op"),
+    pytest.param([{"op": "replace", "path": "/siteId", "value": "other"}], id="protected-field"),
+    pytest.param([{"op": "replace", "path": "/hero/__proto__/x", "value": 1}], id="prototype"),
+    pytest.param([{"op": "remove", "path": "/services/99"}], id="out-of-range"),
+    pytest.param([{"op": "remove", "path": "/hero"}], id="whole-section"),
+    pytest.param([], id="empty"),
+])
+def test_invalid_patch_rejected(api, editor, ops):
+    headers, content = editor
+    version = content().get("version", 0)
+
+    response = api.patch("/admin/content", headers=headers, json={"version": version, "ops": ops})
+    assert response.status_code == 400
+    assert content().get("version", 0) == version
+
+
+def test_concurrent_editors_get_conflicts_not_lost_updates(api, editor):
+    headers, content = editor
+    version = content().get("version", 0)
+    editors = 8
+    barrier = threading.Barrier(editors)
+    statuses = [None] * editors
+
+    def edit(index):
+        barrier.wait()
+        response = api.patch("/admin/content", headers=headers, json={
+            "version": version,
+            "ops": [{"op": "replace", "path": "/hero/title", "value": f"Éditeur {index}"}]
+        })
+        statuses[index] = response.status_code
+
+    threads = [threading.Thread(target=edit, args=(index,)) for index in range(editors)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses.count(200) == 1
+    assert statuses.count(409) == editors - 1
+    after = content()
+    assert after["version"] == version + 1
+    assert after["hero"]["title"] == f"Éditeur {statuses.index(200)}"
+
+    # A losing editor reloads and reapplies its change on top of the winner's
+    retry = api.patch("/admin/content", headers=headers, json={
+        "version": after["version"],
+        "ops": [{"op": "replace", "path": "/hero/subtitle", "value": "Fusionné"}]
+    })
+    assert retry.status_code == 200
+    merged = content()
+    assert merged["hero"]["title"] == after["hero"]["title"]
+    assert merged["hero"]["subtitle"] == "Fusionné"
+
+
+def test_stale_version_rejected(api, editor):
+    headers, content = editor
+    version = content().get("version", 0)
+    api.patch("/admin/content", headers=headers,
+              json={"version": version, "ops": [{"op": "replace", "path": "/contact/phone", "value": "01"}]})
+
+    response = api.patch("/admin/content", headers=headers,
+                         json={"version": version, "ops": [{"op": "replace", "path": "/contact/phone", "value": "02"}]})
+    assert response.status_code == 409
+    assert response.json()["version"] == version + 1
+    assert content()["contact"]["phone"] == "01"
+
+
+def test_rollback_restores_earlier_version(api, editor):
+    headers, content = editor
+    original = content()
+    version = original.get("version", 0)
+    edits = [
+        [{"op": "replace", "path": "/hero/title", "value": "Un"}],
+        [{"op": "add", "path": "/services/0", "value": {"id": "first", "title": "Premier"}}],
+        [{"op": "remove", "path": "/contact/location"}],
+    ]
+    for offset, ops in enumerate(edits):
+        response = api.patch("/admin/content", headers=headers, json={"version": version + offset, "ops": ops})
+        assert response.status_code == 200
+
+    revisions = api.get("/admin/content/revisions", headers=headers).json()
+    assert [r["version"] for r in revisions[:3]] == [version + 3, version + 2, version + 1]
+
+    response = api.post("/admin/content/rollback", headers=headers, json={"version": version})
+    assert response.status_code == 200
+    restored = content()
+    assert restored["version"] == version + 4
+    for section in ("hero", "services", "portfolio", "contact"):
+        assert restored[section] == original[section]
+
+
+def test_whole_section_put_still_versioned(api, editor):
+    headers, content = editor
+    before = content()
+    hero = {**before["hero"], "title": "Via PUT"}
+
+    response = api.put("/admin/content", headers=headers, json={"type": "hero", "data": hero})
+    assert response.status_code == 200
+    assert content()["version"] == before.get("version", 0) + 1
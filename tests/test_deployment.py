@@ -0,0 +1,58 @@
+"""
+Deployment checks: the standalone Next.js build and its PM2 configuration.
+Ported from the PM2 fix verification of pm2_fix_test.py.
+"""
+
+import os
+import re
+
+import pytest
+
+from tests.conftest import REPO_ROOT
+from tests.server_process import STANDALONE_SERVER, ServerProcess, content_ready
+
+COLD_START_BUDGET_S = float(os.environ.get("GYS_COLD_START_BUDGET_S", "5"))
+
+requires_build = pytest.mark.skipif(
+    not STANDALONE_SERVER.exists(),
+    reason="No standalone build, run `yarn build` first"
+)
+
+
+@pytest.mark.smoke
+def test_standalone_output_enabled():
+    config = (REPO_ROOT / "next.config.js").read_text()
+
+    assert re.search(r"^\s*output:\s*'standalone'", config, re.MULTILINE)
+
+
+@pytest.mark.smoke
+def test_ecosystem_runs_standalone_server():
+    config = (REPO_ROOT / "ecosystem.config.js").read_text()
+
+    assert "script: '.next/standalone/server.js'" in config
+    assert "interpreter: 'node'" in config
+    assert "NODE_ENV: 'production'" in config
+    assert "PORT: 3000" in config
+
+
+@pytest.mark.smoke
+@requires_build
+def test_standalone_build_has_assets():
+    standalone = STANDALONE_SERVER.parent
+
+    static_chunks = list((standalone / ".next" / "static").glob("chunks/*.js"))
+    assert static_chunks, "Static assets missing, scripts/prepare-standalone.js did not run"
+    if (REPO_ROOT / "public").exists():
+        assert (standalone / "public").exists()
+
+
+@pytest.mark.performance
+@requires_build
+def test_standalone_cold_start(api):
+    # `api` makes sure MongoDB-backed content is reachable through the running deployment
+    with ServerProcess() as server:
+        elapsed = server.time_to_first_success("/content", ready=content_ready)
+
+    print(f"cold start to first /api/content: {elapsed * 1000:.0f}ms")
+    assert elapsed < COLD_START_BUDGET_S, f"Cold start took {elapsed:.2f}s (budget {COLD_START_BUDGET_S}s)"
@@ -0,0 +1,122 @@
+"""
+Admin live feed (SSE) tests: authentication, message and publication deltas,
+and the many-connections benchmark from tests/bench_events.py.
+"""
+
+import asyncio
+import os
+import uuid
+
+import pytest
+
+from tests import bench_events
+from tests.bench_events import SseConnection
+
+SSE_CONNECTIONS = int(os.environ.get("GYS_SSE_CONNECTIONS", "1000"))
+SSE_LATENCY_BUDGET_MS = float(os.environ.get("GYS_SSE_LATENCY_BUDGET_MS", "500"))
+
+
+async def collect(token, action, expected, timeout=5):
+    """Open one stream, run `action` in a thread, return the stream's payloads by event once `expected` arrives"""
+    client = SseConnection(token)
+    assert await client.open() == 200
+    listener = asyncio.create_task(client.listen())
+    try:
+        await asyncio.to_thread(action)
+        for _ in range(int(timeout / 0.05)):
+            if expected in client.received:
+                break
+            await asyncio.sleep(0.05)
+        return client.payloads
+    finally:
+        client.close()
+        listener.cancel()
+
+
+@pytest.mark.functional
+def test_events_require_token(api):
+    client = SseConnection("invalid-token")
+    assert asyncio.run(client.open()) == 401
+    client.close()
+
+
+@pytest.mark.functional
+def test_ticket_cookie_opens_stream_only(api, auth_headers, admin_token):
+    response = api.post("/admin/events/ticket", headers=auth_headers)
+    assert response.status_code == 200
+    cookie = response.cookies.get("gys_events")
+    assert cookie and cookie != admin_token
+    assert "httponly" in response.headers["Set-Cookie"].lower()
+
+    client = SseConnection()
+    assert asyncio.run(client.open(headers={"Cookie": f"gys_events={cookie}"})) == 200
+    client.close()
+
+    # Single-purpose: the ticket is not an admin token, and the JWT is no longer read from the URL
+    assert api.get("/admin/messages", headers={"Authorization": f"Bearer {cookie}"}).status_code == 401
+    query = SseConnection(path=f"/api/admin/events?token={admin_token}")
+    assert asyncio.run(query.open()) == 401
+    query.close()
+
+
+@pytest.mark.functional
+def test_new_message_pushed(api, admin_token, contact_headers, mongo_db):
+    email = f"sse-{uuid.uuid4().hex[:8]}@example.com"
+
+    def submit():
+        response = api.post("/contact", json={"name": "Live Feed", "email": email,
+                                              "message": f"Message en direct {uuid.uuid4().hex}"}, headers=contact_headers)
+        assert response.status_code == 200
+
+    received = asyncio.run(collect(admin_token, submit, expected=None, timeout=1))
+    message = mongo_db.contact_submissions.find_one({"email": email})
+    mongo_db.contact_submissions.delete_one({"_id": message["_id"]})
+
+    assert ("message.created", str(message["_id"])) in received
+
+
+@pytest.mark.functional
+def test_deletes_reach_only_their_site(api, admin_token, auth_headers, mongo_db, site):
+    other_site, _ = site
+    own = mongo_db.contact_submissions.insert_one({"siteId": "default", "name": "Live Feed", "message": "Supprimé",
+                                                   "email": "sse-delete@example.com", "read": False}).inserted_id
+    other = mongo_db.contact_submissions.insert_one({"siteId": other_site, "name": "Live Feed", "message": "Ailleurs",
+                                                     "email": "sse-delete@example.com", "read": False}).inserted_id
+
+    def delete():
+        api.delete(f"/admin/messages/{own}", headers=auth_headers)
+        mongo_db.contact_submissions.delete_one({"_id": other})
+
+    received = asyncio.run(collect(admin_token, delete, expected=None, timeout=1))
+
+    assert ("message.deleted", str(own)) in received
+    assert ("message.deleted", str(other)) not in received
+
+
+@pytest.mark.functional
+def test_publication_status_change_pushed(api, admin_token, auth_headers, publication_factory):
+    title = f"sse-{uuid.uuid4().hex[:8]}"
+    publication = publication_factory(title=title)
+
+    def publish():
+        api.put(f"/admin/publications/{publication['id']}", headers=auth_headers,
+                json={"title": title, "content": publication["content"], "author": publication["author"],
+                      "status": "published"})
+
+    received = asyncio.run(collect(admin_token, publish, expected=("publication.updated", title)))
+    delta = received[("publication.updated", title)]
+    # A delta, not the document: the dashboard refetches the body when it needs it
+    assert delta["status"] == "published"
+    assert delta["id"] == publication["id"]
+    assert "content" not in delta
+
+
+@pytest.mark.performance
+def test_many_connections_delivery_and_memory(admin_token):
+    report = asyncio.run(bench_events.run(admin_token, connections=SSE_CONNECTIONS, events=10))
+
+    print(f"{report['connections']} connections: latency {report['latency_ms']}, "
+          f"{report['rss_per_connection_kb']}KB per connection")
+    assert report["missing"] == 0
+    assert report["latency_ms"]["p95"] < SSE_LATENCY_BUDGET_MS
+    assert report["rss_per_connection_kb"] < 64
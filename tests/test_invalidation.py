@@ -0,0 +1,110 @@
+"""
+Cross-worker cache invalidation: several standalone workers on their own
+ports share one database; a write through one worker must reach the caches
+of all the others through the MongoDB change stream.
+
+Needs a build (`yarn build`) and MongoDB running as a replica set, e.g.
+mongod --replSet rs0 followed by rs.initiate() in mongosh.
+"""
+
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tests.conftest import ADMIN_CREDENTIALS
+from tests.server_process import STANDALONE_SERVER, ServerProcess, content_ready
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(not STANDALONE_SERVER.exists(), reason="Standalone build missing, run `yarn build`")
+]
+
+WORKERS = int(os.environ.get("GYS_INVALIDATION_WORKERS", "3"))
+PROPAGATION_BUDGET_MS = float(os.environ.get("GYS_INVALIDATION_BUDGET_MS", "1000"))
+
+
+@pytest.fixture(scope="module")
+def workers():
+    servers = [ServerProcess().start() for _ in range(WORKERS)]
+    try:
+        for server in servers:
+            server.time_to_first_success("/content", ready=content_ready)
+        token = requests.post(f"{servers[0].base_url}/api/admin/login", json=ADMIN_CREDENTIALS, timeout=5).json()["token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        # The stream opens on the first request; give it a moment before requiring it
+        deadline = time.perf_counter() + 10
+        while True:
+            statuses = [requests.get(f"{server.base_url}/api/admin/metrics", headers=headers, timeout=5)
+                        .json()["invalidation"]["connected"] for server in servers]
+            if all(statuses):
+                break
+            if time.perf_counter() > deadline:
+                pytest.skip("Change streams unavailable: MongoDB must run as a replica set")
+            time.sleep(0.1)
+
+        yield servers, headers
+    finally:
+        for server in servers:
+            server.stop()
+
+
+def propagation_delays(servers, path, is_fresh, timeout=10):
+    """Milliseconds until each worker serves a response satisfying is_fresh"""
+    start = time.perf_counter()
+
+    def wait(server):
+        while time.perf_counter() - start < timeout:
+            response = requests.get(f"{server.base_url}/api{path}", timeout=5)
+            if is_fresh(response.json()):
+                return (time.perf_counter() - start) * 1000
+            time.sleep(0.005)
+        return float("inf")
+
+    with ThreadPoolExecutor(max_workers=len(servers)) as pool:
+        return list(pool.map(wait, servers))
+
+
+def test_content_update_reaches_every_worker(workers):
+    servers, headers = workers
+    hero = requests.get(f"{servers[0].base_url}/api/content", timeout=5).json()["hero"]
+    # Warm every worker's cache with the current version
+    for server in servers:
+        requests.get(f"{server.base_url}/api/content", timeout=5)
+
+    title = f"Invalidation {uuid.uuid4().hex[:8]}"
+    try:
+        response = requests.put(f"{servers[-1].base_url}/api/admin/content",
+                                json={"type": "hero", "data": {**hero, "title": title}}, headers=headers, timeout=5)
+        assert response.status_code == 200
+        delays = propagation_delays(servers, "/content", lambda content: content["hero"]["title"] == title)
+    finally:
+        requests.put(f"{servers[-1].base_url}/api/admin/content",
+                     json={"type": "hero", "data": hero}, headers=headers, timeout=5)
+
+    print("content propagation per worker: " + ", ".join(f"{delay:.0f}ms" for delay in delays))
+    assert max(delays) < PROPAGATION_BUDGET_MS
+
+
+def test_publication_list_update_reaches_every_worker(workers):
+    servers, headers = workers
+    for server in servers:
+        requests.get(f"{server.base_url}/api/publications", timeout=5)
+
+    title = f"Invalidation {uuid.uuid4().hex[:8]}"
+    response = requests.post(f"{servers[-1].base_url}/api/admin/publications", headers=headers, timeout=5,
+                             json={"title": title, "content": "Propagation test.", "author": "Test", "status": "published"})
+    assert response.status_code == 200
+    publication_id = response.json()["publication"]["id"]
+    try:
+        delays = propagation_delays(servers, "/publications",
+                                    lambda items: any(item["id"] == publication_id for item in items))
+    finally:
+        requests.delete(f"{servers[-1].base_url}/api/admin/publications/{publication_id}", headers=headers, timeout=5)
+
+    print("publication propagation per worker: " + ", ".join(f"{delay:.0f}ms" for delay in delays))
+    assert max(delays) < PROPAGATION_BUDGET_MS
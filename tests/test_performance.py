@@ -0,0 +1,82 @@
+"""
+Performance tests: latency budgets for the public read endpoints.
+
+Dataset-backed tests restore a snapshot made with tests/datagen.py and
+should run on their own: pytest -m performance -n 0
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytestmark = pytest.mark.performance
+
+LATENCY_BUDGET_MS = float(os.environ.get("GYS_LATENCY_BUDGET_MS", "300"))
+SAMPLES = int(os.environ.get("GYS_LATENCY_SAMPLES", "50"))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(api, path, samples, concurrency=8):
+    def timed(_):
+        start = time.perf_counter()
+        response = api.get(path)
+        elapsed = (time.perf_counter() - start) * 1000
+        assert response.status_code == 200
+        return elapsed
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(timed, range(samples)))
+
+
+@pytest.mark.parametrize("path", ["/content", "/publications"])
+def test_public_endpoint_p95_latency(api, path):
+    api.get(path)  # warm-up
+    latencies = measure(api, path, SAMPLES)
+
+    p95 = percentile(latencies, 95)
+    assert p95 < LATENCY_BUDGET_MS, f"{path} p95 {p95:.1f}ms exceeds {LATENCY_BUDGET_MS}ms budget"
+
+
+@pytest.mark.parametrize("path,admin", [
+    ("/content", False),
+    ("/publications", False),
+    ("/admin/messages", True),
+])
+def test_endpoint_latency_on_dataset(api, auth_headers, dataset, path, admin):
+    headers = auth_headers if admin else {}
+    api.get(path, headers=headers)  # warm-up
+    latencies = []
+    for _ in range(SAMPLES):
+        start = time.perf_counter()
+        response = api.get(path, headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+
+    p95 = percentile(latencies, 95)
+    sizes = ", ".join(f"{name}={count}" for name, count in dataset.items())
+    assert p95 < LATENCY_BUDGET_MS, f"{path} p95 {p95:.1f}ms exceeds {LATENCY_BUDGET_MS}ms budget ({sizes})"
+
+
+def test_admin_bootstrap_beats_sequential_loads(api, auth_headers):
+    sequential_paths = ["/admin/verify", "/content", "/admin/messages", "/admin/publications"]
+    api.get("/admin/bootstrap", headers=auth_headers)  # warm-up
+
+    def best_of(fn, rounds=5):
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    bootstrap = best_of(lambda: api.get("/admin/bootstrap", headers=auth_headers))
+    sequential = best_of(lambda: [api.get(path, headers=auth_headers) for path in sequential_paths])
+
+    assert bootstrap < sequential, f"bootstrap {bootstrap * 1000:.1f}ms vs sequential {sequential * 1000:.1f}ms"
@@ -0,0 +1,124 @@
+"""
+Publications management tests: authentication, validation and the
+create / list / update / delete lifecycle. Ported from backend_test.py.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.functional
+
+
+def test_login_rejects_bad_credentials(api):
+    response = api.post("/admin/login", json={"username": "admin_getyoursite", "password": "wrong"})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("method,path", [
+    ("GET", "/admin/publications"),
+    ("GET", "/admin/messages"),
+    ("GET", "/admin/bootstrap"),
+    ("GET", "/admin/metrics"),
+    ("POST", "/admin/publications"),
+    ("PUT", "/admin/publications/test123"),
+    ("DELETE", "/admin/publications/test123"),
+])
+def test_admin_endpoints_require_token(api, method, path):
+    response = api.request(method, path, json={"title": "Test", "content": "Test", "author": "Test"})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("payload", [
+    pytest.param({"title": "", "content": "Test content", "author": "Test Author"}, id="empty-title"),
+    pytest.param({"title": "Test Title", "content": "", "author": "Test Author"}, id="empty-content"),
+    pytest.param({"title": "Test Title", "content": "Test content", "author": ""}, id="empty-author"),
+    pytest.param({"title": "A" * 201, "content": "Test content", "author": "Test Author"}, id="title-too-long"),
+    pytest.param({"title": "Test Title", "content": "A" * 5001, "author": "Test Author"}, id="content-too-long"),
+    pytest.param({"title": "Test Title", "content": "Test content", "author": "A" * 101}, id="author-too-long"),
+    pytest.param({"title": "Test Title", "content": "Test content", "author": "Test Author", "status": "invalid"},
+                 id="invalid-status"),
+])
+def test_publication_validation(api, auth_headers, payload):
+    response = api.post("/admin/publications", json=payload, headers=auth_headers)
+
+    assert response.status_code == 400
+
+
+def test_drafts_hidden_from_public_list(api, auth_headers, publication_factory):
+    draft = publication_factory(title="Test Draft Publication", status="draft")
+    published = publication_factory(title="Test Published Publication", status="published")
+
+    admin_ids = {p["id"] for p in api.get("/admin/publications", headers=auth_headers).json()}
+    public = api.get("/publications").json()
+    public_ids = {p["id"] for p in public}
+
+    assert {draft["id"], published["id"]} <= admin_ids
+    assert published["id"] in public_ids
+    assert draft["id"] not in public_ids
+    assert all(p["status"] == "published" for p in public)
+
+
+def test_publish_draft_through_update(api, auth_headers, publication_factory):
+    draft = publication_factory(title="Draft To Publish", status="draft")
+
+    response = api.put(
+        f"/admin/publications/{draft['id']}",
+        json={
+            "title": "Updated Draft Publication",
+            "content": "This draft has been updated and published.",
+            "author": "Updated Author",
+            "status": "published"
+        },
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json().get("success") is True
+
+    public = {p["id"]: p for p in api.get("/publications").json()}
+    assert public[draft["id"]]["title"] == "Updated Draft Publication"
+    assert public[draft["id"]]["publishedAt"]
+
+
+def test_delete_publication(api, auth_headers, publication_factory):
+    publication = publication_factory(title="Publication To Delete")
+
+    response = api.delete(f"/admin/publications/{publication['id']}", headers=auth_headers)
+    assert response.status_code == 200
+
+    admin_ids = {p["id"] for p in api.get("/admin/publications", headers=auth_headers).json()}
+    assert publication["id"] not in admin_ids
+
+
+def test_public_list_returns_summaries(api, publication_factory):
+    content = "Mot " * 600
+    published = publication_factory(title="Summary Publication", content=content, status="published")
+
+    public = {p["id"]: p for p in api.get("/publications").json()}
+    summary = public[published["id"]]
+
+    assert "content" not in summary
+    assert len(summary["excerpt"]) <= 201
+    assert summary["readingTime"] == 3
+
+
+def test_publication_detail(api, publication_factory):
+    published = publication_factory(title="Detail Publication", content="Contenu complet.", status="published")
+    draft = publication_factory(title="Hidden Draft", status="draft")
+
+    response = api.get(f"/publications/{published['id']}")
+    assert response.status_code == 200
+    assert response.json()["content"] == "Contenu complet."
+
+    assert api.get(f"/publications/{draft['id']}").status_code == 404
+    assert api.get("/publications/does-not-exist").status_code == 404
+
+
+def test_admin_bootstrap_returns_summaries(api, auth_headers, publication_factory):
+    draft = publication_factory(title="Bootstrap Summary", content="Mot " * 600)
+
+    items = api.get("/admin/bootstrap", headers=auth_headers).json()["publications"]["items"]
+    summary = next(p for p in items if p["id"] == draft["id"])
+
+    assert "content" not in summary
+    assert summary["_id"] and summary["status"] == "draft" and summary["createdAt"]
@@ -0,0 +1,129 @@
+"""
+Contact message retention tests: TTL expiry fields, archive / restore round
+trip, and insert latency and memory as the collection grows.
+"""
+
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.datagen import load_collection, parse_scale
+
+GROWTH_STEPS = [parse_scale(step) for step in os.environ.get("GYS_RETENTION_STEPS", "1k,10k,100k").split(",")]
+SAMPLES_PER_STEP = 30
+
+
+@pytest.mark.functional
+def test_read_message_gets_expiry(api, auth_headers, contact_headers, mongo_db):
+    marker = f"ttl-{uuid.uuid4().hex[:8]}@example.com"
+    response = api.post("/contact", json={"name": "TTL Test", "email": marker, "message": "Retention"},
+                        headers=contact_headers)
+    assert response.status_code == 200
+
+    message = mongo_db.contact_submissions.find_one({"email": marker})
+    assert "expireAt" not in message
+
+    api.put("/admin/messages/read", json={"messageId": str(message["_id"])}, headers=auth_headers)
+    message = mongo_db.contact_submissions.find_one({"email": marker})
+    assert message["read"] is True
+    assert message["expireAt"] > message["readAt"]
+
+    api.put("/admin/messages/spam", json={"messageId": str(message["_id"])}, headers=auth_headers)
+    spam = mongo_db.contact_submissions.find_one({"email": marker})
+    assert spam["spam"] is True
+    assert spam["expireAt"] < message["expireAt"]
+    mongo_db.contact_submissions.delete_one({"_id": message["_id"]})
+
+
+@pytest.fixture
+def bench_messages(mongo_db):
+    """Marker owning the benchmark's messages (synthetic siteId, posted email); all removed afterwards"""
+    marker = f"bench-{uuid.uuid4().hex[:10]}"
+    yield marker
+    mongo_db.contact_submissions.delete_many({"$or": [{"siteId": marker}, {"email": f"{marker}@example.com"}]})
+
+
+@pytest.mark.functional
+def test_archive_and_restore_round_trip(api, auth_headers, mongo_db, site):
+    # Scoped to the test's own site so the live database's old messages are left alone
+    site_id, _ = site
+    old = datetime.now(timezone.utc) - timedelta(days=400)
+    mongo_db.contact_submissions.insert_many([
+        {"siteId": site_id, "name": "Archive Test", "email": f"archive-{i}@example.com", "subject": "Old",
+         "message": "Old message", "ip": "127.0.0.1", "createdAt": old, "read": True}
+        for i in range(3)
+    ])
+
+    response = api.post("/admin/messages/archive", json={"olderThanDays": 365, "siteId": site_id},
+                        headers=auth_headers)
+    assert response.status_code == 200
+    result = response.json()
+    assert result["archived"] == 3
+    assert result["deleted"] == 3
+    assert mongo_db.contact_submissions.count_documents({"siteId": site_id}) == 0
+
+    archives = api.get("/admin/messages/archives", headers=auth_headers).json()
+    assert result["file"] in {archive["file"] for archive in archives}
+
+    response = api.post("/admin/messages/archives/restore", json={"file": result["file"]}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["restored"] == 3
+    restored = list(mongo_db.contact_submissions.find({"siteId": site_id}))
+    assert len(restored) == 3
+    # Dates survive the EJSON round trip (pymongo returns naive UTC datetimes)
+    assert all(doc["createdAt"] < datetime.utcnow() - timedelta(days=399) for doc in restored)
+    # The site fixture's teardown deletes the restored messages with the site
+
+
+@pytest.mark.functional
+def test_restore_rejects_path_traversal(api, auth_headers):
+    response = api.post("/admin/messages/archives/restore", json={"file": "../../etc/passwd"}, headers=auth_headers)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.functional
+def test_post_to_archive_listing_does_not_archive(api, auth_headers):
+    response = api.post("/admin/messages/archives", json={"olderThanDays": 0}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert "archived" not in response.json()
+
+
+@pytest.mark.performance
+def test_insert_latency_and_memory_stable_as_collection_grows(api, auth_headers, test_mode, mongo_db, bench_messages):
+    if not test_mode:
+        pytest.skip("Needs the server started with TEST_MODE=true")
+
+    results = []
+    loaded = 0
+    for step in GROWTH_STEPS:
+        load_collection(mongo_db, "contact_submissions", step - loaded, seed=random.randint(0, 10**6),
+                        site_id=bench_messages)
+        loaded = step
+
+        latencies = []
+        for _ in range(SAMPLES_PER_STEP):
+            # A fresh namespace per request keeps the rate limiter out of the measurement
+            headers = {**auth_headers, "X-Test-Run-Id": f"retention-{uuid.uuid4().hex[:12]}"}
+            start = time.perf_counter()
+            response = api.post("/contact", json={"name": "Bench", "email": f"{bench_messages}@example.com",
+                                                  "message": f"Bench {uuid.uuid4().hex}"}, headers=headers)
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+
+        rss = api.get("/admin/metrics", headers=auth_headers).json()["memory"]["rss"]
+        latencies.sort()
+        results.append((mongo_db.contact_submissions.estimated_document_count(), latencies[len(latencies) // 2], rss))
+
+    api.delete("/admin/test/rate-limit", headers=auth_headers)
+    for count, median, rss in results:
+        print(f"{count:>10} messages: median insert {median:.1f}ms, rss {rss / 2**20:.0f}MB")
+
+    first, last = results[0], results[-1]
+    assert last[1] < max(first[1] * 2, first[1] + 20), "Insert latency grows with collection size"
+    assert last[2] < first[2] * 1.5, "Server memory grows with collection size"
@@ -0,0 +1,85 @@
+"""
+Multi-site tests: Host-based site resolution, data isolation between sites,
+and the many-hosts benchmark from tests/bench_sites.py.
+"""
+
+import os
+import uuid
+
+import pytest
+
+from tests import bench_sites
+
+BENCH_SITES = int(os.environ.get("GYS_BENCH_SITES", "500"))
+SITE_LATENCY_BUDGET_MS = float(os.environ.get("GYS_SITE_LATENCY_BUDGET_MS", "300"))
+
+
+@pytest.mark.functional
+def test_new_site_gets_default_content(api, site):
+    _, host = site
+    content = api.get("/content", headers=host).json()
+
+    assert "hero" in content
+    assert content["siteId"] == site[0]
+
+
+@pytest.mark.functional
+def test_content_update_stays_on_its_site(api, auth_headers, site):
+    site_id, host = site
+    title = f"Titre {site_id}"
+    response = api.put("/admin/content", json={"type": "hero", "data": {"title": title}},
+                       headers={**auth_headers, **host})
+    assert response.status_code == 200
+
+    assert api.get("/content", headers=host).json()["hero"]["title"] == title
+    assert api.get("/content").json()["hero"]["title"] != title
+
+
+@pytest.mark.functional
+def test_publications_and_messages_isolated(api, auth_headers, contact_headers, site):
+    site_id, host = site
+    created = api.post("/admin/publications", json={"title": "Site only", "content": "Visible on one site.",
+                                                     "author": "Test", "status": "published"},
+                       headers={**auth_headers, **host}).json()["publication"]
+    email = f"{site_id}@example.com"
+    api.post("/contact", json={"name": "Site Test", "email": email, "message": f"Message pour {site_id}"},
+             headers={**contact_headers, **host})
+
+    assert created["id"] in [p["id"] for p in api.get("/publications", headers=host).json()]
+    assert created["id"] not in [p["id"] for p in api.get("/publications").json()]
+    assert api.get(f"/publications/{created['id']}").status_code == 404
+
+    messages = api.get("/admin/messages", headers={**auth_headers, **host}).json()
+    assert [m["email"] for m in messages] == [email]
+    assert email not in [m["email"] for m in api.get("/admin/messages", headers=auth_headers).json()]
+
+
+@pytest.mark.functional
+def test_host_already_used_rejected(api, auth_headers, site):
+    _, host = site
+    response = api.post("/admin/sites", json={"id": f"other-{uuid.uuid4().hex[:8]}", "hosts": [host["Host"]]},
+                        headers=auth_headers)
+
+    assert response.status_code == 409
+
+
+@pytest.mark.functional
+@pytest.mark.parametrize("payload", [
+    pytest.param({"id": "Bad Id", "hosts": ["a.sites.test"]}, id="bad-id"),
+    pytest.param({"id": "no-hosts", "hosts": []}, id="no-hosts"),
+    pytest.param({"id": "bad-host", "hosts": ["not a host"]}, id="bad-host"),
+])
+def test_invalid_site_rejected(api, auth_headers, payload):
+    assert api.post("/admin/sites", json=payload, headers=auth_headers).status_code == 400
+
+
+@pytest.mark.performance
+def test_many_virtual_hosts(api, auth_headers):
+    report = bench_sites.run(api, auth_headers, sites=BENCH_SITES, rounds=3)
+
+    print(f"{report['sites']} sites: p50 {report['latency_ms']['p50']}ms, p95 {report['latency_ms']['p95']}ms, "
+          f"worst site p95 {report['per_site_ms']['worst_p95']}ms, rss {report['rss_mb']}")
+    assert report["latency_ms"]["p95"] < SITE_LATENCY_BUDGET_MS
+    # Content of every site fits in memory: bounded growth per site, no runaway cache
+    assert report["rss_mb"]["per_site_kb"] < 256
+    assert report["cache"]["content"]["size"] <= report["cache"]["content"]["max"]
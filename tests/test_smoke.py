@@ -0,0 +1,60 @@
+"""
+Smoke tests: the API is up and its read-only endpoints answer.
+Ported from quick_test.py and the startup checks of pm2_fix_test.py.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.smoke
+
+
+def test_api_root_active(api):
+    response = api.get("/contact")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data.get("status") == "active"
+    assert data.get("message")
+
+
+@pytest.mark.parametrize("method", ["PUT", "DELETE"])
+def test_api_fallback_methods(api, auth_headers, method):
+    response = api.request(method, "/contact", json={}, headers=auth_headers)
+
+    assert response.status_code == 200
+
+
+def test_site_content_available(api):
+    response = api.get("/content")
+
+    assert response.status_code == 200
+    content = response.json()
+    assert content.get("hero")
+    assert content.get("services")
+
+
+def test_public_publications_available(api):
+    response = api.get("/publications")
+
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+
+def test_admin_token_verifies(api, auth_headers):
+    response = api.get("/admin/verify", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json().get("valid") is True
+
+
+def test_admin_bootstrap_payload(api, auth_headers):
+    response = api.get("/admin/bootstrap", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["user"]["role"] == "admin"
+    assert data["content"].get("hero")
+    assert data["messages"]["unread"] <= data["messages"]["total"]
+    assert len(data["messages"]["items"]) <= 100
+    assert all("ip" not in message for message in data["messages"]["items"])
+    assert isinstance(data["publications"]["items"], list)
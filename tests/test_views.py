@@ -0,0 +1,77 @@
+"""
+Publication view counter tests: write-behind batching must keep counts exact
+while bounding the number of MongoDB writes.
+"""
+
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tests.conftest import BASE_URL
+
+VIEW_BURST = int(os.environ.get("GYS_VIEW_BURST", "100000"))
+VIEW_FLUSH_INTERVAL_S = float(os.environ.get("VIEW_FLUSH_INTERVAL_MS", "5000")) / 1000
+VIEW_FLUSH_THRESHOLD = int(os.environ.get("VIEW_FLUSH_THRESHOLD", "1000"))
+CONCURRENCY = 32
+
+
+def admin_views(api, auth_headers, publication_id):
+    publications = api.get("/admin/publications", headers=auth_headers).json()
+    return next(p for p in publications if p["id"] == publication_id).get("views", 0)
+
+
+def wait_for_flush(api, auth_headers, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        metrics = api.get("/admin/metrics", headers=auth_headers).json()
+        if metrics["views"]["pending"] == 0:
+            return metrics
+        time.sleep(0.2)
+    pytest.fail(f"View counters still pending after {timeout}s")
+
+
+@pytest.mark.functional
+def test_views_counted_and_ranked(api, auth_headers, publication_factory):
+    publication = publication_factory(title="Viewed Publication", status="published")
+
+    for _ in range(3):
+        assert api.get(f"/publications/{publication['id']}").status_code == 200
+    wait_for_flush(api, auth_headers, timeout=VIEW_FLUSH_INTERVAL_S + 5)
+
+    assert admin_views(api, auth_headers, publication["id"]) == 3
+    popular = api.get("/publications/popular", params={"limit": 50}).json()
+    assert all(a["views"] >= b["views"] for a, b in zip(popular, popular[1:]))
+
+
+@pytest.mark.performance
+def test_view_burst_exact_with_bounded_writes(api, auth_headers, publication_factory):
+    publication = publication_factory(title="Burst Publication", status="published")
+    url = f"{BASE_URL}/api/publications/{publication['id']}"
+    before = wait_for_flush(api, auth_headers, timeout=VIEW_FLUSH_INTERVAL_S + 5)["views"]
+    local = threading.local()
+
+    def view(_):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        return local.session.get(url, timeout=10).status_code
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        statuses = list(pool.map(view, range(VIEW_BURST), chunksize=256))
+    elapsed = time.monotonic() - start
+    after = wait_for_flush(api, auth_headers, timeout=VIEW_FLUSH_INTERVAL_S + 10)["views"]
+
+    assert statuses.count(200) == VIEW_BURST
+    assert admin_views(api, auth_headers, publication["id"]) == VIEW_BURST
+
+    # One flush per threshold reached plus at most one timer flush per interval
+    flushes = after["flushes"] - before["flushes"]
+    max_flushes = math.ceil(VIEW_BURST / VIEW_FLUSH_THRESHOLD) + math.ceil(elapsed / VIEW_FLUSH_INTERVAL_S) + 2
+    print(f"{VIEW_BURST} views in {elapsed:.1f}s -> {flushes} bulkWrite flushes")
+    assert flushes <= max_flushes
+    assert after["failures"] == before["failures"]